@@ -53,6 +53,9 @@ class inkscapeMadeEasy(inkex.Effect):
                           'pt': resolution_in / 72.0,  # point 1pt = 1/72th of an inch
                           'px': 1.0, 'pc': resolution_in / 6.0}  # picas	1pc = 1/6th of and inch
 
+        self.latexWorker = None  # optional persistent LaTeX process. See inkscapeMadeEasy_Draw.text.startLatexWorker()
+        self.axisTemplates = None  # templates of cached axes of the current document. See inkscapeMadeEasy_Plot.axis.cartesian()
+
         self.blankSVG = """<?xml version="1.0" encoding="UTF-8" standalone="no"?>
     <svg
        xmlns:dc="http://purl.org/dc/elements/1.1/"
@@ -348,7 +351,7 @@ class inkscapeMadeEasy(inkex.Effect):
 
         This function is used to generate a valid unique ID by concatenating a given prefix with a numeric suffix. The overall format is ``prefix-%05d``.
 
-        This function makes sure the ID is unique by checking in ``doc_ids`` member. This function is specially useful for creating an unique ID for markers and other elements in defs.
+        This function makes sure the ID is unique by checking the IDs of the document. This function is specially useful for creating an unique ID for markers and other elements in defs.
 
         :param prefix_id: prefix of the ID
         :type prefix_id: string
@@ -357,6 +360,8 @@ class inkscapeMadeEasy(inkex.Effect):
 
         .. note:: This function has been adapted from inkex.py. However it uses an incremental number method
 
+        .. warning:: The ID is not reserved: it is in use only after an element with this ID is added to the document. Otherwise, the next call returns the same ID.
+
         **Example**
 
         >>> a=self.uniqueIdNumber('myName')    # a=myName-00001
@@ -366,12 +371,13 @@ class inkscapeMadeEasy(inkex.Effect):
 
 
         """
+        # the IDs are read from the document: the cache of svg.get_ids() misses elements created with etree.SubElement()
+        documentIds = set(self.svg.xpath('//@id'))
         numberID = 1
         new_id = prefix_id + '-%05d' % numberID
-        while new_id in self.get_ids():
+        while new_id in documentIds:
             numberID += 1
             new_id = prefix_id + '-%05d' % numberID
-        self.svg.get_ids().add(new_id)
 
         return new_id
 
@@ -1204,7 +1210,8 @@ class inkscapeMadeEasy(inkex.Effect):
 
             while len(dString) > 0:
                 commandType = dString[0]
-                argument = [float(x) for x in dString[1].split()]  # extracts arguments from M command and converts to float
+                # extracts arguments from the command and converts to float. Numbers may not be separated by spaces, e.g. '2.9-6.3' or '.5.5'
+                argument = [float(x) for x in re.findall(r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?', dString[1])]
                 del dString[0]
                 del dString[0]
 
@@ -1301,6 +1308,8 @@ class inkscapeMadeEasy(inkex.Effect):
             link = self.getElemAttrib(element, 'xlink:href').replace('#','')
             elemLink = self.svg.getElementById(link)
             if elemLink is not None:
+                if elemLink.tag in [inkex.addNS('path', 'svg'), 'path']:  # use pointing directly to a path, e.g. LaTeX glyphs
+                    listCoordsTemp.extend(self.getPoints(elemLink))
                 for obj in elemLink.iter():
                     if obj != elemLink:
                         listPoints = self.getPoints(obj)
@@ -25,6 +25,18 @@
 # Please uncomment (remove the # character) in the following line to disable LaTeX support via textext extension.
 # useLatex=False
 
+# LaTeX converter used by text.latex() when LaTeX support is enabled
+#   'textext': TexText extension (default)
+#   'dvisvgm': latex -> DVI -> dvisvgm --no-fonts. Glyphs are defined only once in <defs> and reused by all labels. Requires latex and dvisvgm in the PATH
+latexConverter = 'textext'
+
+# number of decimal places of the coordinates written in path data. Can be overridden in each function call with the argument 'precision'
+pathPrecision = 6
+
+# compact path data: remove trailing zeros and unnecessary separators, use relative coordinates when shorter, merge consecutive line commands.
+# Disabled by default: path data is written in the format of previous versions (fixed decimal places, absolute coordinates). Set to True for
+# smaller files
+compactPaths = False
 
 import os
 import sys
@@ -50,6 +62,15 @@ if useLatex:
 
 import tempfile
 import copy
+import subprocess
+import shutil
+import atexit
+import hashlib
+import json
+import io
+import asyncio
+import concurrent.futures
+import threading
 
 def displayMsg(msg):
     """Display a message to the user.
@@ -95,6 +116,587 @@ def Dump(obj, file='./dump_file.txt', mode='w'):
         file.write(str(obj) + '\n')
 
 
+def formatNumber(value, precision=None):
+    """Format a number to be written in svg attributes, with ``precision`` decimal places.
+
+    If ``compactPaths`` is True, trailing zeros and the leading zero are removed (e.g. 0.500000 -> .5)
+
+    .. note:: Internal function.
+    """
+    if precision is None:
+        precision = pathPrecision
+
+    numberStr = '%.*f' % (precision, value)
+    if not compactPaths:
+        return numberStr
+
+    if '.' in numberStr:
+        numberStr = numberStr.rstrip('0').rstrip('.')
+    if numberStr.startswith('0.'):
+        numberStr = numberStr[1:]
+    elif numberStr.startswith('-0.'):
+        numberStr = '-' + numberStr[2:]
+    elif numberStr == '-0':
+        numberStr = '0'
+    return numberStr
+
+
+def compactNumbers(string):
+    """Compact all numbers of a string formatted with ``%.Nf``, like formatNumber() does for a single number: trailing zeros, the leading zero
+    and the sign of negative zeros are removed (e.g. 0.500000 -> .5, -0.000000 -> 0). Integers without decimal point are not changed.
+
+    .. note:: Internal function.
+    """
+    def compact(match):
+        numberStr = match.group(0).rstrip('0').rstrip('.')
+        if numberStr in ['0', '-0']:
+            return '0'
+        return numberStr.replace('0.', '.', 1) if numberStr.lstrip('-').startswith('0.') else numberStr
+
+    # only complete numbers with decimal places: a point between digits of other text (e.g. w3.org) is not a number
+    return re.sub(r'(?<![\d.])-?\d+\.\d+(?![\d.])', compact, string)
+
+
+def compactCoords(coordsNP, precision=None):
+    """Format a numpy array of points with shape (N,2) as compact path data. Trailing zeros, leading zeros and unnecessary separators are
+    removed. Numbers are formatted with ``precision`` decimal places, like formatNumber().
+
+    .. note:: Internal function.
+    """
+    if precision is None:
+        precision = pathPrecision
+
+    string_coords = ' ' + (('%%.%df,%%.%df ' % (precision, precision)) * len(coordsNP)) % tuple(coordsNP.ravel().tolist())
+
+    # same result of compactNumbers(), faster since all numbers are followed by ' ' or ','
+    if precision > 0:
+        string_coords = re.sub(r'0+(?=[ ,])', '', string_coords).replace('. ', ' ').replace('.,', ',')  # trailing zeros and decimal points
+    for old, new in [['-0 ', '0 '], ['-0,', '0,'], [' 0.', ' .'], [',0.', ',.'], ['-0.', '-.'], [' -', '-'], [',-', '-']]:
+        string_coords = string_coords.replace(old, new)
+    return string_coords.strip()
+
+
+def pathData(commands, precision=None):
+    """Build the path data of a list of commands with absolute coordinates.
+
+    :param commands: list of commands in the form [letter, arguments]. Letters: ``M``, ``L``, ``C``, ``A`` and ``Z``, with the arguments
+            defined in the svg standard, in absolute coordinates. Each ``M`` or ``L`` command must have one point only.
+    :param precision: Number of decimal places. Default: None (uses ``pathPrecision``, defined at the beginning of this module)
+
+    :type commands: list
+    :type precision: int
+
+    :returns: path data
+    :rtype: string
+
+    If ``compactPaths`` (defined at the beginning of this module) is True, the path data is compacted:
+
+        - trailing zeros and unnecessary separators are removed
+        - each command is written in relative coordinates if this is shorter
+        - horizontal and vertical lines are written with ``H`` and ``V``
+        - repeated command letters are omitted, merging consecutive line commands
+
+    .. note:: Internal function.
+    """
+    if precision is None:
+        precision = pathPrecision
+
+    def roundPoints(args, letter):
+        if letter == 'A':
+            return [float(a) for a in args[:3]] + [int(args[3]), int(args[4])] + [round(a, precision) for a in args[5:]]
+        return [round(a, precision) for a in args]
+
+    if not compactPaths:
+        string_coords = []
+        for letter, args in commands:
+            args = roundPoints(args, letter)
+            if letter == 'A':
+                string_coords.append('A %s,%s %s %d %d %s,%s' % tuple([formatNumber(a, precision) for a in args[:3]] + args[3:5] +
+                                                                     [formatNumber(a, precision) for a in args[5:]]))
+            else:
+                string_coords.append(' '.join([letter] + [formatNumber(args[i], precision) + ',' + formatNumber(args[i + 1], precision) for i in
+                                                          range(0, len(args), 2)]))
+        return ' '.join(string_coords)
+
+    def joinNumbers(lastNumber, numbers):
+        # separators are necessary only if the next number could be merged with the previous one
+        string = ''
+        for number in numbers:
+            if lastNumber is not None and not number.startswith('-') and not (number.startswith('.') and '.' in lastNumber):
+                string += ' '
+            string += number
+            lastNumber = number
+        return string, lastNumber
+
+    tokens = []
+    lastNumber = None
+    implicitCommand = None
+    current = [0.0, 0.0]
+    subpathStart = [0.0, 0.0]
+    for letter, args in commands:
+        if letter in 'Zz':
+            tokens.append('z')
+            lastNumber = None
+            implicitCommand = None
+            current = subpathStart
+            continue
+
+        absArgs = roundPoints(args, letter)
+        relArgs = list(absArgs)
+        if letter == 'A':
+            relArgs[5] = absArgs[5] - current[0]
+            relArgs[6] = absArgs[6] - current[1]
+        else:
+            for i in range(0, len(absArgs), 2):
+                relArgs[i] = absArgs[i] - current[0]
+                relArgs[i + 1] = absArgs[i + 1] - current[1]
+
+        if letter == 'L' and absArgs[1] == current[1]:
+            options = [['H', absArgs[:1]], ['h', relArgs[:1]]]
+        elif letter == 'L' and absArgs[0] == current[0]:
+            options = [['V', absArgs[1:]], ['v', relArgs[1:]]]
+        elif letter == 'M' and tokens and tokens[-1] == 'z':
+            options = [['M', absArgs]]  # some parsers do not move the current point back to the beginning of the subpath after 'z'
+        else:
+            options = [[letter, absArgs], [letter.lower(), relArgs]]
+
+        candidates = []
+        for newLetter, newArgs in options:
+            numbers = ['%d' % a if (letter == 'A' and i in [3, 4]) else formatNumber(a, precision) for i, a in enumerate(newArgs)]
+            if newLetter == implicitCommand:  # repeated command letters can be omitted
+                [string, newLastNumber] = joinNumbers(lastNumber, numbers)
+            else:
+                [string, newLastNumber] = joinNumbers(None, numbers)
+                string = newLetter + string
+            candidates.append([string, newLetter, newLastNumber])
+
+        [string, newLetter, lastNumber] = min(candidates, key=lambda c: len(c[0]))
+        tokens.append(string)
+
+        implicitCommand = {'M': 'L', 'm': 'l'}.get(newLetter, newLetter)
+        current = absArgs[-2:]
+        if letter == 'M':
+            subpathStart = current
+
+    return ''.join(tokens)
+
+
+def coordsArray(coordsList):
+    """Convert a list of points [[x1,y1], ..., [xN,yN]] to a numpy array with shape (N,2). Iterators, like the ones returned by zip(), are also
+    accepted.
+
+    .. note:: Internal function.
+    """
+    if not isinstance(coordsList, (np.ndarray, list, tuple)):
+        coordsList = list(coordsList)
+    return np.asarray(coordsList, dtype=float).reshape(-1, 2)
+
+
+def validRanges(coordsNP):
+    """Return the ranges [start, end] of the rows of a numpy array with shape (N,2) with consecutive valid points. Rows with NaN separate the
+    ranges.
+
+    .. note:: Internal function.
+    """
+    if len(coordsNP) == 0:
+        return []
+    invalid = np.isnan(coordsNP).any(axis=1)
+    boundaries = np.concatenate(([0], np.flatnonzero(np.diff(invalid)) + 1, [len(coordsNP)])).tolist()
+    return [[start, end] for start, end in zip(boundaries[:-1], boundaries[1:]) if not invalid[start]]
+
+
+def formatCoords(coordsList, offset=[0, 0], precision=None):
+    """Format a list of points as path data, in the form ``x1,y1 x2,y2 ... xN,yN``, adding an offset to all points.
+
+    :param coordsList: List with coords x and y. ex: [[x1,y1], ..., [xN,yN]]. Numpy arrays with shape (N,2) are also accepted.
+    :param offset: Offset coords. Default [0,0]
+    :param precision: Number of decimal places. Default: None (uses ``pathPrecision``, defined at the beginning of this module)
+
+    :type coordsList: list of list or numpy array
+    :type offset: list
+    :type precision: int
+
+    :returns: path data
+    :rtype: string
+
+    .. note:: Internal function.
+    """
+    if precision is None:
+        precision = pathPrecision
+
+    coordsNP = coordsArray(coordsList) + np.asarray(offset, dtype=float)
+
+    return (('%%.%df,%%.%df ' % (precision, precision)) * len(coordsNP))[:-1] % tuple(coordsNP.ravel().tolist())
+
+
+def relativeIsShorter(coordsNP, distancesNP, precision=None):
+    """Check whether path data in relative coordinates is shorter than in absolute coordinates. For long paths, only a sample of the points
+    is compared.
+
+    .. note:: Internal function.
+    """
+    if len(coordsNP) > 2000:
+        sample = np.linspace(0, len(coordsNP) - 1, 1000).astype(int)
+        coordsNP = coordsNP[sample]
+        distancesNP = distancesNP[sample]
+    return len(compactCoords(distancesNP, precision)) < len(compactCoords(coordsNP, precision))
+
+
+def bezierData(nodes, cPbefore, cPafter, precision=None, closePath=False):
+    """Build the path data of a cubic bezier path given numpy arrays with shape (N,2) of nodes and control points, in absolute coordinates.
+
+    If ``compactPaths`` (defined at the beginning of this module) is True, numbers are compacted and the segments are written in relative
+    coordinates if this is shorter.
+
+    .. note:: Internal function.
+    """
+    if precision is None:
+        precision = pathPrecision
+
+    if closePath:
+        startPoints = nodes
+        segments = np.stack((cPafter, np.roll(cPbefore, -1, axis=0), np.roll(nodes, -1, axis=0)), axis=1)
+    else:
+        startPoints = nodes[:-1]
+        segments = np.stack((cPafter[:-1], cPbefore[1:], nodes[1:]), axis=1)
+
+    if not compactPaths:
+        string_coords = 'M ' + formatCoords(nodes[:1], precision=precision)
+        if len(segments) > 0:
+            string_coords += ' C ' + formatCoords(segments.reshape(-1, 2), precision=precision)
+        if closePath:
+            string_coords += ' Z'
+        return string_coords
+
+    # coordinates are rounded before computing distances, so that the relative path does not accumulate rounding errors
+    segments = np.round(segments, precision)
+    distances = np.round(segments - np.round(startPoints, precision)[:, np.newaxis, :], precision)
+
+    string_coords = 'M' + compactCoords(nodes[:1], precision)
+    if len(segments) > 0:
+        if relativeIsShorter(segments.reshape(-1, 2), distances.reshape(-1, 2), precision):
+            string_coords += 'c' + compactCoords(distances.reshape(-1, 2), precision)
+        else:
+            string_coords += 'C' + compactCoords(segments.reshape(-1, 2), precision)
+    if closePath:
+        string_coords += 'z'
+    return string_coords
+
+
+def unitVector(vector):
+    """Return the unit vector with the same direction of a vector. Null vectors are returned unchanged.
+
+    .. note:: Internal function.
+    """
+    norm = np.hypot(vector[0], vector[1])
+    if norm == 0:
+        return vector
+    return vector / norm
+
+
+def bezierPoints(controlPoints, u):
+    """Compute the points of a cubic bezier segment, defined by an array of control points with shape (4,2), at parameters u in [0,1].
+
+    .. note:: Internal function.
+    """
+    u = u[:, np.newaxis]
+    v = 1.0 - u
+    return v ** 3 * controlPoints[0] + 3 * v ** 2 * u * controlPoints[1] + 3 * v * u ** 2 * controlPoints[2] + u ** 3 * controlPoints[3]
+
+
+def fitBezierSegment(points, u, tangentStart, tangentEnd):
+    """Least squares fit of a single cubic bezier segment to a set of points, given the parameters u of the points and the unit tangent
+    vectors at both ends. Only the lengths of the tangents are adjusted.
+
+    .. note:: Internal function.
+    """
+    start = points[0]
+    end = points[-1]
+    v = 1.0 - u
+    B1 = 3 * v ** 2 * u
+    B2 = 3 * v * u ** 2
+    A1 = B1[:, np.newaxis] * tangentStart
+    A2 = B2[:, np.newaxis] * tangentEnd
+    residue = points - np.outer(v ** 3 + B1, start) - np.outer(B2 + u ** 3, end)
+
+    C00 = np.sum(A1 * A1)
+    C01 = np.sum(A1 * A2)
+    C11 = np.sum(A2 * A2)
+    X0 = np.sum(A1 * residue)
+    X1 = np.sum(A2 * residue)
+
+    chord = np.hypot(*(end - start))
+    det = C00 * C11 - C01 * C01
+    if det != 0:
+        alphaStart = (X0 * C11 - X1 * C01) / det
+        alphaEnd = (C00 * X1 - C01 * X0) / det
+    else:
+        alphaStart = alphaEnd = 0.0
+
+    # degenerated solutions are replaced by the usual heuristic
+    if alphaStart < 1e-6 * chord or alphaEnd < 1e-6 * chord:
+        alphaStart = alphaEnd = chord / 3.0
+
+    return np.array([start, start + alphaStart * tangentStart, end + alphaEnd * tangentEnd, end])
+
+
+def reparameterizeBezier(controlPoints, points, u):
+    """Improve the parameters u of the points with one Newton-Raphson iteration, searching the closest points of the bezier segment.
+
+    .. note:: Internal function.
+    """
+    Q = bezierPoints(controlPoints, u)
+    derivative1 = 3 * np.diff(controlPoints, axis=0)
+    derivative2 = 2 * np.diff(derivative1, axis=0)
+    uCol = u[:, np.newaxis]
+    Q1 = (1 - uCol) ** 2 * derivative1[0] + 2 * (1 - uCol) * uCol * derivative1[1] + uCol ** 2 * derivative1[2]
+    Q2 = (1 - uCol) * derivative2[0] + uCol * derivative2[1]
+
+    numerator = np.sum((Q - points) * Q1, axis=1)
+    denominator = np.sum(Q1 * Q1 + (Q - points) * Q2, axis=1)
+    step = np.divide(numerator, denominator, out=np.zeros_like(numerator), where=denominator != 0)
+    return np.clip(u - step, 0.0, 1.0)
+
+
+def fitCubicBezier(coordsList, tolerance, closePath=False):
+    """Fit a smooth sequence of cubic bezier segments to a polyline, using Philip J. Schneider's algorithm (Graphics Gems, 1990).
+
+    Each segment is fitted by least squares. If the distance between the curve and any point is larger than the tolerance, the points are split
+    at the point with the largest error and each half is fitted again. Segments are joined with continuous tangents.
+
+    :param coordsList: points of the polyline [[x1,y1], ..., [xN,yN]] or numpy array with shape (N,2). Rows with NaN separate subpaths, fitted
+        separately
+    :param tolerance: maximum distance between the curve and the points
+    :param closePath: the polyline is closed. Default: False
+
+    :returns: [nodes, cPbefore, cPafter, nodeTypes]. See :meth:`cubicBezier.fromArrays`
+    :rtype: list
+
+    .. note:: Internal function.
+    """
+    points = coordsArray(coordsList)
+
+    # subpaths separated by rows with NaN are fitted separately. The results are also separated by rows with NaN
+    if np.any(np.isnan(points)):
+        separator = [np.full((1, 2), np.nan)] * 3 + ['c']
+        pieces = []
+        for [start, end] in validRanges(points):
+            pieces.append(separator)
+            pieces.append(fitCubicBezier(points[start:end], tolerance, closePath))
+        if not pieces:
+            return [np.zeros((0, 2))] * 3 + ['']
+        return [np.vstack([piece[i] for piece in pieces[1:]]) for i in range(3)] + [''.join([piece[3] for piece in pieces[1:]])]
+
+    # repeated points are removed. They have no tangent
+    if len(points) > 1:
+        points = points[np.concatenate(([True], np.any(np.diff(points, axis=0) != 0, axis=1)))]
+    if closePath and len(points) > 2:
+        if np.all(points[0] == points[-1]):
+            points = points[:-1]
+        points = np.vstack((points, points[:1]))
+
+    if len(points) < 2:
+        return [points, points.copy(), points.copy(), 'c' * len(points)]
+
+    if closePath and len(points) > 3:
+        tangentStart = unitVector(points[1] - points[-2])
+        tangentEnd = -tangentStart
+    else:
+        tangentStart = unitVector(points[1] - points[0])
+        tangentEnd = unitVector(points[-2] - points[-1])
+
+    toleranceSquared = tolerance ** 2
+    segments = []
+    # pending pieces of the polyline, as [first index, last index, tangentStart, tangentEnd]. Pieces are popped from left to right
+    stack = [[0, len(points) - 1, tangentStart, tangentEnd]]
+    while stack:
+        [first, last, tangentStart, tangentEnd] = stack.pop()
+        piece = points[first:last + 1]
+
+        if len(piece) == 2:
+            distance = np.hypot(*(piece[1] - piece[0])) / 3.0
+            segments.append(np.array([piece[0], piece[0] + distance * tangentStart, piece[1] + distance * tangentEnd, piece[1]]))
+            continue
+
+        # chord length parameterization
+        u = np.concatenate(([0.0], np.cumsum(np.hypot(*np.diff(piece, axis=0).T))))
+        u = u / u[-1]
+
+        controlPoints = fitBezierSegment(piece, u, tangentStart, tangentEnd)
+        errors = np.sum((bezierPoints(controlPoints, u) - piece) ** 2, axis=1)
+        maxError = np.max(errors)
+
+        # if the fitting is close, tries to improve the parameterization before splitting
+        iteration = 0
+        while toleranceSquared < maxError < 4 * toleranceSquared and iteration < 4:
+            u = reparameterizeBezier(controlPoints, piece, u)
+            controlPoints = fitBezierSegment(piece, u, tangentStart, tangentEnd)
+            errors = np.sum((bezierPoints(controlPoints, u) - piece) ** 2, axis=1)
+            maxError = np.max(errors)
+            iteration += 1
+
+        if maxError <= toleranceSquared:
+            segments.append(controlPoints)
+            continue
+
+        split = first + 1 + int(np.argmax(errors[1:-1]))
+        tangentCenter = unitVector(points[split - 1] - points[split + 1])
+        stack.append([split, last, -tangentCenter, tangentEnd])
+        stack.append([first, split, tangentStart, tangentCenter])
+
+    segments = np.array(segments)
+    nodes = np.vstack((segments[:, 0], segments[-1:, 3]))
+    cPbefore = np.vstack((segments[:1, 0], segments[:, 2]))
+    cPafter = np.vstack((segments[:, 1], segments[-1:, 3]))
+    nodeTypes = 'c' + 's' * (len(segments) - 1) + 'c'
+
+    if closePath and len(nodes) > 2:
+        # the last node coincides with the first one
+        cPbefore[0] = cPbefore[-1]
+        nodeTypes = 's' + nodeTypes[1:-1]
+        return [nodes[:-1], cPbefore[:-1], cPafter[:-1], nodeTypes]
+
+    return [nodes, cPbefore, cPafter, nodeTypes]
+
+
+def simplifyPolyline(coordsList, tolerance):
+    """Simplify a polyline with Ramer-Douglas-Peucker algorithm, removing points closer than the tolerance to the simplified polyline.
+
+    All segments of the same recursion level are processed at once: the distances of all remaining points to the chords of their segments are
+    computed in a single numpy operation, and each segment is split at its farthest point, if farther than the tolerance. The first and last
+    points are always kept.
+
+    :param coordsList: points of the polyline [[x1,y1], ..., [xN,yN]] or numpy array with shape (N,2). Rows with NaN separate subpaths, simplified
+        separately
+    :param tolerance: maximum distance between the removed points and the simplified polyline
+
+    :returns: simplified polyline
+    :rtype: numpy array with shape (M,2)
+
+    .. note:: Internal function.
+    """
+    points = coordsArray(coordsList)
+
+    # subpaths separated by rows with NaN are simplified separately
+    if np.any(np.isnan(points)):
+        separator = np.full((1, 2), np.nan)
+        pieces = []
+        for [start, end] in validRanges(points):
+            pieces.extend([separator, simplifyPolyline(points[start:end], tolerance)])
+        return np.vstack(pieces[1:] or [np.zeros((0, 2))])
+
+    if len(points) < 3:
+        return points
+
+    keep = np.zeros(len(points), dtype=bool)
+    keep[[0, -1]] = True
+    candidates = np.arange(1, len(points) - 1)
+    while len(candidates) > 0:
+        kept = np.flatnonzero(keep)
+        segment = np.searchsorted(kept, candidates) - 1
+        start = points[kept[segment]]
+        chord = points[kept[segment + 1]] - start
+        vector = points[candidates] - start
+
+        # distance to the chord line. Closed segments use the distance to their end point
+        chordLength = np.hypot(chord[:, 0], chord[:, 1])
+        distance = np.abs(vector[:, 0] * chord[:, 1] - vector[:, 1] * chord[:, 0])
+        distance = np.where(chordLength > 0, distance / np.where(chordLength > 0, chordLength, 1.0), np.hypot(vector[:, 0], vector[:, 1]))
+
+        # farthest point of each segment
+        groupStart = np.flatnonzero(np.concatenate(([True], np.diff(segment) != 0)))
+        groupSize = np.diff(np.append(groupStart, len(candidates)))
+        maxDistance = np.maximum.reduceat(distance, groupStart)
+        farthest = np.minimum.reduceat(np.where(distance == np.repeat(maxDistance, groupSize), np.arange(len(candidates)), len(candidates)),
+                                       groupStart)
+
+        split = maxDistance > tolerance
+        if not np.any(split):
+            break
+        keep[candidates[farthest[split]]] = True
+
+        # only the points of the segments that were split remain as candidates
+        remaining = np.repeat(split, groupSize)
+        remaining[farthest[split]] = False
+        candidates = candidates[remaining]
+
+    return points[keep]
+
+
+def polylineData(coordsList, offset=[0, 0], precision=None, closePath=False, relative=False):
+    """Build the path data of a polyline.
+
+    If ``compactPaths`` (defined at the beginning of this module) is True, numbers are compacted and the path is written in relative coordinates if
+    this is shorter.
+
+    In absolute coordinates, rows with NaN split the polyline in subpaths, all in the same path data.
+
+    :param coordsList: List of points [[x1,y1], ..., [xN,yN]] or numpy array with shape (N,2)
+    :param offset: Offset coords. Default [0,0]
+    :param precision: Number of decimal places. Default: None (uses ``pathPrecision``)
+    :param closePath: Connects the first point to the last of each subpath. Default: False
+    :param relative: coordsList contains distances between points (see :meth:`line.relCoords`) instead of absolute coordinates. Default: False
+
+    .. note:: Internal function.
+    """
+    if precision is None:
+        precision = pathPrecision
+
+    coordsNP = coordsArray(coordsList)
+    # index of the first point of each subpath
+    subpathStart = np.array([0])
+    if relative:
+        coordsNP = np.vstack((np.reshape(offset, (1, 2)), coordsNP))
+    else:
+        coordsNP = coordsNP + np.asarray(offset, dtype=float)
+        invalid = np.isnan(coordsNP).any(axis=1)
+        if np.any(invalid):
+            subpathStart = np.cumsum([0] + [end - start for [start, end] in validRanges(coordsNP)])[:-1]
+            coordsNP = coordsNP[~invalid]
+
+    if len(coordsNP) == 0:
+        return ''
+
+    if not compactPaths:
+        if relative:
+            command = 'm '
+        else:
+            command = 'M '
+        subpaths = [command + formatCoords(coords, precision=precision) for coords in np.split(coordsNP, subpathStart[1:])]
+        if closePath:
+            return ' Z '.join(subpaths) + ' Z'
+        return ' '.join(subpaths)
+
+    if relative:
+        coordsNP = np.cumsum(coordsNP, axis=0)
+
+    # coordinates are rounded before computing distances, so that the relative path does not accumulate rounding errors
+    coordsNP = np.round(coordsNP, precision)
+    distancesNP = np.round(np.vstack((coordsNP[:1], np.diff(coordsNP, axis=0))), precision)
+
+    if closePath:
+        closeCommand = 'z'
+    else:
+        closeCommand = ''
+
+    if not relativeIsShorter(coordsNP, distancesNP, precision):
+        return ''.join(['M' + compactCoords(coords, precision) + closeCommand for coords in np.split(coordsNP, subpathStart[1:])])
+
+    subpaths = np.split(distancesNP, subpathStart[1:])
+    if not closePath:
+        return ''.join(['m' + compactCoords(coords, precision) for coords in subpaths])
+
+    # some parsers do not move the current point back to the beginning of the subpath after 'z', therefore the following subpaths start with an
+    # absolute 'M', like in pathData()
+    string_coords = 'm' + compactCoords(subpaths[0], precision) + 'z'
+    for start, coords in zip(subpathStart[1:], subpaths[1:]):
+        string_coords += 'M' + compactCoords(coordsNP[start:start + 1], precision)
+        if len(coords) > 1:
+            string_coords += 'l' + compactCoords(coords[1:], precision)
+        string_coords += 'z'
+    return string_coords
+
+
 def circle3Points(P1, P2, P3):
     """Find the center and radius of a circle based on 3 points on the circle.
 
@@ -653,7 +1255,8 @@ class marker():
         >>> myLineStyle = inkDraw.lineStyle.set(1.0, markerEnd=myMarker,lineColor=inkDraw.color.defined('black'))  # see lineStyle class for further information on this function
         """
 
-        markerPath = 'M -2.5,-1.0 C -2.5,1.7600000 -4.7400000,4.0 -7.5,4.0 C -10.260000,4.0 -12.5,1.7600000 -12.5,-1.0 C -12.5,-3.7600000 -10.260000,-6.0 -7.5,-6.0 C -4.7400000,-6.0 -2.5,-3.7600000 -2.5,-1.0 z '
+        markerPath = pathData([['M', [-2.5, -1.0]], ['C', [-2.5, 1.76, -4.74, 4.0, -7.5, 4.0]], ['C', [-10.26, 4.0, -12.5, 1.76, -12.5, -1.0]],
+                               ['C', [-12.5, -3.76, -10.26, -6.0, -7.5, -6.0]], ['C', [-4.74, -6.0, -2.5, -3.76, -2.5, -1.0]], ['Z', []]])
         width = 1.0
         markerTransform = 'scale(' + str(scale) + ') translate(7.4, 1)'
         return marker.createMarker(ExtensionBaseObj, nameID, markerPath, RenameMode, strokeColor, fillColor, width, markerTransform)
@@ -693,7 +1296,7 @@ class marker():
         >>> myLineStyle = inkDraw.lineStyle.set(1.0, markerEnd=myMarker,lineColor=inkDraw.color.defined('black'))  # see lineStyle class for further information on this function
         """
 
-        markerPath = 'M -4,4 L 4,-4 M 4,4 L -4,-4'
+        markerPath = pathData([['M', [-4, 4]], ['L', [4, -4]], ['M', [4, 4]], ['L', [-4, -4]]])
         markerTransform = 'scale(' + str(scale) + ')'
         width = 1.0
         return marker.createMarker(ExtensionBaseObj, nameID, markerPath, RenameMode, strokeColor, None, width, markerTransform)
@@ -749,7 +1352,7 @@ class marker():
         translation = 10.17 * scale + 4.75
         width = 1.0
 
-        markerPath = 'M 0.0,0.0 L 5.0,-5.0 L -12.5,0.0 L 5.0,5.0 L 0.0,0.0 z '
+        markerPath = pathData([['M', [0.0, 0.0]], ['L', [5.0, -5.0]], ['L', [-12.5, 0.0]], ['L', [5.0, 5.0]], ['L', [0.0, 0.0]], ['Z', []]])
         markerTransform = 'scale(' + str(scale) + ') rotate(0) translate(' + str(translation) + ',0)'
         nameStart = marker.createMarker(ExtensionBaseObj, nameID + 'Start', markerPath, RenameMode, strokeColor, fillColor, width, markerTransform)
         markerTransform = 'scale(' + str(scale) + ') rotate(180) translate(' + str(translation) + ',0)'
@@ -797,16 +1400,16 @@ class marker():
         """
 
         # build path for 3 circles
-        markerPath = ''
+        commands = []
         radius = scale / 2.0
 
         for i in range(3):
+            commands.append(['M', [i * 2 + radius, 0]])
+            commands.append(['A', [radius, radius, 0, 1, 1, i * 2 - radius, 0]])
+            commands.append(['A', [radius, radius, 0, 1, 1, i * 2 + radius, 0]])
+            commands.append(['Z', []])
 
-            prefix = 'M %f %f ' % (i * 2 + radius, 0)
-            arcStringA = 'a %f %f 0 1 1 %f %f ' % (radius, radius, -2 * radius, 0)
-            arcStringB = 'a %f %f 0 1 1 %f %f ' % (radius, radius, 2 * radius, 0)
-
-            markerPath = markerPath + prefix + arcStringA + arcStringB + 'z '
+        markerPath = pathData(commands)
 
         if scale != 1.0:
             markerTransform = 'translate(' + str(-6.0 * scale) + ', 0) scale(' + str(scale) + ')'
@@ -1188,6 +1791,561 @@ class textStyle():
         return textStyle.set(fontSize, justification, textColor)
 
 
+def glyphId(elem):
+    """Return an id for a glyph definition, based on the hash of its contents. Identical glyphs receive the same id.
+
+    .. note:: Internal function.
+    """
+    if elem.tag == inkex.addNS('path', 'svg'):
+        contents = elem.get('d').encode('utf-8')
+    else:
+        contents = etree.tostring(elem, method='c14n', exclusive=True)
+    return 'latexGlyph-' + hashlib.sha1(contents).hexdigest()[:16]
+
+
+def dvisvgmToGroup(ExtensionBaseObj, svgData):
+    """Convert the output of ``dvisvgm --no-fonts`` into a detached group of elements.
+
+    The glyph definitions are moved to the <defs> of the document. Each glyph receives an id computed from the hash of its contents, therefore
+    glyphs shared by several labels are defined only once in the document.
+
+    .. note:: Internal function.
+    """
+    svgRoot = etree.fromstring(svgData, parser=etree.XMLParser(huge_tree=True))
+
+    defs = ExtensionBaseObj.getDefinitions()
+    existingIds = set(defs.xpath('./*/@id'))
+
+    newIds = {}
+    groupLatex = etree.Element(inkex.addNS('g', 'svg'))
+    for child in list(svgRoot):
+        if child.tag == inkex.addNS('defs', 'svg'):
+            for elem in list(child):
+                oldId = elem.attrib.pop('id', None)
+                newId = glyphId(elem)
+                newIds[oldId] = newId
+                if newId not in existingIds:
+                    elem.set('id', newId)
+                    defs.append(elem)
+                    existingIds.add(newId)
+        elif child.tag != inkex.addNS('title', 'svg'):
+            groupLatex.append(child)
+
+    # fix references to the glyphs. Other ids (e.g. page1) are removed to avoid clashes between labels
+    for elem in groupLatex.iter():
+        elem.attrib.pop('id', None)
+        for attrib in [inkex.addNS('href', 'xlink'), 'href']:
+            link = elem.get(attrib)
+            if link is not None and link[1:] in newIds:
+                elem.set(attrib, '#' + newIds[link[1:]])
+
+    return groupLatex
+
+
+def latexDocumentHeader(preambleFile):
+    """Return the beginning of the LaTeX document, up to ``\\begin{document}``, in the same format used by TexText.
+
+    .. note:: Internal function.
+    """
+    with open(preambleFile, 'r') as f:
+        preamble = f.read()
+
+    return '\\documentclass[landscape,a0]{article}\n%s\n\\pagestyle{empty}\n\\begin{document}\n\\noindent\n' % preamble
+
+
+# scratch directory of the session, containing the working directories of dvisvgm and of the persistent worker, and the parsed blank document used
+# by TexText. See sessionDirectory() and renderLatexData()
+sessionDir = None
+blankDocument = None
+
+
+# background thread used by text.latexAsync(). See latexExecutor()
+latexThread = None
+
+# serializes all LaTeX conversions, synchronous (text.latex) and asynchronous (text.latexAsync). TexText changes the working directory of the
+# process and the persistent worker serves one text at a time.
+latexLock = threading.RLock()
+
+
+def latexExecutor():
+    """Return the executor used by :meth:`text.latexAsync`, creating it in the first call.
+
+    The executor has one thread only, therefore asynchronous texts are rendered in the same order of the calls. Conversions running in the
+    executor and in the main thread are serialized by ``latexLock``.
+
+    .. note:: Internal function.
+    """
+    global latexThread
+    if latexThread is None:
+        latexThread = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='inkscapeMadeEasy_latex')
+    return latexThread
+
+
+def sessionDirectory():
+    """Return the scratch directory of the session, creating it in the first call. The directory and all its contents are removed when python exits.
+
+    .. note:: Internal function.
+    """
+    global sessionDir
+    if sessionDir is None or not os.path.isdir(sessionDir):
+        sessionDir = tempfile.mkdtemp(prefix='inkscapeMadeEasy_')
+        atexit.register(shutil.rmtree, sessionDir, ignore_errors=True)
+    return sessionDir
+
+
+def dviToSvg(dviFile, dvisvgmCommand='dvisvgm', timeout=30, quiet=False):
+    """Convert the first page of a DVI file to svg with dvisvgm. Glyphs are converted to paths.
+
+    Returns the svg data or ``None`` if dvisvgm failed. Errors are not displayed if quiet=True.
+
+    .. note:: Internal function.
+    """
+    try:
+        return subprocess.run([dvisvgmCommand, '--no-fonts', '--exact-bbox', '--stdout', os.path.basename(dviFile)], cwd=os.path.dirname(dviFile),
+                              stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True, timeout=timeout).stdout
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+        if not quiet:
+            displayMsg('Error: dvisvgm failed to convert \'%s\'' % dviFile)
+        return None
+
+
+def dvisvgmRender(LaTeXtext, preambleFile, latexCommand='latex', dvisvgmCommand='dvisvgm', timeout=30, quiet=False):
+    """Render LaTeX contents with one run of latex followed by dvisvgm.
+
+    Returns the svg data or ``None`` if latex or dvisvgm failed. Errors are not displayed if quiet=True.
+
+    .. note:: Internal function.
+    """
+    # each call has its own directory, therefore simultaneous calls do not overwrite the files of each other
+    workDir = None
+    try:
+        workDir = tempfile.mkdtemp(prefix='dvisvgm_', dir=sessionDirectory())
+        with open(os.path.join(workDir, 'snippet.tex'), 'w') as f:
+            f.write(latexDocumentHeader(preambleFile) + LaTeXtext + '\n\\end{document}\n')
+
+        subprocess.run([latexCommand, '-interaction=nonstopmode', '-halt-on-error', 'snippet.tex'], cwd=workDir, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, check=True, timeout=timeout)
+
+        return dviToSvg(os.path.join(workDir, 'snippet.dvi'), dvisvgmCommand, timeout, quiet)
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError):
+        if not quiet:
+            displayMsg('Error: LaTeX failed to render \'%s\'' % LaTeXtext)
+        return None
+    finally:
+        if workDir is not None:
+            shutil.rmtree(workDir, ignore_errors=True)
+
+
+# glyph tables of numeric labels, indexed by the hash of the preamble. See renderNumericLabel()
+numericGlyphTables = {}
+
+# numeric labels accepted by renderNumericLabel(): numbers (group 1) and powers of 10 (group 2)
+numericLabelPattern = re.compile(r'^\$(?:(-?\d*\.?\d+)|10\^\{(-?\d*\.?\d+)\})\$$')
+
+
+def numericGlyphTable(ExtensionBaseObj, preambleFile):
+    """Return the table of glyph outlines used to compose numeric labels without running LaTeX.
+
+    The table is produced only once by LaTeX+dvisvgm, rendering all glyphs of the subset and a capital 'F', and stored in
+    ``~/.cache/inkscapeMadeEasy``. The outlines, advance widths and superscript offsets are read from the output of dvisvgm, therefore labels
+    composed with this table are identical to the ones rendered by LaTeX.
+
+    Returns ``None`` if the table could not be generated, e.g. if latex or dvisvgm are not installed. No error message is displayed in this case,
+    since the labels are rendered by the regular LaTeX converter (tick labels of inkscapeMadeEasy_Plot always request fastNumbers).
+
+    .. note:: Internal function.
+    """
+    with open(preambleFile, 'rb') as f:
+        preambleHash = hashlib.sha1(f.read()).hexdigest()[:16]
+
+    if preambleHash in numericGlyphTables:
+        return numericGlyphTables[preambleHash]
+
+    cacheFile = os.path.join(os.path.expanduser('~'), '.cache', 'inkscapeMadeEasy', 'numericGlyphs_%s.json' % preambleHash)
+    try:
+        with open(cacheFile, 'r') as f:
+            table = json.load(f)
+        if 'capitalHeight' in table:  # tables cached by previous versions are created again
+            numericGlyphTables[preambleHash] = table
+            return table
+    except (OSError, ValueError):
+        pass
+
+    if activeLatexWorker(ExtensionBaseObj, preambleFile) is None and (shutil.which('latex') is None or shutil.which('dvisvgm') is None):
+        numericGlyphTables[preambleHash] = None
+        return None
+
+    with latexLock:
+        return createNumericGlyphTable(ExtensionBaseObj, preambleFile, preambleHash, cacheFile)
+
+
+def createNumericGlyphTable(ExtensionBaseObj, preambleFile, preambleHash, cacheFile):
+    """Render the glyphs of numeric labels with LaTeX+dvisvgm and save the table. See numericGlyphTable()
+
+    .. note:: Internal function.
+    """
+    if preambleHash in numericGlyphTables:  # created by other thread while this one was waiting for latexLock
+        return numericGlyphTables[preambleHash]
+
+    table = None
+    worker = activeLatexWorker(ExtensionBaseObj, preambleFile)
+    calibrationChars = '-.01234567890'
+    uses = []
+    glyphPaths = {}
+    for calibrationText in ['$' + calibrationChars + '$', '$10^{' + calibrationChars + '}$', 'F']:
+        if worker is not None:
+            svgData = worker.render(calibrationText, quiet=True)
+        else:
+            svgData = dvisvgmRender(calibrationText, preambleFile, quiet=True)
+        if svgData is None:
+            break
+
+        svgRoot = etree.fromstring(svgData)
+        for elem in svgRoot.iter(inkex.addNS('path', 'svg')):
+            if elem.get('id') is not None:
+                glyphPaths[elem.get('id')] = elem.get('d')
+        uses.append([[float(elem.get('x', 0)), float(elem.get('y', 0)), (elem.get(inkex.addNS('href', 'xlink')) or elem.get('href'))[1:]] for elem in
+                     svgRoot.iter(inkex.addNS('use', 'svg'))])
+    else:
+        if len(uses[0]) == len(calibrationChars) and len(uses[1]) == len(calibrationChars) + 2 and len(uses[2]) == 1:
+            table = {'normal': {}, 'script': {}}
+            for size, listUses in [['normal', uses[0]], ['script', uses[1][2:]]]:
+                for i, char in enumerate(calibrationChars[:-1]):
+                    d = glyphPaths[listUses[i][2]]
+                    table[size][char] = {'id': glyphId(etree.Element(inkex.addNS('path', 'svg'), d=d)), 'd': d,
+                                         'advance': listUses[i + 1][0] - listUses[i][0]}
+
+            # superscript offset with respect to the end of the base '10'
+            table['superscriptOffset'] = [uses[1][2][0] - uses[1][1][0] - table['normal']['0']['advance'], uses[1][2][1] - uses[1][0][1]]
+            # height of the outline of 'F', the letter TexText uses as reference of the font size. See numericLabelHeight0()
+            table['capitalHeight'] = inkex.Path(glyphPaths[uses[2][0][2]]).bounding_box().height
+
+            try:
+                os.makedirs(os.path.dirname(cacheFile), exist_ok=True)
+                with open(cacheFile, 'w') as f:
+                    json.dump(table, f)
+            except OSError:
+                pass
+
+    numericGlyphTables[preambleHash] = table
+    return table
+
+
+def renderNumericLabel(ExtensionBaseObj, LaTeXtext, preambleFile):
+    """Compose simple numeric labels from a table of glyph outlines, without running LaTeX.
+
+    Accepted labels: numbers (e.g. ``$-1.25$``) and powers of 10 (e.g. ``$10^{-3}$``). Returns [groupLatex, Height0], just like renderLatex(), or
+    ``None`` if the label is not supported or the glyph table is not available. Height0 is given by numericLabelHeight0().
+
+    .. note:: Internal function.
+    """
+    match = numericLabelPattern.match(LaTeXtext.strip())
+    if match is None:
+        return None
+
+    table = numericGlyphTable(ExtensionBaseObj, preambleFile)
+    if table is None:
+        return None
+
+    if match.group(1) is not None:
+        glyphs = [[table['normal'][char], 0.0] for char in match.group(1)]
+    else:
+        glyphs = [[table['normal']['1'], 0.0], [table['normal']['0'], 0.0]]
+        glyphs += [[table['script'][char], table['superscriptOffset'][1]] for char in match.group(2)]
+
+    defs = ExtensionBaseObj.getDefinitions()
+    existingIds = set(defs.xpath('./*/@id'))
+
+    groupLatex = etree.Element(inkex.addNS('g', 'svg'))
+    posX = 0.0
+    for i, [glyph, posY] in enumerate(glyphs):
+        if glyph['id'] not in existingIds:
+            etree.SubElement(defs, inkex.addNS('path', 'svg'), {'id': glyph['id'], 'd': glyph['d']})
+            existingIds.add(glyph['id'])
+
+        if i == 2 and match.group(2) is not None:
+            posX += table['superscriptOffset'][0]
+
+        etree.SubElement(groupLatex, inkex.addNS('use', 'svg'), {inkex.addNS('href', 'xlink'): '#' + glyph['id'], 'x': '%g' % posX, 'y': '%g' % posY})
+        posX += glyph['advance']
+
+    return [groupLatex, numericLabelHeight0(ExtensionBaseObj, table, preambleFile)]
+
+
+def numericLabelHeight0(ExtensionBaseObj, table, preambleFile):
+    """Return the height of a capital letter in the units of the glyph table, as defined by the converter that renders the other LaTeX texts.
+    Labels composed from the table then have the same size as the ones rendered by this converter.
+
+    dvisvgm (persistent worker or ``latexConverter='dvisvgm'``) uses the nominal height of the capitals of the font. TexText uses the height of
+    the outline of an 'F', also measured in the table.
+
+    .. note:: Internal function.
+    """
+    if activeLatexWorker(ExtensionBaseObj, preambleFile) is not None or latexConverter == 'dvisvgm':
+        return latexWorker.capitalHeight
+    return table['capitalHeight']
+
+
+def renderLatex(ExtensionBaseObj, LaTeXtext, preambleFile):
+    """Render LaTeX contents into a detached group, without scaling, colouring or positioning it.
+
+    Returns [groupLatex, Height0], where Height0 is the height of a capital letter of ``\\normalsize`` in the units of groupLatex.
+
+    .. note:: Internal function.
+    """
+    return latexDataToGroup(ExtensionBaseObj, renderLatexData(ExtensionBaseObj, LaTeXtext, preambleFile))
+
+
+def latexDataToGroup(ExtensionBaseObj, latexData):
+    """Convert the output of renderLatexData() into [groupLatex, Height0]. Glyph definitions are added to the document.
+
+    .. note:: Internal function.
+    """
+    if isinstance(latexData, bytes):
+        return [dvisvgmToGroup(ExtensionBaseObj, latexData), latexWorker.capitalHeight]
+
+    # running TexText with a 'F' gives a letter with height of 9.041644, with scale 1.0. This will be used to scale the text accordingly to fit
+    # user specification 'fontSize'
+    return [latexData, 9.041644]
+
+
+def renderLatexData(ExtensionBaseObj, LaTeXtext, preambleFile):
+    """Run the LaTeX converter. This function does not modify the document. Conversions are serialized by ``latexLock``, therefore only one
+    conversion runs at a time, even if called from the main thread and from the executor of text.latexAsync() at the same time.
+
+    The persistent worker (see :meth:`text.startLatexWorker`) is used if it is running with the same preamble file. Otherwise the converter
+    selected by ``latexConverter`` is called. If the dvisvgm converter fails, TexText is used instead.
+
+    Returns the svg data produced by dvisvgm (bytes) or the group produced by TexText.
+
+    .. note:: Internal function.
+    """
+    with latexLock:
+        svgData = None
+        worker = activeLatexWorker(ExtensionBaseObj, preambleFile)
+        if worker is not None:
+            svgData = worker.render(LaTeXtext)
+        elif latexConverter == 'dvisvgm':
+            svgData = dvisvgmRender(LaTeXtext, preambleFile)
+
+        if svgData is not None:
+            return svgData
+
+        # the blank document is parsed only once. TexText receives a copy of it, avoiding writing and parsing a temporary svg file for each text.
+        global blankDocument
+        if blankDocument is None:
+            blankDocument = inkex.load_svg(io.BytesIO(ExtensionBaseObj.blankSVG.encode('ascii')))
+
+        tex = textext.TexText()  # start textText (awesome extension! =] )
+        tex.parse_arguments([r'--text=' + LaTeXtext, '--scale-factor=1', '--preamble-file=' + preambleFile])
+        tex.document = copy.deepcopy(blankDocument)
+        tex.svg = tex.document.getroot()
+        tex.effect()  # TexText runs in its own temporary directory, removed right after
+
+        for child in tex.document.getroot():
+            if child.typename == 'TexTextElement':
+                groupLatex = child
+
+        return groupLatex
+
+
+def colorAndScaleLatexGroup(ExtensionBaseObj, groupLatex, Height0, fontSize, textColor):
+    """Set the color of a rendered LaTeX group and scale it to the font size
+
+    .. note:: Internal function.
+    """
+    scale = fontSize / Height0
+
+    if textColor is None:
+        textColor = 'none'
+        opacityFill = '1.0'
+
+    # set color and opacity
+    if textColor.startswith('#'):
+        [textColor, alphaFill] = color.splitColorAlpha(textColor)
+        opacityFill = str(int(alphaFill, 16) / 255.0)
+
+    # change color
+    for obj in groupLatex.iter():
+        oldStyle = obj.get('style')
+        if oldStyle is not None:
+            newStyle = re.sub('fill:#[0-9a-fA-F]+', 'fill:' + textColor, oldStyle)
+            newStyle = re.sub('fill-opacity:[0-9]+', 'fill-opacity:' + opacityFill, newStyle)
+            newStyle = re.sub('stroke:#[0-9a-fA-F]+', 'stroke:' + textColor, newStyle)
+            newStyle = re.sub('stroke-opacity:[0-9]+', 'stroke-opacity:' + opacityFill, newStyle)
+            obj.set('style', newStyle)
+
+    # glyphs produced by dvisvgm have no style. They inherit the color of the group
+    if groupLatex.get('style') is None:
+        groupLatex.set('style', 'fill:%s;fill-opacity:%s;stroke:none' % (textColor, opacityFill))
+
+    ExtensionBaseObj.scaleElement(groupLatex, scaleX=scale, scaleY=scale)  # scale to fit font size
+
+
+def alignTextGroup(ExtensionBaseObj, groupLatex, position, fontSize, refPoint, angleDeg):
+    """Move the text group created by text.latex() so that its reference point lies on position, and rotate it.
+
+    .. note:: Internal function.
+    """
+    BboxMin, BboxMax = ExtensionBaseObj.getBoundingBox(groupLatex)
+
+    if useLatex:  # set useLatex=False to replace latex by an standard text (much faster for debugging =)  )
+        if refPoint[0] == 't':
+            refPointY = BboxMin[1]  # BboxMin bc inkscape is upside down
+
+        if refPoint[0] == 'c':
+            refPointY = (BboxMax[1] + BboxMin[1]) / 2.0
+
+        if refPoint[0] == 'b':
+            refPointY = BboxMax[1]  # BboxMax bc inkscape is upside down
+
+        if refPoint[1] == 'l':
+            refPointX = BboxMin[0]
+
+        if refPoint[1] == 'c':
+            refPointX = (BboxMax[0] + BboxMin[0]) / 2.0
+
+        if refPoint[1] == 'r':
+            refPointX = BboxMax[0]
+    else:
+        refPointX = BboxMin[0]
+        if refPoint[0] == 't':
+            refPointY = BboxMin[1] - fontSize  # BboxMin bc inkscape is upside down
+
+        if refPoint[0] == 'c':
+            refPointY = BboxMin[1] - fontSize / 2.0  # BboxMin bc inkscape is upside down
+
+        if refPoint[0] == 'b':
+            refPointY = BboxMax[1]  # BboxMax bc inkscape is upside down
+
+    ExtensionBaseObj.moveElement(groupLatex, [-refPointX, -refPointY])  # move to origin
+    ExtensionBaseObj.moveElement(groupLatex, [position[0], position[1]])
+    if angleDeg != 0:
+        ExtensionBaseObj.rotateElement(groupLatex, center=[position[0], position[1]], angleDeg=angleDeg)
+
+
+def activeLatexWorker(ExtensionBaseObj, preambleFile):
+    """Return the persistent worker started with :meth:`text.startLatexWorker` if it is still running with the same preamble file, or None.
+
+    .. note:: Internal function.
+    """
+    worker = getattr(ExtensionBaseObj, 'latexWorker', None)
+    if worker is None or worker.closed or worker.preambleFile != os.path.abspath(preambleFile):
+        return None
+    return worker
+
+
+class latexWorker():
+    """Long-lived LaTeX worker, used by :meth:`text.latex` to avoid paying LaTeX start-up time and preamble loading at each label.
+
+    The worker always keeps one LaTeX process running in the background, with the preamble already loaded and waiting for the contents of the
+    document on its standard input. Each snippet is written to the pipe of the waiting process, followed by ``\\end{document}``, and a new
+    process is started immediately so that it loads the preamble while your extension keeps drawing. The resulting DVI page is converted to
+    svg with ``dvisvgm --no-fonts``. If LaTeX fails, the process is discarded and a fresh one takes its place.
+
+    You will need ``latex`` and ``dvisvgm`` in the PATH environment variable. Both are part of most LaTeX distributions.
+
+    The worker is stopped by :meth:`text.stopLatexWorker`, at the end of a ``with`` block (see :meth:`text.startLatexWorker`) or, at the latest,
+    when python exits.
+
+    .. note:: Do not create instances of this class directly. Use :meth:`text.startLatexWorker` and :meth:`text.stopLatexWorker` instead.
+
+    """
+
+    # height of any capital letter of \\normalsize (cmr10), in bp, the unit of dvisvgm output.
+    capitalHeight = 6.83333 * 72.0 / 72.27
+
+    def __init__(self, preambleFile, latexCommand='latex', dvisvgmCommand='dvisvgm', timeout=30):
+        self.preambleFile = os.path.abspath(preambleFile)
+        self.latexCommand = latexCommand
+        self.dvisvgmCommand = dvisvgmCommand
+        self.timeout = timeout
+        self.workDir = tempfile.mkdtemp(prefix='latexWorker_', dir=sessionDirectory())
+        self.jobNumber = 0
+        self.process = None
+        self.jobName = None
+        self.closed = False
+
+        with open(os.path.join(self.workDir, 'header.tex'), 'w') as f:
+            f.write(latexDocumentHeader(self.preambleFile))
+
+        atexit.register(self.close)
+        self.spawn()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+    def spawn(self):
+        """Start a new LaTeX process that loads the preamble and waits for the document contents
+
+        .. note:: Internal function.
+        """
+        self.jobNumber += 1
+        self.jobName = 'snippet%05d' % self.jobNumber
+        # scrollmode is mandatory here: in batch/nonstop modes TeX refuses to read the document from the terminal (stdin)
+        self.process = subprocess.Popen([self.latexCommand, '-interaction=scrollmode', '-jobname=' + self.jobName, 'header.tex'], cwd=self.workDir,
+                                        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+
+    def render(self, LaTeXtext, quiet=False):
+        """Render a snippet and return the svg produced by dvisvgm
+
+        :param LaTeXtext: contents of the document
+        :param quiet: do not display error messages. Default: False
+        :type LaTeXtext: string
+        :type quiet: bool
+
+        :returns: svg data or ``None`` if LaTeX failed
+        :rtype: bytes
+        """
+        with latexLock:
+            # restart the worker if the waiting process died, e.g. due to an error in the preamble
+            if self.process is None or self.process.poll() is not None:
+                self.spawn()
+
+            process = self.process
+            jobName = self.jobName
+            self.spawn()  # prepares the next process while this one is running
+
+            try:
+                log, _ = process.communicate((LaTeXtext + '\n\\end{document}\n').encode('utf-8'), timeout=self.timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                if not quiet:
+                    displayMsg('Error: LaTeX timed out while rendering \'%s\'' % LaTeXtext)
+                return None
+
+            dviFile = os.path.join(self.workDir, jobName + '.dvi')
+            try:
+                if process.returncode != 0 or b'\n! ' in log or not os.path.exists(dviFile):
+                    if not quiet:
+                        displayMsg('Error: LaTeX failed to render \'%s\'' % LaTeXtext)
+                    return None
+
+                return dviToSvg(dviFile, self.dvisvgmCommand, self.timeout, quiet)
+            finally:
+                for ext in ['.dvi', '.log', '.aux']:
+                    if os.path.exists(os.path.join(self.workDir, jobName + ext)):
+                        os.remove(os.path.join(self.workDir, jobName + ext))
+
+    def close(self):
+        """Terminate the waiting LaTeX process and remove the working directory
+
+        .. note:: Internal function.
+        """
+        with latexLock:
+            if self.process is not None and self.process.poll() is None:
+                self.process.kill()
+                self.process.communicate()
+            self.process = None
+            self.closed = True
+            shutil.rmtree(self.workDir, ignore_errors=True)
+        atexit.unregister(self.close)
+
+
 class text():
     """ Class for writing texts.
 
@@ -1284,7 +2442,7 @@ class text():
     # ---------------------------------------------
     @staticmethod
     def latex(ExtensionBaseObj, parent, LaTeXtext, position, fontSize=10, refPoint='cc', textColor=color.defined('black'), LatexCommands=' ',
-              angleDeg=0, preambleFile=None):
+              angleDeg=0, preambleFile=None, fastNumbers=False):
         """Creates text element using LaTeX. You can use any LaTeX contents here.
 
         .. note:: LaTeX support is an optional feature that requires a few extra packages to be installed outside inkscape. **It is enabled by default**.
@@ -1300,6 +2458,11 @@ class text():
         :param LatexCommands: Commands to be included before LaTeXtext (default: ' '). If LaTeX support is disabled, this parameter has no effect.
         :param angleDeg: Angle of the text, counterclockwise, in degrees. Default: 0
         :param preambleFile: Optional preamble file to be included. Default: None. If LaTeX support is disabled, this parameter has no effect.
+        :param fastNumbers: Compose simple numeric labels (e.g. ``$-1.25$`` or ``$10^{-3}$``) from a table of glyph outlines instead of running LaTeX.
+                The table is produced by LaTeX and dvisvgm only once and cached in ``~/.cache/inkscapeMadeEasy``, therefore the result is identical to
+                LaTeX's output, scaled like the texts of the converter in use (``latexConverter``). Other texts are rendered by LaTeX as usual. If
+                ``latex`` or ``dvisvgm`` are not in the PATH, the table cannot be produced and all texts are rendered by LaTeX, without any message.
+                Default: False. If LaTeX support is disabled, this parameter has no effect.
 
         :type ExtensionBaseObj: inkscapeMadeEasy object
         :type parent: inkscape element object
@@ -1311,6 +2474,7 @@ class text():
         :type LatexCommands: string
         :type angleDeg: float
         :type preambleFile: string
+        :type fastNumbers: bool
 
         :returns: the new text object
         :rtype: text Object
@@ -1360,85 +2524,24 @@ class text():
         >>> inkDraw.text.latex(self, root_layer,r'This is one equation \\begin{align} x=y^2\\end{align} And this is my \\fooBar{}',
         >>>                    position=[0.0,0.0], fontSize=10, refPoint='cc', textColor=inkDraw.color.defined('black'), LatexCommands=customCommand, angleDeg=0, preambleFile=None)
         """
-        newTmp = True
-
-        # write an empty svg file.
-
         if not LaTeXtext:  # check whether text is empty
             return 0
 
         if useLatex:  # set useLatex=False to replace latex by an standard text (much faster for debugging =)  )
 
-            if newTmp:
-                tmpf = tempfile.NamedTemporaryFile(mode='w', prefix='temp_svg_inkscapeMadeEasy_Draw_', suffix='.svg', delete=False)
-                tempFilePath = tmpf.name
-                tmpf.write(ExtensionBaseObj.blankSVG)
-                tmpf.close()
-            else:
-                tempDir = tempfile.gettempdir()
-                tempFilePath = tempDir + '/temp_svg_inkscapeMadeEasy_Draw.txt'
-                Dump(ExtensionBaseObj.blankSVG, tempFilePath, 'w')
-
-            # return
-            # temp instance for determining font height. Draws a F letter just to find the height of the font
-            if False:  # turning off this part of the code.
-                texTemp = textext.TexText()  # start textText (awesome extension! =] )
-                texTemp.run([r'--text=' + 'F', '--scale-factor=1', tempFilePath], output=os.devnull)
-
-                for child in texTemp.document.getroot():
-                    if child.typename == 'TexTextElement':
-                        groupLatex = child
+            if not preambleFile:
+                preambleFile = ExtensionBaseObj.getBasicLatexPackagesFile()
 
-                BboxMin, BboxMax = ExtensionBaseObj.getBoundingBox(groupLatex)
-                Height0 = BboxMax[1] - BboxMin[1]
+            result = None
+            if fastNumbers and not LatexCommands.strip():
+                result = renderNumericLabel(ExtensionBaseObj, LaTeXtext, preambleFile)
 
-                scale = ExtensionBaseObj.getDocumentScaleFactor()
-                ExtensionBaseObj.displayMsg('H0=%f\nscaleFactor=%f' % (Height0,scale ))
+            if result is None:
+                result = renderLatex(ExtensionBaseObj, LatexCommands + LaTeXtext, preambleFile)
 
-            else:
-                # running the code above, we get a 'F' with height of 6.76, with scale 1.0 from textext. This will be used to scale the text accordingly to fit user specification 'fontSize'
-                # Height0 = 6.76
-                Height0 = 9.041644
-
-            scale = fontSize / Height0
+            [groupLatex, Height0] = result
 
-            tex = textext.TexText()  # start textText (awesome extension! =] )
-
-            if preambleFile:
-                tex.run([r'--text=' + LatexCommands + LaTeXtext, '--scale-factor=1', '--preamble-file=' + preambleFile, tempFilePath],
-                        output=os.devnull)  # in case we want to save the svg file with the text element, uncomment the fllowing line.  # tex.document.write(tempFilePath)
-            else:
-                tex.run(
-                    [r'--text=' + LatexCommands + LaTeXtext, '--scale-factor=1', '--preamble-file=' + ExtensionBaseObj.getBasicLatexPackagesFile(),
-                     tempFilePath], output=os.devnull)
-
-            if newTmp:
-                os.unlink(tmpf.name)
-
-            for child in tex.document.getroot():
-                if child.typename == 'TexTextElement':
-                    groupLatex = child
-
-            if textColor is None:
-                textColor = 'none'
-                opacityFill = '1.0'
-
-            # set color and opacity
-            if textColor.startswith('#'):
-                [textColor, alphaFill] = color.splitColorAlpha(textColor)
-                opacityFill = str(int(alphaFill, 16) / 255.0)
-
-            # change color
-            for obj in groupLatex.iter():
-                oldStyle = obj.get('style')
-                if oldStyle is not None:
-                    newStyle = re.sub('fill:#[0-9a-fA-F]+', 'fill:' + textColor, oldStyle)
-                    newStyle = re.sub('fill-opacity:[0-9]+', 'fill-opacity:' + opacityFill, newStyle)
-                    newStyle = re.sub('stroke:#[0-9a-fA-F]+', 'stroke:' + textColor, newStyle)
-                    newStyle = re.sub('stroke-opacity:[0-9]+', 'stroke-opacity:' + opacityFill, newStyle)
-                    obj.set('style', newStyle)
-
-            ExtensionBaseObj.scaleElement(groupLatex, scaleX=scale, scaleY=scale)  # scale to fit font size
+            colorAndScaleLatexGroup(ExtensionBaseObj, groupLatex, Height0, fontSize, textColor)
         else:
             if refPoint[1] == 'l':
                 justification = 'left'
@@ -1455,43 +2558,174 @@ class text():
 
         parent.append(groupLatex)
 
-        BboxMin, BboxMax = ExtensionBaseObj.getBoundingBox(groupLatex)
+        alignTextGroup(ExtensionBaseObj, groupLatex, position, fontSize, refPoint, angleDeg)
 
-        if useLatex:  # set useLatex=False to replace latex by an standard text (much faster for debugging =)  )
-            if refPoint[0] == 't':
-                refPointY = BboxMin[1]  # BboxMin bc inkscape is upside down
+        return groupLatex
 
-            if refPoint[0] == 'c':
-                refPointY = (BboxMax[1] + BboxMin[1]) / 2.0
+    # ---------------------------------------------
+    @staticmethod
+    def latexAsync(ExtensionBaseObj, parent, LaTeXtext, position, fontSize=10, refPoint='cc', textColor=color.defined('black'), LatexCommands=' ',
+                   angleDeg=0, preambleFile=None, fastNumbers=False):
+        """Asynchronous version of :meth:`text.latex`, to be used with ``asyncio``.
 
-            if refPoint[0] == 'b':
-                refPointY = BboxMax[1]  # BboxMax bc inkscape is upside down
+        This function returns immediately, so your extension can keep drawing while LaTeX runs in the background. A placeholder group, with the
+        estimated bounding box of the text, is inserted in the document in the place of the text. When the returned future resolves, the
+        placeholder is replaced by the rendered text, with the reference point correction applied. Use ``await asyncio.gather(...)`` on all futures
+        before the document is saved.
 
-            if refPoint[1] == 'l':
-                refPointX = BboxMin[0]
+        The arguments are the same of :meth:`text.latex`.
 
-            if refPoint[1] == 'c':
-                refPointX = (BboxMax[0] + BboxMin[0]) / 2.0
+        .. note:: This function must be called from a coroutine, that is, with an ``asyncio`` event loop running.
 
-            if refPoint[1] == 'r':
-                refPointX = BboxMax[0]
-        else:
-            refPointX = BboxMin[0]
-            if refPoint[0] == 't':
-                refPointY = BboxMin[1] - fontSize  # BboxMin bc inkscape is upside down
+        .. note:: Texts are rendered one at a time in a background thread, in the same order of the calls. Synchronous calls of :meth:`text.latex`
+            made meanwhile (e.g. tick labels of plots) wait for the text being rendered in the background. If LaTeX support is disabled, or the
+            text is composed with ``fastNumbers``, the text is created right away and the returned future is already resolved.
 
-            if refPoint[0] == 'c':
-                refPointY = BboxMin[1] - fontSize / 2.0  # BboxMin bc inkscape is upside down
+        :param ExtensionBaseObj: Most of the times you have to pass 'self' when calling from inside your plugin class. See example below
+        :param parent: parent object
+        :param LaTeXtext: Contents of the text. Can contain any latex command
+        :param position: Position of the reference point [x,y]
+        :param fontSize: Size of the font. Assume any capitql letter of ``\\normalsize`` will have this size. Default: 10
+        :param refPoint: Text reference Point. See :meth:`text.latex` for options. Default: ``cc``
+        :param textColor: Color in the format ``#RRGGBBAA`` (hexadecimal), or ``None`` for no color. Default: color.defined('black')
+        :param LatexCommands: Commands to be included before LaTeXtext (default: ' '). If LaTeX support is disabled, this parameter has no effect.
+        :param angleDeg: Angle of the text, counterclockwise, in degrees. Default: 0
+        :param preambleFile: Optional preamble file to be included. Default: None. If LaTeX support is disabled, this parameter has no effect.
+        :param fastNumbers: See :meth:`text.latex`. Default: False
 
-            if refPoint[0] == 'b':
-                refPointY = BboxMax[1]  # BboxMax bc inkscape is upside down
+        :type ExtensionBaseObj: inkscapeMadeEasy object
+        :type parent: inkscape element object
+        :type LaTeXtext: string
+        :type position: list
+        :type fontSize: float
+        :type refPoint: string
+        :type textColor: string
+        :type LatexCommands: string
+        :type angleDeg: float
+        :type preambleFile: string
+        :type fastNumbers: bool
 
-        ExtensionBaseObj.moveElement(groupLatex, [-refPointX, -refPointY])  # move to origin
-        ExtensionBaseObj.moveElement(groupLatex, [position[0], position[1]])
-        if angleDeg != 0:
-            ExtensionBaseObj.rotateElement(groupLatex, center=[position[0], position[1]], angleDeg=angleDeg)
+        :returns: future that resolves to the new text object
+        :rtype: asyncio.Future
 
-        return groupLatex
+        **Example**
+
+        >>> import asyncio
+        >>>
+        >>> async def drawLabels(self, root_layer):
+        >>>     futures = []
+        >>>     for i in range(10):
+        >>>         futures.append(inkDraw.text.latexAsync(self, root_layer, r'$\\alpha_{%d}$' % i, position=[20.0 * i, 0.0], fontSize=10))
+        >>>         inkDraw.circle.centerRadius(root_layer, centerPoint=[20.0 * i, 10.0], radius=2.0)   # drawing continues while LaTeX runs
+        >>>     return await asyncio.gather(*futures)
+        >>>
+        >>> root_layer = self.document.getroot()     # retrieves the root layer of the document
+        >>> textGroups = asyncio.run(drawLabels(self, root_layer))
+        """
+        loop = asyncio.get_running_loop()
+
+        if not useLatex or not LaTeXtext or (fastNumbers and not LatexCommands.strip() and numericLabelPattern.match(LaTeXtext.strip())):
+            future = loop.create_future()
+            future.set_result(text.latex(ExtensionBaseObj, parent, LaTeXtext, position, fontSize, refPoint, textColor, LatexCommands, angleDeg,
+                                         preambleFile, fastNumbers))
+            return future
+
+        if not preambleFile:
+            preambleFile = ExtensionBaseObj.getBasicLatexPackagesFile()
+
+        # placeholder with the estimated size of the text: capital letter height and average character width
+        nChars = max(len(re.sub(r'\\[a-zA-Z]+|[{}$^_\\\s]', '', LaTeXtext)), 1)
+        placeholder = etree.SubElement(parent, inkex.addNS('g', 'svg'))
+        placeholder.set(inkex.addNS('label', 'inkscape'), 'LaTeX placeholder')
+        etree.SubElement(placeholder, inkex.addNS('rect', 'svg'),
+                         {'x': '0', 'y': str(-fontSize), 'width': str(0.7 * fontSize * nChars), 'height': str(fontSize), 'style': 'fill:none;stroke:none'})
+        alignTextGroup(ExtensionBaseObj, placeholder, position, fontSize, refPoint, angleDeg)
+
+        async def resolve():
+            try:
+                latexData = await loop.run_in_executor(latexExecutor(), renderLatexData, ExtensionBaseObj, LatexCommands + LaTeXtext, preambleFile)
+            except BaseException:
+                parent.remove(placeholder)
+                raise
+
+            [groupLatex, Height0] = latexDataToGroup(ExtensionBaseObj, latexData)
+            colorAndScaleLatexGroup(ExtensionBaseObj, groupLatex, Height0, fontSize, textColor)
+
+            parent.insert(parent.index(placeholder), groupLatex)
+            parent.remove(placeholder)
+
+            alignTextGroup(ExtensionBaseObj, groupLatex, position, fontSize, refPoint, angleDeg)
+            return groupLatex
+
+        return loop.create_task(resolve())
+
+    # ---------------------------------------------
+    @staticmethod
+    def startLatexWorker(ExtensionBaseObj, preambleFile=None, latexCommand='latex'):
+        """Start a persistent LaTeX worker to speed up :meth:`text.latex`.
+
+        Each call of :meth:`text.latex` starts LaTeX and loads the preamble again. If your extension places many labels, you can start a
+        long-lived worker that keeps one LaTeX process waiting with the preamble already loaded. See :class:`latexWorker` for details.
+
+        The worker is used by :meth:`text.latex` (and all plot functions) whenever the preamble file of the call is the same as the one of the worker.
+        Otherwise, the converter selected by ``latexConverter`` is used as usual. Glyphs are defined only once in <defs>.
+
+        .. note:: The worker requires ``latex`` and ``dvisvgm`` to be available in the PATH environment variable. If LaTeX support is disabled,
+            this function does nothing.
+
+        :param ExtensionBaseObj: Most of the times you have to pass 'self' when calling from inside your plugin class. See example below
+        :param preambleFile: Optional preamble file to be included. Default: None (uses ``basicLatexPackages.tex``)
+        :param latexCommand: LaTeX executable that produces DVI output. Default: ``latex``
+
+        :type ExtensionBaseObj: inkscapeMadeEasy object
+        :type preambleFile: string
+        :type latexCommand: string
+
+        :returns: the worker. It can be used in a ``with`` statement, stopping the worker at the end of the block. None if LaTeX support is
+            disabled
+        :rtype: :class:`latexWorker`
+
+        **Example**
+
+        >>> root_layer = self.document.getroot()     # retrieves the root layer of the document
+        >>> inkDraw.text.startLatexWorker(self)
+        >>> for i in range(100):
+        >>>     inkDraw.text.latex(self, root_layer, r'$x_{%d}$' % i, position=[20.0 * i, 0.0], fontSize=10)
+        >>> inkDraw.text.stopLatexWorker(self)
+        >>>
+        >>> # the same, stopping the worker even if an exception is raised
+        >>> with inkDraw.text.startLatexWorker(self):
+        >>>     for i in range(100):
+        >>>         inkDraw.text.latex(self, root_layer, r'$x_{%d}$' % i, position=[20.0 * i, 0.0], fontSize=10)
+        """
+        if not useLatex:
+            return None
+
+        text.stopLatexWorker(ExtensionBaseObj)
+
+        if not preambleFile:
+            preambleFile = ExtensionBaseObj.getBasicLatexPackagesFile()
+
+        ExtensionBaseObj.latexWorker = latexWorker(preambleFile, latexCommand)
+        return ExtensionBaseObj.latexWorker
+
+    # ---------------------------------------------
+    @staticmethod
+    def stopLatexWorker(ExtensionBaseObj):
+        """Stop the persistent LaTeX worker started with :meth:`text.startLatexWorker`.
+
+        The worker is also stopped automatically when python exits.
+
+        :param ExtensionBaseObj: Most of the times you have to pass 'self' when calling from inside your plugin class.
+        :type ExtensionBaseObj: inkscapeMadeEasy object
+
+        :returns: nothing
+        :rtype: -
+        """
+        worker = getattr(ExtensionBaseObj, 'latexWorker', None)
+        if worker is not None:
+            worker.close()
+        ExtensionBaseObj.latexWorker = None
 
 
 class cubicBezier():
@@ -1640,7 +2874,7 @@ class cubicBezier():
                     {'node': coord, 'cPoint_before': cPbefore, 'cPoint_after': cPafter, 'type': typeNodeSodipodi, 'absCoords': flagAbsCoords})
 
     @staticmethod
-    def draw(parent, NodeList, offset=np.array([0, 0]), label='none', lineStyle=lineStyle.setSimpleBlack(), closePath=False):
+    def draw(parent, NodeList, offset=np.array([0, 0]), label='none', lineStyle=lineStyle.setSimpleBlack(), closePath=False, precision=None):
         """draws the bezier line, given a list of nodes, built using :meth:`cubicBezier.addNode` method
 
 
@@ -1650,6 +2884,7 @@ class cubicBezier():
         :param label: label of the line. Default 'none'
         :param lineStyle: line style to be used. See :class:`lineStyle` class. Default: lineStyle=lineStyle.setSimpleBlack()
         :param closePath: Connects the first point to the last. Default: False
+        :param precision: Number of decimal places of the coordinates. Default: None (uses ``pathPrecision``, defined at the beginning of this module)
 
         :type parent: inkscape element object
         :type NodeList: list of nodes
@@ -1657,6 +2892,7 @@ class cubicBezier():
         :type label: string
         :type lineStyle: lineStyle object
         :type closePath: bool
+        :type precision: int
 
         :returns: the new line object
         :rtype: line Object
@@ -1700,55 +2936,94 @@ class cubicBezier():
 
         """
 
-        # first node
-        if NodeList[0]['absCoords']:
-            string_coords = 'M %f,%f ' % (NodeList[0]['node'][0] + offset[0], NodeList[0]['node'][0] + offset[1])
-        else:
-            string_coords = 'M %f,%f ' % (NodeList[0]['node'][0] + offset[0], NodeList[0]['node'][0] + offset[1])
+        # converts the nodes to absolute coordinates. The first node is always in absolute coordinates
+        nodes = np.zeros([len(NodeList), 2])
+        cPbefore = np.zeros([len(NodeList), 2])
+        cPafter = np.zeros([len(NodeList), 2])
+        for i, node in enumerate(NodeList):
+            if i == 0 or node['absCoords']:
+                nodes[i] = np.array(node['node']) + offset
+            else:
+                nodes[i] = nodes[i - 1] + node['node']
 
-        string_nodeTypes = ''
-        Ptotal = np.zeros(2)
-        for i in range(len(NodeList) - 1):
-            currNode = NodeList[i]
-            nextNode = NodeList[i + 1]
-
-            if currNode['absCoords']:
-                bezier = 'C %f,%f ' % (currNode['cPoint_after'][0] + offset[0], currNode['cPoint_after'][1] + offset[1])  # first control point
-                bezier += '%f,%f ' % (nextNode['cPoint_before'][0] + offset[0], nextNode['cPoint_before'][1] + offset[1])  # second control point
-                bezier += '%f,%f ' % (nextNode['node'][0] + offset[0], nextNode['node'][1] + offset[1])  # second node
+            if node['absCoords']:
+                cPbefore[i] = np.array(node['cPoint_before']) + offset
+                cPafter[i] = np.array(node['cPoint_after']) + offset
             else:
-                bezier = 'c %f,%f ' % (currNode['cPoint_after'][0], currNode['cPoint_after'][1])  # first control point
-                bezier += '%f,%f ' % (
-                nextNode['cPoint_before'][0] + nextNode['node'][0], nextNode['cPoint_before'][1] + nextNode['node'][1])  # second control point
-                bezier += '%f,%f ' % (nextNode['node'][0], nextNode['node'][1])  # second node
-                Ptotal += np.array(currNode['node'])
+                cPbefore[i] = nodes[i] + node['cPoint_before']
+                cPafter[i] = nodes[i] + node['cPoint_after']
 
-            string_nodeTypes += currNode['type']
-            string_coords = string_coords + bezier
+        return cubicBezier.fromArrays(parent, nodes, cPbefore, cPafter, ''.join([node['type'] for node in NodeList]), [0, 0], label, lineStyle,
+                                      closePath, precision)
 
-        if closePath:
-            currNode = NodeList[-1]
-            nextNode = copy.deepcopy(NodeList[0])
+    # ---------------------------------------------
+    @staticmethod
+    def fromArrays(parent, nodes, cPbefore, cPafter, nodeTypes=None, offset=[0, 0], label='none', lineStyle=lineStyle.setSimpleBlack(), closePath=False,
+                   precision=None):
+        """Draw a cubic bezier path given arrays of nodes and control points, in absolute coordinates.
 
-            if currNode['absCoords']:
-                bezier = 'C %f,%f ' % (currNode['cPoint_after'][0] + offset[0], currNode['cPoint_after'][1] + offset[1])  # first control point
-                bezier += '%f,%f ' % (nextNode['cPoint_before'][0] + offset[0], nextNode['cPoint_before'][1] + offset[1])  # second control point
-                bezier += '%f,%f ' % (nextNode['node'][0] + offset[0], nextNode['node'][1] + offset[1])  # second node
-            else:
-                # writes the coordinates of the first node, relative to the last node.
-                Ptotal += np.array(currNode['node'])
-                nextNode['node'][0] = NodeList[0]['node'][0] - Ptotal[0]
-                nextNode['node'][1] = NodeList[0]['node'][1] - Ptotal[1]
-
-                bezier = 'c %f,%f ' % (currNode['cPoint_after'][0], currNode['cPoint_after'][1])  # first control point
-                bezier += '%f,%f ' % (
-                nextNode['cPoint_before'][0] + nextNode['node'][0], nextNode['cPoint_before'][1] + nextNode['node'][1])  # second control point
-                bezier += '%f,%f ' % (nextNode['node'][0], nextNode['node'][1])  # second node
-
-            string_nodeTypes += currNode['type'] + nextNode['type']
-            string_coords = string_coords + bezier + ' Z'
+        This function is much faster than :meth:`cubicBezier.addNode` + :meth:`cubicBezier.draw` for paths with many nodes, since all segments are
+        processed at once.
+
+        :param parent: parent object
+        :param nodes: coordinates of the nodes [[x1,y1], ..., [xN,yN]]. Rows with NaN split the path in subpaths, all in the same path object
+        :param cPbefore: coordinates of the control points before each node. The value of the first node is used only if closePath=True
+        :param cPafter: coordinates of the control points after each node. The value of the last node is used only if closePath=True
+        :param nodeTypes: type of each node: ``c`` (corner), ``s`` (smooth) or ``z`` (symmetric), as a string or list, one per node.
+            Default: None (all nodes are corner nodes)
+
+            .. note:: This information is used by inkscape only when you edit the nodes. The control points are not modified by this function.
+
+        :param offset: offset coords. Default [0,0]
+        :param label: label of the line. Default 'none'
+        :param lineStyle: line style to be used. See :class:`lineStyle` class. Default: lineStyle=lineStyle.setSimpleBlack()
+        :param closePath: Connects the first point to the last. Default: False
+        :param precision: Number of decimal places of the coordinates. Default: None (uses ``pathPrecision``, defined at the beginning of this module)
+
+        :type parent: inkscape element object
+        :type nodes: list of lists or numpy array with shape (N,2)
+        :type cPbefore: list of lists or numpy array with shape (N,2)
+        :type cPafter: list of lists or numpy array with shape (N,2)
+        :type nodeTypes: string or list
+        :type offset: list
+        :type label: string
+        :type lineStyle: lineStyle object
+        :type closePath: bool
+        :type precision: int
+
+        :returns: the new line object
+        :rtype: line Object
+
+        **Example**
+
+        >>> root_layer = self.document.getroot()     # retrieves the root layer of the document
+        >>> t = np.linspace(0, 2 * np.pi, 1000)
+        >>> nodes = np.column_stack((t, np.sin(t))) * 10
+        >>> tangents = np.column_stack((np.ones_like(t), np.cos(t))) * 10 * (t[1] - t[0]) / 3   # derivative of the curve times dt/3
+        >>> inkDraw.cubicBezier.fromArrays(root_layer, nodes, nodes - tangents, nodes + tangents, nodeTypes='s' * len(t))
+        """
+        offset = np.asarray(offset, dtype=float)
+        nodes = np.asarray(nodes, dtype=float).reshape(-1, 2) + offset
+        cPbefore = np.asarray(cPbefore, dtype=float).reshape(-1, 2) + offset
+        cPafter = np.asarray(cPafter, dtype=float).reshape(-1, 2) + offset
+
+        if nodeTypes is None:
+            nodeTypes = 'c' * len(nodes)
+        nodeTypes = ''.join(nodeTypes)
+
+        # each subpath is formatted at once
+        string_coords = []
+        string_nodeTypes = ''
+        for [start, end] in validRanges(nodes):
+            string_coords.append(bezierData(nodes[start:end], cPbefore[start:end], cPafter[start:end], precision, closePath))
+            string_nodeTypes += nodeTypes[start:end]
+            if closePath:
+                string_nodeTypes += nodeTypes[start]
+
+        if compactPaths:
+            string_coords = ''.join(string_coords)
         else:
-            string_nodeTypes += currNode['type']
+            string_coords = ' '.join(string_coords)
 
         # M = move, L = line, H = horizontal line, V = vertical line, C = curve, S = smooth curve,
         # Q = quadratic Bezier curve, T = smooth quadratic Bezier curve, A = elliptical Arc,Z = closepath
@@ -1765,26 +3040,41 @@ class line():
     """
 
     @staticmethod
-    def absCoords(parent, coordsList, offset=[0, 0], label='none', lineStyle=lineStyle.setSimpleBlack(), closePath=False):
+    def absCoords(parent, coordsList, offset=[0, 0], label='none', lineStyle=lineStyle.setSimpleBlack(), closePath=False, precision=None,
+                  fitTolerance=None, simplify=None):
         """Draw a (poly)line based on a list of absolute coordinates
 
 
         :param parent: Parent object
-        :param coordsList: List with coords x and y. ex:  [[x1,y1], ..., [xN,yN]]
+        :param coordsList: List with coords x and y. ex:  [[x1,y1], ..., [xN,yN]]. Numpy arrays with shape (N,2) are also accepted.
+
+            Points with NaN coordinates are not drawn and split the line in subpaths, all in the same path object. This is useful to represent gaps in the data.
 
             .. warning:: Keep in mind  that Inkscape's y axis is upside down!
 
         :param offset: Offset coords. Default [0,0]
         :param label: Label of the line. Default 'none'
         :param lineStyle: Line style to be used. See :class:`lineStyle` class. Default: lineStyle=lineStyle.setSimpleBlack()
-        :param closePath: Connects the first point to the last. Default: False
+        :param closePath: Connects the first point to the last. If the line has gaps, each subpath is closed. Default: False
+        :param precision: Number of decimal places of the coordinates. Default: None (uses ``pathPrecision``, defined at the beginning of this module)
+        :param fitTolerance: If not None, the points are replaced by a smooth cubic bezier path passing close to them, with distance smaller than
+            this value (same units of the coordinates). This reduces a lot the size of dense smooth curves. Default: None (draws a polyline)
+
+            .. note:: Corners of the polyline are rounded and the nodes of the path are not the original points. Avoid this option if the line style has markers at the nodes.
+
+        :param simplify: If not None, points closer than this distance (same units of the coordinates) to the simplified polyline are removed,
+            using Ramer-Douglas-Peucker algorithm. Use a value below the size of one pixel at the final scale for no visible loss. Applied before
+            fitTolerance. Default: None (keeps all points)
 
         :type parent: inkscape element object
-        :type coordsList: list of list
+        :type coordsList: list of list or numpy array
         :type offset: list
         :type label: string
         :type lineStyle: lineStyle object
         :type closePath: bool
+        :type precision: int
+        :type fitTolerance: float
+        :type simplify: float
 
         :returns: the new line object
         :rtype: line Object
@@ -1803,30 +3093,36 @@ class line():
         >>>
         >>> # creates the same polyline translated to point (5,6). Note we just have to change the offset
         >>> inkDraw.line.absCoords(root_layer, coordsList=coords, offset=[5, 6], label='fooBarLine', lineStyle=myLineStyle)
+        >>>
+        >>> # dense smooth curve, drawn with a few bezier segments
+        >>> x = np.linspace(0, 10, 10000)
+        >>> coords = np.column_stack((x * 10, -np.sin(x) * 10))
+        >>> inkDraw.line.absCoords(root_layer, coordsList=coords, label='sine', lineStyle=myLineStyle, fitTolerance=0.05)
         """
 
-        # string with coordinates
-        string_coords = ''
+        if simplify is not None:
+            coordsList = simplifyPolyline(coordsList, simplify)
 
-        for point in coordsList:
-            string_coords = string_coords + ' ' + str(point[0] + offset[0]) + ',' + str(point[1] + offset[1])
+        if fitTolerance is not None:
+            [nodes, cPbefore, cPafter, nodeTypes] = fitCubicBezier(coordsList, fitTolerance, closePath)
+            return cubicBezier.fromArrays(parent, nodes, cPbefore, cPafter, nodeTypes, offset, label, lineStyle, closePath, precision)
 
-        if closePath:
-            string_coords += ' Z'
+        # string with coordinates
+        string_coords = polylineData(coordsList, offset, precision, closePath)
 
         # M = move, L = line, H = horizontal line, V = vertical line, C = curve, S = smooth curve,
         # Q = quadratic Bezier curve, T = smooth quadratic Bezier curve, A = elliptical Arc,Z = closepath
-        Attribs = {inkex.addNS('label', 'inkscape'): label, 'style': str(inkex.Style(lineStyle)), 'd': 'M ' + string_coords}
+        Attribs = {inkex.addNS('label', 'inkscape'): label, 'style': str(inkex.Style(lineStyle)), 'd': string_coords}
 
         return etree.SubElement(parent, inkex.addNS('path', 'svg'), Attribs)
 
     # ---------------------------------------------
     @staticmethod
-    def relCoords(parent, coordsList, offset=[0, 0], label='none', lineStyle=lineStyle.setSimpleBlack(), closePath=False):
+    def relCoords(parent, coordsList, offset=[0, 0], label='none', lineStyle=lineStyle.setSimpleBlack(), closePath=False, precision=None):
         """Draw a (poly)line based on a list of relative coordinates
 
         :param parent: Parent object
-        :param coordsList: List with distances dx and dy for all points.  ex  [[dx1,dy1], ..., [dxN,dyN]]
+        :param coordsList: List with distances dx and dy for all points.  ex  [[dx1,dy1], ..., [dxN,dyN]]. Numpy arrays with shape (N,2) are also accepted.
 
             .. warning:: Keep in mind  that Inkscape's y axis is upside down!
 
@@ -1834,13 +3130,15 @@ class line():
         :param label: Label of the line. Default 'none'
         :param lineStyle: Line style to be used. See :class:`lineStyle` class. Default: lineStyle=lineStyle.setSimpleBlack()
         :param closePath: Connects the first point to the last. Default: False
+        :param precision: Number of decimal places of the coordinates. Default: None (uses ``pathPrecision``, defined at the beginning of this module)
 
         :type parent: inkscape element object
-        :type coordsList: list of list
+        :type coordsList: list of list or numpy array
         :type offset: list
         :type label: string
         :type lineStyle: lineStyle object
         :type closePath: bool
+        :type precision: int
 
         :returns: the new line object
         :rtype: line Object
@@ -1862,17 +3160,61 @@ class line():
         """
 
         # string with coordinates
-        string_coords = ''
-        for dist in coordsList:
-            string_coords = string_coords + ' ' + str(dist[0]) + ',' + str(dist[1])
+        string_coords = polylineData(coordsList, offset, precision, closePath, relative=True)
 
-        if closePath:
-            string_coords += ' Z'
+        # M = move, L = line, H = horizontal line, V = vertical line, C = curve, S = smooth curve,
+        # Q = quadratic Bezier curve, T = smooth quadratic Bezier curve, A = elliptical Arc,Z = closepath
+        Attribs = {inkex.addNS('label', 'inkscape'): label, 'style': str(inkex.Style(lineStyle)), 'd': string_coords}
+
+        return etree.SubElement(parent, inkex.addNS('path', 'svg'), Attribs)
+
+    # ---------------------------------------------
+    @staticmethod
+    def segments(parent, segmentList, offset=[0, 0], label='none', lineStyle=lineStyle.setSimpleBlack(), precision=None):
+        """Draw a set of independent line segments as a single path object, one subpath per segment.
+
+        This is much lighter than drawing one line per segment when there are many segments with the same style, like grid lines and ticks.
+        Horizontal and vertical segments are written with ``H`` and ``V`` commands.
+
+        :param parent: Parent object
+        :param segmentList: List of segments, each one with the coordinates of its start and end points. ex: [[[x1,y1], [x2,y2]], ..., [[xA,yA], [xB,yB]]]
+
+            .. warning:: Keep in mind  that Inkscape's y axis is upside down!
+
+        :param offset: Offset coords. Default [0,0]
+        :param label: Label of the line. Default 'none'
+        :param lineStyle: Line style to be used. See :class:`lineStyle` class. Default: lineStyle=lineStyle.setSimpleBlack()
+        :param precision: Number of decimal places of the coordinates. Default: None (uses ``pathPrecision``, defined at the beginning of this module)
+
+        :type parent: inkscape element object
+        :type segmentList: list
+        :type offset: list
+        :type label: string
+        :type lineStyle: lineStyle object
+        :type precision: int
+
+        :returns: the new line object
+        :rtype: line Object
+
+        **Example**
+
+        >>> root_layer = self.document.getroot()     # retrieves the root layer of the document
+        >>> myLineStyle = inkDraw.lineStyle.setSimpleBlack(lineWidth=0.5)
+        >>>
+        >>> # creates a 10x10 grid with a single path object
+        >>> segments = [[[x, 0], [x, 100]] for x in range(0, 101, 10)] + [[[0, y], [100, y]] for y in range(0, 101, 10)]
+        >>> inkDraw.line.segments(root_layer, segments, offset=[0, 0], label='grid', lineStyle=myLineStyle)
+        """
+
+        offset = np.asarray(offset, dtype=float)
+        commands = []
+        for [start, end] in segmentList:
+            commands.append(['M', list(np.asarray(start, dtype=float) + offset)])
+            commands.append(['L', list(np.asarray(end, dtype=float) + offset)])
 
         # M = move, L = line, H = horizontal line, V = vertical line, C = curve, S = smooth curve,
         # Q = quadratic Bezier curve, T = smooth quadratic Bezier curve, A = elliptical Arc,Z = closepath
-        Attribs = {inkex.addNS('label', 'inkscape'): label, 'style': str(inkex.Style(lineStyle)),
-                   'd': 'm ' + str(offset[0]) + ' ' + str(offset[1]) + string_coords}
+        Attribs = {inkex.addNS('label', 'inkscape'): label, 'style': str(inkex.Style(lineStyle)), 'd': pathData(commands, precision)}
 
         return etree.SubElement(parent, inkex.addNS('path', 'svg'), Attribs)
 
@@ -1885,7 +3227,7 @@ class arc():
 
     @staticmethod
     def startEndRadius(parent, Pstart, Pend, radius, offset=[0, 0], label='arc', lineStyle=lineStyle.setSimpleBlack(), flagRightOf=True,
-                       arcType='open', largeArc=False):
+                       arcType='open', largeArc=False, precision=None):
         """Draw a circle arc from ``Pstart`` to ``Pend`` with a given radius
 
         .. image:: ../imagesDocs/arc_startEndRadius.png
@@ -1912,6 +3254,7 @@ class arc():
 
           - True: Draws the largest arc
           - False: Draws the smallest arc (Default)
+        :param precision: Number of decimal places of the coordinates. Default: None (uses ``pathPrecision``, defined at the beginning of this module)
 
         :type parent: inkscape element object
         :type Pstart: list
@@ -1923,6 +3266,7 @@ class arc():
         :type flagRightOf: bool
         :type arcType: string
         :type largeArc: bool
+        :type precision: int
 
         :returns: the new arc object
         :rtype: line Object
@@ -1951,12 +3295,12 @@ class arc():
         >>> inkDraw.arc.startEndRadius(parent=root_layer, Pstart=P1, Pend=P2, radius=R, offset=[0,0], label='arc',  lineStyle=myLineStyle, flagRightOf=True, largeArc=True)
         """
 
-        return ellipseArc.startEndRadius(parent, Pstart, Pend, radius, radius, offset, label, lineStyle,flagRightOf, arcType, largeArc)
+        return ellipseArc.startEndRadius(parent, Pstart, Pend, radius, radius, offset, label, lineStyle,flagRightOf, arcType, largeArc, precision)
 
     # ---------------------------------------------
     @staticmethod
     def centerAngStartAngEnd(parent, centerPoint, radius, angStart, angEnd, offset=[0, 0], label='arc', lineStyle=lineStyle.setSimpleBlack(),
-                             arcType='open', largeArc=False):
+                             arcType='open', largeArc=False, precision=None):
         """Draw a circle arc given its center and start and end angles
 
         .. image:: ../imagesDocs/arc_centerAngStartAngEnd.png
@@ -1979,6 +3323,7 @@ class arc():
 
           - True: Draws the largest arc
           - False: Draws the smallest arc (Default)
+        :param precision: Number of decimal places of the coordinates. Default: None (uses ``pathPrecision``, defined at the beginning of this module)
 
         :type parent: inkscape element object
         :type centerPoint: list
@@ -1990,6 +3335,7 @@ class arc():
         :type lineStyle: lineStyle object
         :type arcType: string
         :type largeArc: bool
+        :type precision: int
 
         :returns: the new arc object
         :rtype: line Object
@@ -2012,11 +3358,82 @@ class arc():
         >>>                                  offset=[30,0], label='arc1',  lineStyle=myLineStyle, arcType='open',largeArc=True)
         """
 
-        return ellipseArc.centerAngStartAngEnd(parent, centerPoint, radius, radius, angStart, angEnd, offset, label, lineStyle, arcType, largeArc)
+        return ellipseArc.centerAngStartAngEnd(parent, centerPoint, radius, radius, angStart, angEnd, offset, label, lineStyle, arcType, largeArc,
+                                               precision)
+
+    # ---------------------------------------------
+    @staticmethod
+    def concentric(parent, centerPoint, radiusList, angStart=0.0, angEnd=360.0, offset=[0, 0], label='arcs', lineStyle=lineStyle.setSimpleBlack(),
+                   precision=None):
+        """Draw a set of concentric circle arcs as a single path object, one subpath per arc.
+
+        Each arc goes from ``angStart`` to ``angEnd``, in the direction of increasing angles. If the difference between the angles is 360 degrees
+        or more, a full circle is drawn. This is much lighter than drawing one arc per radius, like the grid lines of polar plots.
+
+        :param parent: parent object
+        :param centerPoint: center coordinate [x,y]
+
+            .. warning:: Keep in mind  that Inkscape's y axis is upside down!
+
+        :param radiusList: list of radii, one per arc
+        :param angStart: Start angle in degrees. It can be a single value, used by all arcs, or a list with one angle per arc. Default: 0.0
+        :param angEnd: End angle in degrees. It can be a single value, used by all arcs, or a list with one angle per arc. Default: 360.0
+        :param offset: Extra offset coords [x,y]
+        :param label: Label of the line. Default 'arcs'
+        :param lineStyle: Line style to be used. See :class:`lineStyle` class. Default: lineStyle=lineStyle.setSimpleBlack()
+        :param precision: Number of decimal places of the coordinates. Default: None (uses ``pathPrecision``, defined at the beginning of this module)
+
+        :type parent: inkscape element object
+        :type centerPoint: list
+        :type radiusList: list
+        :type angStart: float or list
+        :type angEnd: float or list
+        :type offset: list
+        :type label: string
+        :type lineStyle: lineStyle object
+        :type precision: int
+
+        :returns: the new arc object
+        :rtype: line Object
+
+        **Example**
+
+        >>> root_layer = self.document.getroot()     # retrieves the root layer of the document
+        >>> myLineStyle = inkDraw.lineStyle.setSimpleBlack()
+        >>>
+        >>> # draws 4 concentric arcs, from -90 to 0 degrees, with radii 10, 20, 30 and 40
+        >>> inkDraw.arc.concentric(parent=root_layer, centerPoint=[0,0], radiusList=[10, 20, 30, 40], angStart=-90, angEnd=0,
+        >>>                        offset=[0,0], label='arcs',  lineStyle=myLineStyle)
+        >>> # draws 4 concentric circles
+        >>> inkDraw.arc.concentric(parent=root_layer, centerPoint=[0,0], radiusList=[10, 20, 30, 40], offset=[100,0])
+        """
+
+        radii = np.asarray(radiusList, dtype=float).ravel()
+        angStart = np.broadcast_to(np.asarray(angStart, dtype=float), radii.shape)
+        angEnd = np.broadcast_to(np.asarray(angEnd, dtype=float), radii.shape)
+        center = np.asarray(centerPoint, dtype=float) + np.asarray(offset, dtype=float)
+
+        # start and end points of all arcs at once
+        span = angEnd - angStart
+        Pstart = center + radii[:, None] * np.column_stack((np.cos(np.radians(angStart)), np.sin(np.radians(angStart))))
+        Pend = center + radii[:, None] * np.column_stack((np.cos(np.radians(angEnd)), np.sin(np.radians(angEnd))))
+
+        commands = []
+        for i, radius in enumerate(radii):
+            if abs(span[i]) >= 360:
+                commands += [['M', [center[0] + radius, center[1]]], ['A', [radius, radius, 0, 1, 1, center[0] - radius, center[1]]],
+                             ['A', [radius, radius, 0, 1, 1, center[0] + radius, center[1]]], ['Z', []]]
+            else:
+                commands += [['M', list(Pstart[i])], ['A', [radius, radius, 0, int(abs(span[i]) > 180), int(span[i] > 0)] + list(Pend[i])]]
+
+        # M = moveto,L = lineto,H = horizontal lineto,V = vertical lineto,C = curveto,S = smooth curveto,Q = quadratic Bezier curve,T = smooth quadratic Bezier curveto,A = elliptical Arc,Z = closepath
+        Attribs = {inkex.addNS('label', 'inkscape'): label, 'style': str(inkex.Style(lineStyle)), 'd': pathData(commands, precision)}
+
+        return etree.SubElement(parent, inkex.addNS('path', 'svg'), Attribs)
 
     # ---------------------------------------------
     @staticmethod
-    def threePoints(parent, Pstart, Pmid, Pend, offset=[0, 0], label='arc', lineStyle=lineStyle.setSimpleBlack(), arcType='open'):
+    def threePoints(parent, Pstart, Pmid, Pend, offset=[0, 0], label='arc', lineStyle=lineStyle.setSimpleBlack(), arcType='open', precision=None):
         """Draw a circle arc given 3 points
 
         .. image:: ../imagesDocs/arc_3points.png
@@ -2034,6 +3451,7 @@ class arc():
         :param label: Label of the line. Default 'arc'
         :param lineStyle: Line style to be used. See :class:`lineStyle` class. Default: lineStyle=lineStyle.setSimpleBlack()
         :param arcType: Type of arc. Valid values: 'open', 'slice', 'chord'. See image below. Default: 'open'
+        :param precision: Number of decimal places of the coordinates. Default: None (uses ``pathPrecision``, defined at the beginning of this module)
 
         :type parent: inkscape element object
         :type Pstart: list
@@ -2043,6 +3461,7 @@ class arc():
         :type label: string
         :type lineStyle: lineStyle object
         :type arcType: string
+        :type precision: int
 
         :returns: the new arc object
         :rtype: line Object
@@ -2093,9 +3512,9 @@ class arc():
         angEnd=angles[1]
 
         if angEnd - angStart>0:
-            return arc.centerAngStartAngEnd(parent, center, radius, angStart, angEnd, offset, label,lineStyle,arcType,largeArc)
+            return arc.centerAngStartAngEnd(parent, center, radius, angStart, angEnd, offset, label,lineStyle,arcType,largeArc, precision)
         else:
-            return arc.centerAngStartAngEnd(parent, center, radius, angEnd, angStart, offset, label,lineStyle,arcType,largeArc)
+            return arc.centerAngStartAngEnd(parent, center, radius, angEnd, angStart, offset, label,lineStyle,arcType,largeArc, precision)
 
 
 class circle():
@@ -2105,7 +3524,7 @@ class circle():
     """
 
     @staticmethod
-    def centerRadius(parent, centerPoint, radius, offset=[0, 0], label='circle', lineStyle=lineStyle.setSimpleBlack()):
+    def centerRadius(parent, centerPoint, radius, offset=[0, 0], label='circle', lineStyle=lineStyle.setSimpleBlack(), precision=None):
         """Draw a circle given its center point and radius
 
         :param parent: Parent object
@@ -2117,6 +3536,7 @@ class circle():
         :param offset: Extra offset coords [x,y]
         :param label: Label of the line. Default 'circle'
         :param lineStyle: Line style to be used. See :class:`lineStyle` class. Default: lineStyle=lineStyle.setSimpleBlack()
+        :param precision: Number of decimal places of the coordinates. Default: None (uses ``pathPrecision``, defined at the beginning of this module)
 
         :type parent: inkscape element object
         :type centerPoint: list
@@ -2124,6 +3544,7 @@ class circle():
         :type offset: list
         :type label: string
         :type lineStyle: lineStyle object
+        :type precision: int
 
         :returns: the new circle object
         :rtype: line Object
@@ -2137,22 +3558,22 @@ class circle():
         """
 
         # arc instructions
-        arcStringA = ' a %f,%f 0 1 1 %f,%f' % (radius, radius, -2 * radius, 0)
-        arcStringB = ' a %f,%f 0 1 1 %f,%f' % (radius, radius, 2 * radius, 0)
+        commands = [['M', [centerPoint[0] + offset[0] + radius, centerPoint[1] + offset[1]]],
+                    ['A', [radius, radius, 0, 1, 1, centerPoint[0] + offset[0] - radius, centerPoint[1] + offset[1]]],
+                    ['A', [radius, radius, 0, 1, 1, centerPoint[0] + offset[0] + radius, centerPoint[1] + offset[1]]], ['Z', []]]
 
         # M = moveto,L = lineto,H = horizontal lineto,V = vertical lineto,C = curveto,S = smooth curveto,Q = quadratic Bezier curve,T = smooth quadratic Bezier curveto,A = elliptical Arc,Z = closepath
         Attribs = {inkex.addNS('label', 'inkscape'): label, 'style': str(inkex.Style(lineStyle)), inkex.addNS('type', 'sodipodi'): 'arc',
                    inkex.addNS('rx', 'sodipodi'): str(radius), inkex.addNS('ry', 'sodipodi'): str(radius),
                    inkex.addNS('cx', 'sodipodi'): str(centerPoint[0] + offset[0]), inkex.addNS('cy', 'sodipodi'): str(centerPoint[1] + offset[1]),
                    inkex.addNS('start', 'sodipodi'): '0', inkex.addNS('end', 'sodipodi'): str(2 * math.pi),
-                   'd': 'M ' + str(centerPoint[0] + offset[0] + radius) + ' ' + str(
-                       centerPoint[1] + offset[1]) + arcStringA + ' ' + arcStringB + ' z'}
+                   'd': pathData(commands, precision)}
 
         return etree.SubElement(parent, inkex.addNS('path', 'svg'), Attribs)
 
     # ---------------------------------------------
     @staticmethod
-    def threePoints(parent, P1, P2, P3, offset=[0, 0], label='circle', lineStyle=lineStyle.setSimpleBlack()):
+    def threePoints(parent, P1, P2, P3, offset=[0, 0], label='circle', lineStyle=lineStyle.setSimpleBlack(), precision=None):
         """Draw a circle given 3 poins on the circle.
 
         The function checks if the 3 points are aligned. In this case, no circle is drawn.
@@ -2167,6 +3588,7 @@ class circle():
         :param offset: Extra offset coords [x,y]
         :param label: Label of the line. Default 'arc'
         :param lineStyle: Line style to be used. See :class:`lineStyle` class. Default: lineStyle=lineStyle.setSimpleBlack()
+        :param precision: Number of decimal places of the coordinates. Default: None (uses ``pathPrecision``, defined at the beginning of this module)
 
         :type parent: inkscape element object
         :type P1: list
@@ -2175,6 +3597,7 @@ class circle():
         :type offset: list
         :type label: string
         :type lineStyle: lineStyle object
+        :type precision: int
 
         :returns: the new circle object
         :rtype: line Object
@@ -2193,7 +3616,7 @@ class circle():
 
         [center,radius] = circle3Points(P1, P2, P3)
 
-        return circle.centerRadius(parent, center, radius, offset, label, lineStyle)
+        return circle.centerRadius(parent, center, radius, offset, label, lineStyle, precision)
 
 class rectangle():
     """ Class with methods for drawing rectangles.
@@ -2203,7 +3626,7 @@ class rectangle():
 
     @staticmethod
     def widthHeightCenter(parent, centerPoint, width, height, radiusX=None, radiusY=None, offset=[0, 0], label='rectangle',
-                          lineStyle=lineStyle.setSimpleBlack()):
+                          lineStyle=lineStyle.setSimpleBlack(), precision=None):
         """Draw a rectangle given its center point and dimensions
 
         :param parent: Parent object
@@ -2220,6 +3643,7 @@ class rectangle():
         :param offset: Extra offset coords [x,y]
         :param label: Label of the line. Default 'circle'
         :param lineStyle: Line style to be used. See :class:`lineStyle` class. Default: lineStyle=lineStyle.setSimpleBlack()
+        :param precision: Number of decimal places of the coordinates. Default: None (uses ``pathPrecision``, defined at the beginning of this module)
 
         :type parent: inkscape element object
         :type centerPoint: list
@@ -2230,6 +3654,7 @@ class rectangle():
         :type offset: list
         :type label: string
         :type lineStyle: lineStyle object
+        :type precision: int
 
         :returns: the new rectangle object
         :rtype: rectangle Object
@@ -2245,8 +3670,9 @@ class rectangle():
         x = centerPoint[0] - width / 2.0 + offset[0]
         y = centerPoint[1] - height / 2.0 + offset[1]
 
-        Attribs = {inkex.addNS('label', 'inkscape'): label, 'style': str(inkex.Style(lineStyle)), 'width': str(width), 'height': str(height),
-                   'x': str(x), 'y': str(y), 'rx': str(radiusX), 'ry': str(radiusY)}
+        Attribs = {inkex.addNS('label', 'inkscape'): label, 'style': str(inkex.Style(lineStyle)), 'width': formatNumber(width, precision),
+                   'height': formatNumber(height, precision), 'x': formatNumber(x, precision), 'y': formatNumber(y, precision), 'rx': str(radiusX),
+                   'ry': str(radiusY)}
 
         if radiusX and radiusX > 0.0:
             Attribs['rx'] = str(radiusX)
@@ -2259,7 +3685,8 @@ class rectangle():
         return etree.SubElement(parent, inkex.addNS('rect', 'svg'), Attribs)
 
     @staticmethod
-    def corners(parent, corner1, corner2, radiusX=None, radiusY=None, offset=[0, 0], label='rectangle', lineStyle=lineStyle.setSimpleBlack()):
+    def corners(parent, corner1, corner2, radiusX=None, radiusY=None, offset=[0, 0], label='rectangle', lineStyle=lineStyle.setSimpleBlack(),
+                precision=None):
         """Draw a rectangle given the coordinates of two oposite corners
 
         :param parent: Parent object
@@ -2273,6 +3700,7 @@ class rectangle():
         :param offset: Extra offset coords [x,y]
         :param label: Label of the line. Default 'circle'
         :param lineStyle: Line style to be used. See :class:`lineStyle` class. Default: lineStyle=lineStyle.setSimpleBlack()
+        :param precision: Number of decimal places of the coordinates. Default: None (uses ``pathPrecision``, defined at the beginning of this module)
 
         :type parent: inkscape element object
         :type corner1: list
@@ -2282,6 +3710,7 @@ class rectangle():
         :type offset: list
         :type label: string
         :type lineStyle: lineStyle object
+        :type precision: int
 
         :returns: the new rectangle object
         :rtype: rectangle Object
@@ -2300,7 +3729,7 @@ class rectangle():
         width = abs(corner1[0] - corner2[0])
         height = abs(corner1[1] - corner2[1])
 
-        return rectangle.widthHeightCenter(parent, [x, y], width, height, radiusX, radiusY, offset, label, lineStyle)
+        return rectangle.widthHeightCenter(parent, [x, y], width, height, radiusX, radiusY, offset, label, lineStyle, precision)
 
 
 class ellipseArc():
@@ -2311,7 +3740,7 @@ class ellipseArc():
 
     @staticmethod
     def startEndRadius(parent, Pstart, Pend, radiusX=1.0, radiusY=2.0, offset=[0, 0], label='arc', lineStyle=lineStyle.setSimpleBlack(), flagRightOf=True,
-                       arcType='open', largeArc=False):
+                       arcType='open', largeArc=False, precision=None):
         """Draw an arc of ellipse, from ``Pstart`` to ``Pend`` with a given radiusX and radiusY
 
         .. image:: ../imagesDocs/ellipse_arc_startEndRadius.png
@@ -2339,6 +3768,7 @@ class ellipseArc():
 
           - True: Draws the largest arc
           - False: Draws the smallest arc (Default)
+        :param precision: Number of decimal places of the coordinates. Default: None (uses ``pathPrecision``, defined at the beginning of this module)
 
         :type parent: inkscape element object
         :type Pstart: list
@@ -2351,6 +3781,7 @@ class ellipseArc():
         :type flagRightOf: bool
         :type arcType: string
         :type largeArc: bool
+        :type precision: int
 
         :returns: the new arc object
         :rtype: line Object
@@ -2433,18 +3864,20 @@ class ellipseArc():
             sweepFlag = 0
         else:
             sweepFlag = 1
-        arcString = ' a %f,%f 0 %d %d %f,%f' % (radiusX, radiusY, largeArcFlag, sweepFlag, EndVector[0] - StartVector[0], EndVector[1] - StartVector[1])
+        commands = [['M', [Pstart[0] + offset[0], Pstart[1] + offset[1]]],
+                    ['A', [radiusX, radiusY, 0, largeArcFlag, sweepFlag, Pend[0] + offset[0], Pend[1] + offset[1]]]]
         if arcType.lower() == 'slice':
-            arcString = arcString + ' L ' + str(CenterPoint[0]*scaleX + offset[0]) + ' ' + str(CenterPoint[1]*scaleY + offset[1]) + ' z'
+            commands.append(['L', [CenterPoint[0] * scaleX + offset[0], CenterPoint[1] * scaleY + offset[1]]])
+            commands.append(['Z', []])
         if arcType.lower() == 'chord':
-            arcString = arcString + ' z'
+            commands.append(['Z', []])
 
         # M = moveto,L = lineto,H = horizontal lineto,V = vertical lineto,C = curveto,S = smooth curveto,Q = quadratic Bezier curve,T = smooth quadratic Bezier curveto,A = elliptical Arc,Z = closepath
         Attribs = {inkex.addNS('label', 'inkscape'): label, 'style': str(inkex.Style(lineStyle)), inkex.addNS('type', 'sodipodi'): 'arc',
                    inkex.addNS('rx', 'sodipodi'): str(radiusX), inkex.addNS('ry', 'sodipodi'): str(radiusY),
                    inkex.addNS('cx', 'sodipodi'): str(CenterPoint[0]*scaleX + offset[0]), inkex.addNS('cy', 'sodipodi'): str(CenterPoint[1]*scaleY + offset[1]),
                    inkex.addNS('start', 'sodipodi'): sodipodiAngleStart, inkex.addNS('end', 'sodipodi'): sodipodiAngleEnd,
-                   'd': 'M ' + str(offset[0] + StartVector[0]) + ' ' + str(offset[1] + StartVector[1]) + arcString}
+                   'd': pathData(commands, precision)}
         if arcType.lower() == 'open':
             Attribs[inkex.addNS('arc-type', 'sodipodi')] = 'arc'
         else:
@@ -2455,7 +3888,7 @@ class ellipseArc():
     # ---------------------------------------------
     @staticmethod
     def centerAngStartAngEnd(parent, centerPoint, radiusX, radiusY, angStart, angEnd, offset=[0, 0], label='arc', lineStyle=lineStyle.setSimpleBlack(),
-                             arcType='open', largeArc=False):
+                             arcType='open', largeArc=False, precision=None):
         """Draw an arc of ellipse given its center and start and end angles
 
         .. image:: ../imagesDocs/ellipse_arc_centerAngStartAngEnd.png
@@ -2479,6 +3912,7 @@ class ellipseArc():
 
           - True: Draws the largest arc
           - False: Draws the smallest arc (Default)
+        :param precision: Number of decimal places of the coordinates. Default: None (uses ``pathPrecision``, defined at the beginning of this module)
 
         :type parent: inkscape element object
         :type centerPoint: list
@@ -2491,6 +3925,7 @@ class ellipseArc():
         :type lineStyle: lineStyle object
         :type arcType: string
         :type largeArc: bool
+        :type precision: int
 
         :returns: the new arc object
         :rtype: line Object
@@ -2543,7 +3978,7 @@ class ellipseArc():
         else:
             flagRight = not largeArc
 
-        return ellipseArc.startEndRadius(parent, Pstart, Pend, radiusX, radiusY, pos, label, lineStyle, flagRight, arcType, largeArc)
+        return ellipseArc.startEndRadius(parent, Pstart, Pend, radiusX, radiusY, pos, label, lineStyle, flagRight, arcType, largeArc, precision)
 
 
 class ellipse():
@@ -2553,7 +3988,7 @@ class ellipse():
     """
 
     @staticmethod
-    def centerRadius(parent, centerPoint, radiusX, radiusY, offset=[0, 0], label='ellipse', lineStyle=lineStyle.setSimpleBlack()):
+    def centerRadius(parent, centerPoint, radiusX, radiusY, offset=[0, 0], label='ellipse', lineStyle=lineStyle.setSimpleBlack(), precision=None):
         """Draw an ellipse given its center point and radii
 
         :param parent: Parent object
@@ -2566,6 +4001,7 @@ class ellipse():
         :param offset: Extra offset coords [x,y]
         :param label: Label of the line. Default 'circle'
         :param lineStyle: Line style to be used. See :class:`lineStyle` class. Default: lineStyle=lineStyle.setSimpleBlack()
+        :param precision: Number of decimal places of the coordinates. Default: None (uses ``pathPrecision``, defined at the beginning of this module)
 
         :type parent: inkscape element object
         :type centerPoint: list
@@ -2574,6 +4010,7 @@ class ellipse():
         :type offset: list
         :type label: string
         :type lineStyle: lineStyle object
+        :type precision: int
 
         :returns: the new ellipse object
         :rtype: line Object
@@ -2588,15 +4025,15 @@ class ellipse():
         """
 
         # arc instructions
-        arcStringA = ' a %f,%f 0 1 1 %f,%f' % (radiusX, radiusY, -2 * radiusX, 0)
-        arcStringB = ' a %f,%f 0 1 1 %f,%f' % (radiusX, radiusY, 2 * radiusX, 0)
+        commands = [['M', [centerPoint[0] + offset[0] + radiusX, centerPoint[1] + offset[1]]],
+                    ['A', [radiusX, radiusY, 0, 1, 1, centerPoint[0] + offset[0] - radiusX, centerPoint[1] + offset[1]]],
+                    ['A', [radiusX, radiusY, 0, 1, 1, centerPoint[0] + offset[0] + radiusX, centerPoint[1] + offset[1]]], ['Z', []]]
 
         # M = moveto,L = lineto,H = horizontal lineto,V = vertical lineto,C = curveto,S = smooth curveto,Q = quadratic Bezier curve,T = smooth quadratic Bezier curveto,A = elliptical Arc,Z = closepath
         Attribs = {inkex.addNS('label', 'inkscape'): label, 'style': str(inkex.Style(lineStyle)), inkex.addNS('type', 'sodipodi'): 'arc',
                    inkex.addNS('rx', 'sodipodi'): str(radiusX), inkex.addNS('ry', 'sodipodi'): str(radiusY),
                    inkex.addNS('cx', 'sodipodi'): str(centerPoint[0] + offset[0]), inkex.addNS('cy', 'sodipodi'): str(centerPoint[1] + offset[1]),
                    inkex.addNS('start', 'sodipodi'): '0', inkex.addNS('end', 'sodipodi'): str(2 * math.pi),
-                   'd': 'M ' + str(centerPoint[0] + offset[0] + radiusX) + ' ' + str(
-                       centerPoint[1] + offset[1]) + arcStringA + ' ' + arcStringB + ' z'}
+                   'd': pathData(commands, precision)}
 
         return etree.SubElement(parent, inkex.addNS('path', 'svg'), Attribs)
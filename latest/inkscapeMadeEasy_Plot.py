@@ -22,11 +22,42 @@
 #
 # --------------------------------------------------------------------------------------
 
+import base64
+import itertools
 import math
+import struct
 import sys
+import zlib
+from copy import deepcopy
 
+import numpy as np
+from lxml import etree
+
+import inkex
 import inkscapeMadeEasy.inkscapeMadeEasy_Draw as inkDraw
 
+# draw all grid lines of the same style and all ticks of the axes as single path objects, instead of one object per line.
+# Can be overridden in each call of axis.cartesian() and axis.polar() with the argument 'mergeLines'
+mergeAxisLines = False
+
+# reuse axes already drawn with identical parameters, instead of drawing them again (useful for figures with many subplots sharing the same axes)
+#   False: always draw the axes (default)
+#   'copy': the axes are drawn only once. The other ones are deep copies of the first one, moved to their positions
+#   'symbol': the axes are drawn only once, inside a <symbol> element in <defs>. Each axis is a <use> element pointing to this symbol
+# Can be overridden in each call of axis.cartesian() with the argument 'cache'
+cacheAxes = False
+
+# maximum number of ticks of a linear axis. If the tick step results in more ticks, ticks and grid lines are drawn only at multiples (2, 5, 10, 20,
+# 50, ... times) of the tick step, within this limit. The scale of the axis does not change
+maxAxisTicks = 100
+
+# color maps of plot.image(): lists of colors [R,G,B] (0-255) equally spaced between the minimum and maximum values
+colorMaps = {'gray': [[0, 0, 0], [255, 255, 255]],
+             'hot': [[0, 0, 0], [230, 0, 0], [255, 210, 0], [255, 255, 255]],
+             'jet': [[0, 0, 128], [0, 0, 255], [0, 255, 255], [255, 255, 0], [255, 0, 0], [128, 0, 0]],
+             'viridis': [[68, 1, 84], [59, 82, 139], [33, 145, 140], [94, 201, 98], [253, 231, 37]],
+             'coolwarm': [[59, 76, 192], [221, 221, 221], [180, 4, 38]]}
+
 
 def displayMsg(msg):
     """Display a message to the user.
@@ -72,24 +103,98 @@ def Dump(obj, file='./dump_file.txt', mode='w'):
         file.write(str(obj) + '\n')
 
 
-def generateListOfTicksLinear(axisLimits, axisOrigin, tickStep):
-    """Defines list of ticks in a linear plot
+def addAxisLine(parent, segment, lineStyle, mergedLines):
+    """Draw a line segment of the axis, or append it to the list mergedLines, to be drawn later with other segments in a single path.
+    If mergedLines is None, the segment is drawn.
 
     .. note:: Internal function.
     """
+    if mergedLines is None:
+        inkDraw.line.absCoords(parent, segment, [0, 0], lineStyle=lineStyle)
+    else:
+        mergedLines.append(segment)
 
-    # make the list of ticks, symmetrically to the origin
-    listTicksPositive = [axisOrigin]
-    while listTicksPositive[-1] < axisLimits[1]:
-        listTicksPositive.append(listTicksPositive[-1] + tickStep)
 
-    listTicksNegative = [axisOrigin]
+def axisTemplateKey(parameters):
+    """Return the key of an axis template, normalizing the parameters of the axis: numbers are converted to float and tuples to lists.
+    The key also includes the module options that change the drawing of the axis.
 
-    while listTicksNegative[-1] > axisLimits[0]:
-        listTicksNegative.append(listTicksNegative[-1] - tickStep)
+    .. note:: Internal function.
+    """
 
-    listTicks = listTicksPositive + listTicksNegative[1:]
-    return listTicks
+    def normalize(value):
+        if isinstance(value, (list, tuple, np.ndarray)):
+            return [normalize(v) for v in value]
+        if isinstance(value, (bool, str)) or value is None:
+            return value
+        return float(value)
+
+    return repr([normalize(parameters), inkDraw.useLatex, inkDraw.latexConverter, inkDraw.pathPrecision, inkDraw.compactPaths])
+
+
+def axisFromTemplate(ExtensionBaseObj, parent, position, template, useSymbol):
+    """Create an axis from the template [GroupTemplate, outputLimits, axisOrigin, symbolId] drawn at the position [0,0]. The new axis is a deep
+    copy of GroupTemplate or, if useSymbol is True, a <use> element pointing to a <symbol> with the contents of the template, created in the first
+    call. Returns [GroupPlot, outputLimits, axisOrigin], like axis.cartesian().
+
+    .. note:: Internal function.
+    """
+    [GroupTemplate, templateLimits, axisOrigin, symbolId] = template
+
+    if useSymbol:
+        if symbolId is None:
+            symbolId = ExtensionBaseObj.uniqueIdNumber('axisTemplate')
+            # overflow must be visible because the axis is not entirely in the positive quadrant
+            symbol = etree.SubElement(ExtensionBaseObj.getDefinitions(), inkex.addNS('symbol', 'svg'), {'id': symbolId, 'style': 'overflow:visible'})
+            symbol.append(deepcopy(GroupTemplate))
+            template[3] = symbolId
+        GroupPlot = ExtensionBaseObj.createGroup(parent, 'Plot')
+        etree.SubElement(GroupPlot, inkex.addNS('use', 'svg'), {inkex.addNS('href', 'xlink'): '#' + symbolId})
+        ExtensionBaseObj.moveElement(GroupPlot, position)
+    else:
+        GroupPlot = ExtensionBaseObj.copyElement(GroupTemplate, parent, distance=position)
+
+    offsets = [position[0], position[0], position[1], position[1]]
+    outputLimits = [(value, posValue + offset) for [(value, posValue), offset] in zip(templateLimits, offsets)]
+
+    return [GroupPlot, outputLimits, list(axisOrigin)]
+
+
+def coarseTickStep(axisLimits, tickStep, maxTicks):
+    """Return the smallest multiple (1, 2, 5, 10, 20, 50, ... times) of tickStep that results in at most maxTicks ticks within axisLimits.
+
+    .. note:: Internal function.
+    """
+    nSteps = abs(axisLimits[1] - axisLimits[0]) / tickStep
+    if nSteps + 1 <= maxTicks:
+        return tickStep
+    return tickStep * axis.niceTickStep([0.0, nSteps], max(maxTicks - 1, 1))
+
+
+def generateListOfTicksLinear(axisLimits, axisOrigin, tickStep):
+    """Defines list of ticks in a linear plot, symmetrically to the origin: the origin, the ticks above it in increasing order, up to the first one
+    larger than or equal to axisLimits[1], and then the ticks below it in decreasing order, down to the first one smaller than or equal to
+    axisLimits[0]. The number of ticks is limited by ``maxAxisTicks``, see :func:`coarseTickStep`.
+
+    Ticks are integer multiples of the step, counted from the origin, therefore rounding errors do not accumulate. Ticks closer than 1e-9 steps
+    to the limits are set exactly to the limits, so they are not discarded by comparisons with the limits.
+
+    .. note:: Internal function.
+    """
+    tickStep = coarseTickStep(axisLimits, tickStep, maxAxisTicks)
+
+    tolerance = 1.0e-9
+    nPositive = max(int(math.ceil((axisLimits[1] - axisOrigin) / tickStep - tolerance)), 0)
+    nNegative = max(int(math.ceil((axisOrigin - axisLimits[0]) / tickStep - tolerance)), 0)
+    multiples = np.concatenate((np.arange(0, nPositive + 1), -np.arange(1, nNegative + 1)))
+
+    # rounding removes the error of the product, like 3*0.1=0.30000000000000004
+    decimals = max(0, 10 - int(math.floor(math.log10(tickStep))))
+    listTicks = axisOrigin + np.round(multiples * tickStep, decimals)
+    for limit in axisLimits:
+        listTicks[np.abs(listTicks - limit) < tolerance * tickStep] = limit
+
+    return listTicks.tolist()
 
 
 def generateListOfTicksLog10(axisLimits):
@@ -170,6 +275,595 @@ def getPositionAndText(value, scale, flagLog10, axisUnitFactor):
     return [pos, Text]
 
 
+def clipPolyline(xData, yData, xLimits, yLimits):
+    """Clip a polyline against a rectangular window, using Liang-Barsky algorithm for all segments at once.
+
+    Segments crossing the border of the window are cut at the exact intersection points. Parts of the polyline outside the window are replaced
+    by NaN, splitting the polyline in subpaths. NaN values in the input are kept as gaps.
+
+    :param xData: x coordinates of the points
+    :param yData: y coordinates of the points
+    :param xLimits: [xMin, xMax] of the window
+    :param yLimits: [yMin, yMax] of the window
+
+    :returns: [xData, yData] clipped
+    :rtype: list of numpy arrays
+
+    .. note:: Internal function.
+    """
+    xData = np.asarray(xData, dtype=float)
+    yData = np.asarray(yData, dtype=float)
+    if len(xData) < 2:
+        inside = (xData >= xLimits[0]) & (xData <= xLimits[1]) & (yData >= yLimits[0]) & (yData <= yLimits[1])
+        return [xData[inside], yData[inside]]
+
+    x0 = xData[:-1]
+    y0 = yData[:-1]
+    dx = np.diff(xData)
+    dy = np.diff(yData)
+
+    # segment i is P(t) = P0 + t*d, 0 <= t <= 1. Each border of the window limits t where p*t <= q
+    p = np.array([-dx, dx, -dy, dy])
+    q = np.array([x0 - xLimits[0], xLimits[1] - x0, y0 - yLimits[0], yLimits[1] - y0])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = q / p
+    tStart = np.maximum(0.0, np.max(np.where(p < 0, ratio, -np.inf), axis=0))
+    tEnd = np.minimum(1.0, np.min(np.where(p > 0, ratio, np.inf), axis=0))
+
+    # segments parallel to a border and outside the window, or with NaN, are not visible
+    visible = (tStart < tEnd) & ~np.any((p == 0) & (q < 0), axis=0) & ~np.isnan(dx + dy)
+
+    # a visible segment starts a new subpath if it is not connected to the previous visible segment
+    connected = np.concatenate(([False], visible[:-1] & (tEnd[:-1] == 1.0))) & (tStart == 0.0)
+    newSubpath = visible & ~connected
+
+    # each segment contributes with [NaN, start point, end point]. The first two only if it starts a new subpath
+    points = np.empty((len(dx), 3, 2))
+    points[:, 0] = np.nan
+    points[:, 1, 0] = x0 + tStart * dx
+    points[:, 1, 1] = y0 + tStart * dy
+    points[:, 2, 0] = x0 + tEnd * dx
+    points[:, 2, 1] = y0 + tEnd * dy
+    points = points[np.column_stack((newSubpath, newSubpath, visible))]
+
+    return [points[:, 0], points[:, 1]]
+
+
+def invalidPointsSummary(xData, yData, invalidMasks):
+    """Count the invalid data points for each reason.
+
+    :param invalidMasks: list of [mask, reason], where mask is a boolean numpy array with the invalid points and reason is a string completing
+        the error message, like 'too large'.
+
+    :returns: list of [nInvalid, firstInvalidPoint, reason]. firstInvalidPoint is None if there is no invalid point.
+
+    .. note:: Internal function.
+    """
+    summary = []
+    for [invalid, reason] in invalidMasks:
+        nInvalid = int(np.count_nonzero(invalid))
+        if nInvalid == 0:
+            summary.append([0, None, reason])
+        else:
+            i = np.flatnonzero(invalid)[0]
+            summary.append([nInvalid, [xData[i], yData[i]], reason])
+    return summary
+
+
+def addInvalidPointsSummary(summary, newSummary):
+    """Add the counts of newSummary to summary, keeping the first invalid point found. See :func:`invalidPointsSummary`
+
+    :returns: the summary with the total counts. If summary is None, returns newSummary.
+
+    .. note:: Internal function.
+    """
+    if summary is None:
+        return newSummary
+    for [total, partial] in zip(summary, newSummary):
+        total[0] += partial[0]
+        if total[1] is None:
+            total[1] = partial[1]
+    return summary
+
+
+def reportInvalidPoints(ExtensionBaseObj, parent, xData, yData, invalidMasks, position, textSize):
+    """Write error messages alongside the plot with the number of ignored data points, one message for each reason.
+
+    :param invalidMasks: list of [mask, reason], where mask is a boolean numpy array with the invalid points and reason is a string completing
+        the message, like 'too large'.
+
+    .. note:: Internal function.
+    """
+    writeInvalidPointsMessages(ExtensionBaseObj, parent, invalidPointsSummary(xData, yData, invalidMasks), position, textSize)
+
+
+def writeInvalidPointsMessages(ExtensionBaseObj, parent, summary, position, textSize):
+    """Write the error messages of a summary of invalid points. See :func:`invalidPointsSummary`
+
+    .. note:: Internal function.
+    """
+    nMessages = 0
+    for [nInvalid, point, reason] in summary:
+        if nInvalid == 0:
+            continue
+        if nInvalid == 1:
+            message = 'Error: The point (%f,%f)\n is %s. Ignoring it...' % (point[0], point[1], reason)
+        else:
+            message = 'Error: %d points, like (%f,%f),\n are %s. Ignoring them...' % (nInvalid, point[0], point[1], reason)
+        inkDraw.text.write(ExtensionBaseObj, message, [position[0], position[1] + (2 + nMessages) * textSize], parent, fontSize=textSize / 2.0)
+        nMessages += 1
+
+    if nMessages > 0:
+        inkDraw.text.write(ExtensionBaseObj, '       Please check your graph', [position[0], position[1] + (1.5 + nMessages) * textSize], parent,
+                           fontSize=textSize / 2.0)
+
+
+def dataChunks(source, columns=[0, 1], chunkSize=1000000, delimiter=',', skipRows=0):
+    """Read x and y data in chunks, keeping a limited amount of data in memory.
+
+    :param source: data source. It can be
+
+            - the path of a ``.npy`` file, with a 2D array. It is memory mapped
+            - the path of a text file, like ``.csv``, with one point per line. It is read in chunks of lines
+            - a numpy array, including memory mapped arrays, with shape (N,M)
+            - an iterator of chunks. Each chunk is either a numpy array with shape (N,M) or a pair [xChunk, yChunk]
+
+    :param columns: indexes of the columns with x and y data. Default: [0, 1]
+    :param chunkSize: number of lines of each chunk. Default: 1000000
+    :param delimiter: delimiter of the columns of text files. Default: ','
+    :param skipRows: number of lines to skip at the beginning of text files, like headers. Default: 0
+
+    :returns: iterator of [xChunk, yChunk], numpy arrays
+
+    .. note:: Internal function.
+    """
+    if isinstance(source, str) and source.lower().endswith('.npy'):
+        source = np.load(source, mmap_mode='r')
+
+    if isinstance(source, np.ndarray):
+        for start in range(0, len(source), chunkSize):
+            chunk = np.asarray(source[start:start + chunkSize, columns], dtype=float)
+            yield [chunk[:, 0], chunk[:, 1]]
+        return
+
+    if isinstance(source, str):
+        with open(source, 'r') as file:
+            lines = itertools.islice(file, skipRows, None)
+            while True:
+                chunkLines = list(itertools.islice(lines, chunkSize))
+                if not chunkLines:
+                    return
+                chunk = np.loadtxt(chunkLines, delimiter=delimiter, usecols=columns, ndmin=2)
+                yield [chunk[:, 0], chunk[:, 1]]
+
+    for chunk in source:
+        if isinstance(chunk, (list, tuple)) and len(chunk) == 2:
+            yield [np.asarray(chunk[0], dtype=float), np.asarray(chunk[1], dtype=float)]
+        else:
+            chunk = np.asarray(chunk, dtype=float)[:, columns]
+            yield [chunk[:, 0], chunk[:, 1]]
+
+
+def invalidCartesianMasks(xData, yData, xlog10scale, ylog10scale):
+    """Find the invalid pairs of coordinates of a cartesian plot: less than or equal to 0.0 for log scale and larger than +-10k for linear scale.
+    NaN values are not invalid, since they represent gaps in the data.
+
+    :returns: list of [mask, reason]. See :func:`invalidPointsSummary`
+
+    .. note:: Internal function.
+    """
+    invalidLog = np.zeros(len(xData), dtype=bool)
+    invalidLarge = np.zeros(len(xData), dtype=bool)
+    for [data, log10scale] in [[xData, xlog10scale], [yData, ylog10scale]]:
+        if log10scale:
+            invalidLog |= data <= 0.0
+        else:
+            invalidLarge |= np.abs(data) > 1.0e4
+
+    return [[invalidLog, 'invalid in logarithmic scale'], [invalidLarge & ~invalidLog, 'too large']]
+
+
+def cartesianStreamLimits(chunks, xlog10scale, ylog10scale):
+    """Find the limits of the valid data of chunks [xChunk, yChunk] and count their invalid points. See :func:`invalidCartesianMasks`
+
+    :returns: [Xlimits, Ylimits, summary]. Limits are [inf, -inf] if there is no valid point. See :func:`invalidPointsSummary`
+
+    .. note:: Internal function.
+    """
+    Xlimits = [np.inf, -np.inf]
+    Ylimits = [np.inf, -np.inf]
+    summary = None
+    for [xData, yData] in chunks:
+        invalidMasks = invalidCartesianMasks(xData, yData, xlog10scale, ylog10scale)
+        summary = addInvalidPointsSummary(summary, invalidPointsSummary(xData, yData, invalidMasks))
+
+        valid = ~(invalidMasks[0][0] | invalidMasks[1][0] | np.isnan(xData) | np.isnan(yData))
+        if np.any(valid):
+            Xlimits = [min(Xlimits[0], float(np.min(xData[valid]))), max(Xlimits[1], float(np.max(xData[valid])))]
+            Ylimits = [min(Ylimits[0], float(np.min(yData[valid]))), max(Ylimits[1], float(np.max(yData[valid])))]
+
+    return [Xlimits, Ylimits, summary]
+
+
+def scaleCartesianData(xData, yData, xlog10scale, ylog10scale, xScale, yScale, xTickStep, yTickStep, origin=[0.0, 0.0]):
+    """Scale the data of a cartesian plot to svg units and convert to logarithmic scale if needed. The origin point of the axis is subtracted.
+
+    .. note:: Internal function.
+    """
+    if xlog10scale:
+        xData = np.log10(xData) * xScale - origin[0]
+    else:
+        xData = np.asarray(xData) * (xScale / xTickStep) - origin[0]
+
+    if ylog10scale:
+        yData = -np.log10(yData) * yScale - origin[1]  # negative bc inkscape is upside down
+    else:
+        yData = -np.asarray(yData) * (yScale / yTickStep) - origin[1]  # negative bc inkscape is upside down
+
+    return [xData, yData]
+
+
+def drawCartesianData(ExtensionBaseObj, parent, xData, yData, position, limits, origin, xlog10scale, ylog10scale, xScale, yScale, xTickStep,
+                      yTickStep, lineStylePlot, clipData, decimate, simplify, fitTolerance, label='none'):
+    """Draw the line of a cartesian plot, given the data already scaled and relative to the origin of the axis. The data is clipped, decimated,
+    simplified and fitted, if requested, in this order.
+
+    .. note:: Internal function.
+    """
+    if clipData:
+        # limits of the axis, scaled like the data
+        [xLimitsAxis, yLimitsAxis] = scaleCartesianData(np.array([limits[0][0], limits[1][0]]), np.array([limits[2][0], limits[3][0]]), xlog10scale,
+                                                        ylog10scale, xScale, yScale, xTickStep, yTickStep, origin)
+        [xData, yData] = clipPolyline(xData, yData, np.sort(xLimitsAxis), np.sort(yLimitsAxis))
+
+    if decimate is not None:
+        [xData, yData] = decimateM4(xData, yData, decimate)
+
+    return inkDraw.line.absCoords(parent, np.column_stack((xData, yData)), position, label, lineStyle=lineStylePlot, fitTolerance=fitTolerance,
+                                  simplify=simplify)
+
+
+def drawCartesianAxis(ExtensionBaseObj, parent, Xlimits, Ylimits, position, xLabel, yLabel, xlog10scale, ylog10scale, xTicks, yTicks, xTickStep,
+                      yTickStep, xScale, yScale, xExtraText, yExtraText, xGrid, yGrid, generalAspectFactorAxis, forceXlim, forceYlim, drawAxis,
+                      ExtraLengthAxisX, ExtraLengthAxisY):
+    """Draw the axis of a cartesian plot in a new group. The limits of the data are replaced by forceXlim and forceYlim, if given. Equal limits
+    are extended to include 0 or 1. Tick steps equal to None are computed from the limits.
+
+    :returns: [axisGroup, limits, origin, xTickStep, yTickStep], or 0 if the limits are invalid
+
+    .. note:: Internal function.
+    """
+    textSize = generalAspectFactorAxis * 0.25 * min(xScale, yScale)
+    lineWidthAxis = generalAspectFactorAxis * min(xScale, yScale) / 35.0
+
+    Xlimits = list(forceXlim if forceXlim is not None else Xlimits)
+    Ylimits = list(forceYlim if forceYlim is not None else Ylimits)
+
+    for limits in [Xlimits, Ylimits]:
+        if limits[0] == limits[1]:
+            if limits[0] > 0:
+                limits[0] = 0
+            if limits[0] == 0:
+                limits[1] = 1
+            if limits[0] < 0:
+                limits[1] = 0
+
+    # automatic tick steps
+    if xTickStep is None:
+        xTickStep = axis.niceTickStep(Xlimits)
+    if yTickStep is None:
+        yTickStep = axis.niceTickStep(Ylimits)
+
+    axisGroup = ExtensionBaseObj.createGroup(parent, 'PlotData')
+
+    axisData = axis.cartesian(ExtensionBaseObj, axisGroup, Xlimits, Ylimits, position, xLabel=xLabel, yLabel=yLabel, xlog10scale=xlog10scale,
+                              ylog10scale=ylog10scale, xTicks=xTicks, yTicks=yTicks, xTickStep=xTickStep, yTickStep=yTickStep, xScale=xScale,
+                              yScale=yScale, xAxisUnitFactor=xExtraText, yAxisUnitFactor=yExtraText, xGrid=xGrid, yGrid=yGrid, forceTextSize=textSize,
+                              forceLineWidth=lineWidthAxis, drawAxis=drawAxis, ExtraLengthAxisX=ExtraLengthAxisX, ExtraLengthAxisY=ExtraLengthAxisY)
+
+    # invalid limits, like the limits of a logarithmic axis extended to 0. The error has already been written
+    if axisData == 0:
+        parent.remove(axisGroup)
+        return 0
+    [axisObj, limits, origin] = axisData
+
+    return [axisGroup, limits, origin, xTickStep, yTickStep]
+
+
+def scatterUseElements(symbolId, coordsNP, precision):
+    """Return a group with one <use> element pointing to the symbol symbolId at each point of the numpy array coordsNP, with shape (N,2).
+
+    .. note:: Internal function.
+    """
+    useElements = ('<use xlink:href="#@" x="%%.%df" y="%%.%df"/>' % (precision, precision) * len(coordsNP)) % tuple(coordsNP.ravel().tolist())
+    if inkDraw.compactPaths:
+        useElements = inkDraw.compactNumbers(useElements)
+    xml = '<g xmlns="%s" xmlns:xlink="%s">' % (inkex.NSS['svg'], inkex.NSS['xlink']) + useElements.replace('#@', '#' + symbolId) + '</g>'
+    return etree.fromstring(xml)
+
+
+def scatterCirclesPathData(coordsNP, radius, precision):
+    """Return the path data of circles with the same radius, centered at the points of the numpy array coordsNP, with shape (N,2). Each circle
+    is a subpath with two relative arcs.
+
+    .. note:: Internal function.
+    """
+    coordsNP = coordsNP + [radius, 0.0]  # start point of each circle
+    r = inkDraw.formatNumber(radius, precision)
+    d = inkDraw.formatNumber(2 * radius, precision)
+    if inkDraw.compactPaths:
+        circle = 'M%%.%df %%.%dfa%s %s 0 1 1-%s 0 %s %s 0 1 1 %s 0z' % (precision, precision, r, r, d, r, r, d)
+        pathData = inkDraw.compactNumbers((circle * len(coordsNP)) % tuple(coordsNP.ravel().tolist()))
+        return pathData.replace(' -', '-')
+    circle = 'M %%.%df,%%.%df a %s,%s 0 1 1 -%s,0 a %s,%s 0 1 1 %s,0 z ' % (precision, precision, r, r, d, r, r, d)
+    return ((circle * len(coordsNP)) % tuple(coordsNP.ravel().tolist())).strip()
+
+
+def repeatedPathData(letters, columns, precision):
+    """Return the path data of a sequence of commands repeated N times, like the rectangles of bar plots (``MVHVZ``). The numbers of the
+    commands are taken from columns, a list of numpy arrays with N elements, in the order they are written. ``M`` takes two numbers, ``H`` and
+    ``V`` one number and ``Z`` none.
+
+    .. note:: Internal function.
+    """
+    numbers = np.round(np.column_stack(columns), precision) + 0.0  # +0.0 removes negative zeros
+    nNumbers = {'M': 2, 'H': 1, 'V': 1, 'Z': 0}
+    numberFormat = '%%.%df' % precision
+
+    if not inkDraw.compactPaths:
+        template = ' '.join([letter + ' ' + ','.join([numberFormat] * nNumbers[letter]) for letter in letters])
+        return ' '.join([template.replace(' ,', ' ').strip()] * len(numbers)) % tuple(numbers.ravel().tolist())
+
+    template = ''.join([letter + ' '.join([numberFormat] * nNumbers[letter]) for letter in letters]).replace('Z', 'z')
+    pathData = inkDraw.compactNumbers((template * len(numbers)) % tuple(numbers.ravel().tolist()))
+    return pathData.replace(' -', '-')
+
+
+def colorMapLUT(colorMap, nColors=256):
+    """Return the lookup table of a color map, a numpy array of uint8 with shape (nColors,3), interpolating its colors linearly.
+
+    :param colorMap: name of a color map of ``colorMaps`` or list of colors. Each color is a list [R,G,B] (0-255) or a string '#RRGGBB'
+
+    .. note:: Internal function.
+    """
+    if isinstance(colorMap, str):
+        colorMap = colorMaps[colorMap]
+
+    colors = []
+    for colorRGB in colorMap:
+        if isinstance(colorRGB, str):
+            colorRGB = [int(colorRGB[i:i + 2], 16) for i in [1, 3, 5]]
+        colors.append(colorRGB)
+    colors = np.asarray(colors, dtype=float)
+
+    positions = np.linspace(0.0, 1.0, len(colors))
+    samples = np.linspace(0.0, 1.0, nColors)
+    channels = [np.interp(samples, positions, colors[:, i]) for i in range(3)]
+    return np.round(np.column_stack(channels)).astype(np.uint8)
+
+
+def pngData(pixels):
+    """Encode an image as PNG, using zlib only. pixels is a numpy array of uint8 with shape (nRows, nColumns, 4), with RGBA values. The first row
+    is the top of the image.
+
+    .. note:: Internal function.
+    """
+    [nRows, nColumns] = pixels.shape[:2]
+
+    def chunk(chunkType, data):
+        return struct.pack('>I', len(data)) + chunkType + data + struct.pack('>I', zlib.crc32(chunkType + data) & 0xffffffff)
+
+    # each row starts with the filter type 0 (none)
+    rows = np.hstack((np.zeros((nRows, 1), dtype=np.uint8), pixels.reshape(nRows, nColumns * 4)))
+    header = struct.pack('>IIBBBBB', nColumns, nRows, 8, 6, 0, 0, 0)  # 8 bits per channel, color type 6 (RGBA)
+
+    return b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', header) + chunk(b'IDAT', zlib.compress(rows.tobytes(), 6)) + chunk(b'IEND', b'')
+
+
+def marchingSquares(Z, level):
+    """Find the segments of the isoline of a level in a 2D array, with marching squares.
+
+    Each cell has corners Z[i,j] (a), Z[i,j+1] (b), Z[i+1,j+1] (c) and Z[i+1,j] (d). Points are given in units of columns (x) and rows (y).
+    Cells with NaN values are ignored. Saddle cells are resolved with the mean value of the corners.
+
+    :returns: [startIds, endIds, startPoints, endPoints]. Ids identify the edge of the grid where each point is, therefore segments of adjacent
+        cells with the same point share the same id. Points are numpy arrays with shape (N,2).
+
+    .. note:: Internal function.
+    """
+    [nRows, nColumns] = Z.shape
+    above = np.nan_to_num(Z, nan=-np.inf) > level
+    cases = above[:-1, :-1] * 1 + above[:-1, 1:] * 2 + above[1:, 1:] * 4 + above[1:, :-1] * 8
+    validCells = np.isfinite(Z[:-1, :-1]) & np.isfinite(Z[:-1, 1:]) & np.isfinite(Z[1:, 1:]) & np.isfinite(Z[1:, :-1])
+    [i, j] = np.nonzero(validCells & (cases != 0) & (cases != 15))
+    cases = cases[i, j]
+    [a, b, c, d] = [Z[i, j], Z[i, j + 1], Z[i + 1, j + 1], Z[i + 1, j]]
+
+    # crossing points and ids of the 4 edges of each cell: 0 bottom (a-b), 1 right (b-c), 2 top (d-c), 3 left (a-d)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        edgePoints = np.stack((np.column_stack((j + (level - a) / (b - a), i)), np.column_stack((j + 1, i + (level - b) / (c - b))),
+                               np.column_stack((j + (level - d) / (c - d), i + 1)), np.column_stack((j, i + (level - a) / (d - a)))))
+    edgeIds = np.stack((2 * (i * nColumns + j), 2 * (i * nColumns + j + 1) + 1, 2 * ((i + 1) * nColumns + j), 2 * (i * nColumns + j) + 1))
+
+    # edges of the segment of each case. Saddle cases (5 and 10) have two segments
+    edgeStart = np.array([0, 0, 0, 3, 1, 0, 0, 3, 3, 0, 0, 1, 3, 0, 0, 0])[cases]
+    edgeEnd = np.array([0, 3, 1, 1, 2, 3, 2, 2, 2, 2, 3, 2, 1, 1, 3, 0])[cases]
+    saddle = (cases == 5) | (cases == 10)
+    # edges (0,1) and (2,3) isolate the corners b and d. Edges (0,3) and (1,2) isolate the corners a and c
+    isolateBD = saddle & ((cases == 5) == ((a + b + c + d) / 4.0 > level))
+    edgeEnd[isolateBD] = 1
+    edgeStart = np.concatenate((edgeStart, np.where(isolateBD, 2, 1)[saddle]))
+    edgeEnd = np.concatenate((edgeEnd, np.where(isolateBD, 3, 2)[saddle]))
+    cellIndexes = np.concatenate((np.arange(len(cases)), np.flatnonzero(saddle)))
+
+    return [edgeIds[edgeStart, cellIndexes], edgeIds[edgeEnd, cellIndexes], edgePoints[edgeStart, cellIndexes], edgePoints[edgeEnd, cellIndexes]]
+
+
+def stitchSegments(startIds, endIds, startPoints, endPoints):
+    """Join segments sharing endpoints into polylines, using a hash map of the endpoint ids. See :func:`marchingSquares`
+
+    :returns: numpy array with shape (N,2) with the points of all polylines, separated by rows of NaN. Closed polylines end at their first point.
+
+    .. note:: Internal function.
+    """
+    startIds = startIds.tolist()
+    endIds = endIds.tolist()
+    points = dict(zip(startIds + endIds, np.concatenate((startPoints, endPoints)).tolist()))
+
+    segmentsOfPoint = {}
+    for k, [startId, endId] in enumerate(zip(startIds, endIds)):
+        segmentsOfPoint.setdefault(startId, []).append(k)
+        segmentsOfPoint.setdefault(endId, []).append(k)
+
+    used = [False] * len(startIds)
+
+    def walk(pointId):
+        chain = [points[pointId]]
+        while True:
+            nextSegments = [k for k in segmentsOfPoint[pointId] if not used[k]]
+            if not nextSegments:
+                return chain
+            k = nextSegments[0]
+            used[k] = True
+            pointId = endIds[k] if startIds[k] == pointId else startIds[k]
+            chain.append(points[pointId])
+
+    # open polylines start at points with a single segment. The remaining segments form closed polylines
+    polylines = [walk(pointId) for pointId, segments in segmentsOfPoint.items() if len(segments) == 1 and not used[segments[0]]]
+    polylines += [walk(startIds[k]) for k in range(len(startIds)) if not used[k]]
+
+    coords = []
+    for polyline in polylines:
+        coords += polyline + [[np.nan, np.nan]]
+    return np.array(coords[:-1], dtype=float).reshape(-1, 2)
+
+
+def decimateM4(xData, yData, columnWidth, xOrigin=None):
+    """M4 decimation of a time series: splits the x axis in columns of a given width and keeps only the first, last, minimum and maximum
+    samples of each column, in their original order. The result is visually identical to the original data at the resolution of the columns.
+
+    Columns are formed by consecutive samples, therefore xData is expected to be sorted.
+    Samples with NaN in xData or yData are gaps in the data: they split the columns and the first and last samples of each gap are kept.
+
+    Columns start at xOrigin. Default: None (minimum of xData). Use a fixed value to decimate a long data set in chunks with the same columns.
+
+    .. note:: Internal function.
+    """
+    xData = np.asarray(xData, dtype=float)
+    yData = np.asarray(yData, dtype=float)
+    if len(xData) <= 4:
+        return [xData, yData]
+
+    if xOrigin is None:
+        xOrigin = np.nanmin(xData)
+
+    # a new group starts at each new column and at the beginning and end of each gap. Therefore groups with valid samples have no NaN
+    column = np.floor((xData - xOrigin) / columnWidth)
+    gap = np.isnan(xData) | np.isnan(yData)
+    newGroup = ((np.diff(column) != 0) & ~(gap[1:] & gap[:-1])) | (gap[1:] != gap[:-1])
+    groupStart = np.flatnonzero(np.concatenate(([True], newGroup)))
+    groupSize = np.diff(np.append(groupStart, len(xData)))
+    groupEnd = groupStart + groupSize - 1
+
+    index = np.arange(len(yData))
+    yMin = np.repeat(np.minimum.reduceat(yData, groupStart), groupSize)
+    yMax = np.repeat(np.maximum.reduceat(yData, groupStart), groupSize)
+    argMin = np.minimum.reduceat(np.where(yData == yMin, index, len(yData)), groupStart)
+    argMax = np.minimum.reduceat(np.where(yData == yMax, index, len(yData)), groupStart)
+    argMin = np.where(argMin < len(yData), argMin, groupStart)  # groups of gaps
+    argMax = np.where(argMax < len(yData), argMax, groupStart)
+
+    # the four samples of each column, in the original order, without repetitions
+    selected = np.sort(np.column_stack((groupStart, argMin, argMax, groupEnd)), axis=1).ravel()
+    selected = selected[np.concatenate(([True], np.diff(selected) != 0))]
+
+    return [xData[selected], yData[selected]]
+
+
+def adaptiveSampling(function, xLimits, xUnit, yUnit, xlog10scale, ylog10scale, tolerance, nInitial=65, maxDepth=12):
+    """Sample a function of x adaptively. The function is evaluated on a regular grid of nInitial points and each interval is recursively
+    divided in half, only where the distance from the value at the middle of the interval to the straight line between its end points is
+    larger than tolerance. The distances are computed in svg units: xUnit and yUnit are the sizes of one unit of x and y (one decade in log10
+    scale). All the intervals of one level of the recursion are evaluated in a single call to the function.
+
+    Values that are not finite (or less than or equal to 0.0 in log10 scale) are replaced by NaN. The intervals with both valid and NaN values
+    are also divided, to locate the borders of the gaps.
+
+    Functions that do not accept numpy arrays (they raise TypeError, like math.sin) are called once per point, with numpy.vectorize. Points where
+    these functions raise ValueError, ZeroDivisionError or OverflowError (e.g. math.sqrt(-1)) are replaced by NaN.
+
+    :returns: [xData, yData] numpy arrays, sorted by x
+
+    .. note:: Internal function.
+    """
+
+    def scalarFunction(x):
+        try:
+            return function(x)
+        except (ValueError, ZeroDivisionError, OverflowError):
+            return np.nan
+
+    vectorizedFunction = None
+
+    def evaluate(u):
+        nonlocal vectorizedFunction
+        # u: position along the x axis, in svg units
+        if xlog10scale:
+            x = 10.0 ** (u / xUnit)
+        else:
+            x = u / xUnit
+        with np.errstate(all='ignore'):
+            if vectorizedFunction is None:
+                try:
+                    y = function(x)
+                except TypeError:
+                    vectorizedFunction = np.vectorize(scalarFunction, otypes=[float])
+            if vectorizedFunction is not None:
+                y = vectorizedFunction(x)
+            y = np.array(np.broadcast_to(np.asarray(y, dtype=float), x.shape))
+            if ylog10scale:
+                y[~(y > 0.0)] = np.nan
+                v = np.log10(y) * yUnit
+            else:
+                y[~np.isfinite(y)] = np.nan
+                v = y * yUnit
+        return [x, y, u, v]
+
+    if xlog10scale:
+        uLimits = np.log10(xLimits) * xUnit
+    else:
+        uLimits = np.asarray(xLimits, dtype=float) * xUnit
+
+    [x, y, u, v] = evaluate(np.linspace(uLimits[0], uLimits[1], nInitial))
+    candidates = np.arange(len(u) - 1)  # index of the first point of the intervals to be verified
+
+    for depth in range(maxDepth):
+        if len(candidates) == 0:
+            break
+        [xMid, yMid, uMid, vMid] = evaluate((u[candidates] + u[candidates + 1]) / 2.0)
+
+        # distance from the middle point to the chord of the interval
+        du = u[candidates + 1] - u[candidates]
+        dv = v[candidates + 1] - v[candidates]
+        with np.errstate(invalid='ignore'):
+            distance = np.abs(du * (vMid - v[candidates]) - (uMid - u[candidates]) * dv) / np.hypot(du, dv)
+        nNaN = np.isnan(v[candidates]).astype(int) + np.isnan(v[candidates + 1]) + np.isnan(vMid)
+        refine = (distance > tolerance) | ((nNaN > 0) & (nNaN < 3))
+
+        # inserts the middle points of the refined intervals, right after the first point of each interval
+        insertAt = candidates[refine] + 1
+        x = np.insert(x, insertAt, xMid[refine])
+        y = np.insert(y, insertAt, yMid[refine])
+        u = np.insert(u, insertAt, uMid[refine])
+        v = np.insert(v, insertAt, vMid[refine])
+
+        # the two halves of each refined interval are verified in the next level
+        newPoints = insertAt + np.arange(len(insertAt))
+        candidates = np.column_stack((newPoints - 1, newPoints)).ravel()
+
+    return [x, y]
+
+
 class axis():
     """ This class has member functions to create customizable plot axes.
     
@@ -179,10 +873,43 @@ class axis():
             Please refer to :ref:`disableLatexSupport` on how to disable it. If disabled, this function will still work, internally calling the :meth:`inkscapeMadeEasy_Draw.text.write` to generate text.
     """
 
+    @staticmethod
+    def niceTickStep(axisLimits, nTicks=5):
+        """Return a 'nice' tick step for an axis: 1, 2 or 5 times a power of 10, dividing the interval in at most ``nTicks`` steps.
+
+        This function is used when the tick step of an axis or plot is None (automatic step).
+
+        :param axisLimits: limits of the axis [min,max]
+        :param nTicks: maximum number of steps within the limits. Default: 5
+
+        :type axisLimits: list
+        :type nTicks: int
+
+        :returns: the tick step
+        :rtype: float
+
+        **Example**
+
+        >>> inkPlot.axis.niceTickStep([0, 13])           # returns 5.0
+        >>> inkPlot.axis.niceTickStep([-0.2, 0.7])       # returns 0.2
+        >>> inkPlot.axis.niceTickStep([0, 13], nTicks=20)  # returns 1.0
+        """
+        span = abs(float(axisLimits[1]) - float(axisLimits[0]))
+        if span == 0 or not math.isfinite(span):
+            return 1.0
+
+        rawStep = span / nTicks
+        magnitude = 10.0 ** math.floor(math.log10(rawStep))
+        for factor in [1, 2, 5]:
+            if factor * magnitude >= rawStep * (1 - 1.0e-9):
+                return factor * magnitude
+        return 10 * magnitude
+
     @staticmethod
     def cartesian(ExtensionBaseObj, parent, xLim, yLim, position=[0, 0], xLabel='', yLabel='', xlog10scale=False, ylog10scale=False, xTicks=True,
                   yTicks=True, xTickStep=1.0, yTickStep=1.0, xScale=20, yScale=20, xAxisUnitFactor='', yAxisUnitFactor='', xGrid=False, yGrid=False,
-                  forceTextSize=0, forceLineWidth=0, drawAxis=True, ExtraLengthAxisX=0.0, ExtraLengthAxisY=0.0):
+                  forceTextSize=0, forceLineWidth=0, drawAxis=True, ExtraLengthAxisX=0.0, ExtraLengthAxisY=0.0,
+                  mergeLines=None, cache=None):
         """Creates the axes of a cartesian plot
 
         .. note:: This method uses LaTeX in labels and tick marks if LaTeX support is enabled. This is an optional feature, **enabled by default**. Please refer to :ref:`disableLatexSupport` on how to disable it.
@@ -212,6 +939,8 @@ class axis():
         :param yTicks: Adds axis ticks to the Y axis if True. Default: True
         :param xTickStep: Value interval between two consecutive ticks on X axis. (Not used if X axis is in log10 scale). Default:1.0
         :param yTickStep: Value interval between two consecutive ticks on Y axis. (Not used if Y axis is in log10 scale). Default:1.0
+
+            Use None in ``xTickStep`` or ``yTickStep`` for an automatic step. See :meth:`axis.niceTickStep`
         :param xScale: Distance between each xTickStep in svg units. Default: 20
 
                - If axis is linear, then xScale is the size in svg units of each tick
@@ -243,6 +972,17 @@ class axis():
 
         :param ExtraLengthAxisX: Extra length near the arrow pointer of X axis. Default 0.0
         :param ExtraLengthAxisY: Extra length near the arrow pointer of Y axis. Default 0.0
+        :param mergeLines: Draws all major grid lines, all fine grid lines (log10 scale) and all ticks as three path objects, with one subpath per
+            line, instead of one object per line. This reduces a lot the number of objects and the size of the file. Default: None (uses
+            ``mergeAxisLines``, defined at the beginning of this module)
+        :param cache: Reuses an axis drawn before with identical parameters (except ``parent`` and ``position``), instead of drawing it again.
+            This speeds up figures with many subplots sharing the same axes. Default: None (uses ``cacheAxes``, defined at the beginning of this
+            module)
+
+               - False: draws the axis normally
+               - 'copy': the axis is drawn only once. The other ones are deep copies of it, including the texts
+               - 'symbol': the axis is drawn only once, inside a ``<symbol>`` element in ``<defs>``. ``GroupPlot`` contains a ``<use>`` element
+                 pointing to this symbol
 
         :type ExtensionBaseObj: inkscapeMadeEasy object
         :type parent: inkscape element object
@@ -255,8 +995,8 @@ class axis():
         :type ylog10scale: bool
         :type xTicks: bool
         :type yTicks: bool
-        :type xTickStep: float
-        :type yTickStep: float
+        :type xTickStep: float or None
+        :type yTickStep: float or None
         :type xScale: float
         :type yScale: float
         :type xAxisUnitFactor: string
@@ -268,6 +1008,8 @@ class axis():
         :type drawAxis: bool
         :type ExtraLengthAxisX: float
         :type ExtraLengthAxisY: float
+        :type mergeLines: bool
+        :type cache: bool or string
 
         :returns: [GroupPlot, outputLimits, axisOrigin]
 
@@ -295,6 +1037,39 @@ class axis():
           :width: 800px
 
         """
+        # automatic tick steps
+        if xTickStep is None:
+            xTickStep = axis.niceTickStep(xLim)
+        if yTickStep is None:
+            yTickStep = axis.niceTickStep(yLim)
+
+        if mergeLines is None:
+            mergeLines = mergeAxisLines
+
+        if cache is None:
+            cache = cacheAxes
+
+        if cache and drawAxis:
+            key = axisTemplateKey([xLim, yLim, xLabel, yLabel, xlog10scale, ylog10scale, xTicks, yTicks, xTickStep, yTickStep, xScale, yScale,
+                                   xAxisUnitFactor, yAxisUnitFactor, xGrid, yGrid, forceTextSize, forceLineWidth, ExtraLengthAxisX,
+                                   ExtraLengthAxisY, mergeLines])
+            # templates are kept in the extension object and discarded when the document changes
+            templates = getattr(ExtensionBaseObj, 'axisTemplates', None)
+            if templates is None or templates.get('document') is not ExtensionBaseObj.document:
+                templates = ExtensionBaseObj.axisTemplates = {'document': ExtensionBaseObj.document}
+
+            if key not in templates:
+                # draws the axis at the position [0,0] and keeps a detached copy of it as template
+                result = axis.cartesian(ExtensionBaseObj, parent, xLim, yLim, [0, 0], xLabel, yLabel, xlog10scale, ylog10scale, xTicks, yTicks,
+                                        xTickStep, yTickStep, xScale, yScale, xAxisUnitFactor, yAxisUnitFactor, xGrid, yGrid, forceTextSize,
+                                        forceLineWidth, drawAxis, ExtraLengthAxisX, ExtraLengthAxisY, mergeLines, cache=False)
+                if not result:
+                    return result
+                parent.remove(result[0])
+                templates[key] = [result[0], result[1], result[2], None]
+
+            return axisFromTemplate(ExtensionBaseObj, parent, position, templates[key], cache == 'symbol')
+
         if drawAxis:
             GroupPlot = ExtensionBaseObj.createGroup(parent, 'Plot')
 
@@ -398,6 +1173,13 @@ class axis():
         # axis ticks
         groupTicks = ExtensionBaseObj.createGroup(GroupPlot, 'Ticks')
 
+        if mergeLines:
+            # lines are drawn in the end, in this group, so they stay below the texts
+            groupLines = ExtensionBaseObj.createGroup(groupTicks, 'Lines')
+            [gridLines, gridFineLines, tickLines] = [[], [], []]
+        else:
+            [gridLines, gridFineLines, tickLines] = [None, None, None]
+
         if xTicks or xGrid:
 
             if xlog10scale:
@@ -412,20 +1194,20 @@ class axis():
                     [posX, xText] = getPositionAndText(x, scaleX, xlog10scale, xAxisUnitFactor)
 
                     if xGrid and posX != axisOrigin[0]:  # grid lines. Do not draw if grid line is over the axis
-                        inkDraw.line.absCoords(groupTicks, [[posX, yLimitsPos[0]], [posX, yLimitsPos[1]]], [0, 0], lineStyle=lineStyleGrid)
+                        addAxisLine(groupTicks, [[posX, yLimitsPos[0]], [posX, yLimitsPos[1]]], lineStyleGrid, gridLines)
 
                     # intermediate grid lines in case of logarithmic scale
                     if xGrid and xlog10scale and x < xLimits[1]:
                         for i in range(2, 10):
                             aditionalStep = math.log10(i) * scaleX
-                            inkDraw.line.absCoords(groupTicks, [[posX + aditionalStep, yLimitsPos[0]], [posX + aditionalStep, yLimitsPos[1]]], [0, 0],
-                                                   lineStyle=lineStyleGridFine)
+                            addAxisLine(groupTicks, [[posX + aditionalStep, yLimitsPos[0]], [posX + aditionalStep, yLimitsPos[1]]], lineStyleGridFine,
+                                        gridFineLines)
 
                     # tick
                     if xTicks:
                         if posX != axisOrigin[0]:  # don't draw if in the origin
-                            inkDraw.line.relCoords(groupTicks, [[0, lenghtTicks]], [posX, axisOrigin[1] - lenghtTicks / 2.0],
-                                                   lineStyle=lineStyleTicks)
+                            addAxisLine(groupTicks, [[posX, axisOrigin[1] - lenghtTicks / 2.0], [posX, axisOrigin[1] + lenghtTicks / 2.0]],
+                                        lineStyleTicks, tickLines)
 
                     # sets justification
                     # inkDraw.text.write(ExtensionBaseObj,'orig='+str(axisOrigin),[axisOrigin[0]+10,axisOrigin[1]-30],groupTicks,fontSize=7)
@@ -468,7 +1250,7 @@ class axis():
                     # value
                     if xTicks:
                         inkDraw.text.latex(ExtensionBaseObj, groupTicks, xText, [posX + offsetX, axisOrigin[1] + offsetY], textSizeSmall,
-                                           refPoint=justif)
+                                           refPoint=justif, fastNumbers=True)
 
         if yTicks or yGrid:
             # approximate limits to multiples of 10
@@ -485,20 +1267,20 @@ class axis():
                     posY = -posY
 
                     if yGrid and posY != axisOrigin[1]:  # grid lines. Do not draw if grid line is over the axis
-                        inkDraw.line.absCoords(groupTicks, [[xLimitsPos[0], posY], [xLimitsPos[1], posY]], [0, 0], lineStyle=lineStyleGrid)
+                        addAxisLine(groupTicks, [[xLimitsPos[0], posY], [xLimitsPos[1], posY]], lineStyleGrid, gridLines)
 
                     # intermediate grid lines in case of logarithmic scale
                     if yGrid and ylog10scale and y < yLimits[1]:
                         for i in range(2, 10):
                             aditionalStep = math.log10(i) * scaleY
-                            inkDraw.line.absCoords(groupTicks, [[xLimitsPos[0], posY + aditionalStep], [xLimitsPos[1], posY + aditionalStep]], [0, 0],
-                                                   lineStyle=lineStyleGridFine)
+                            addAxisLine(groupTicks, [[xLimitsPos[0], posY + aditionalStep], [xLimitsPos[1], posY + aditionalStep]], lineStyleGridFine,
+                                        gridFineLines)
 
                     # tick
                     if yTicks:
                         if posY != axisOrigin[1]:  # don't draw if in the origin
-                            inkDraw.line.relCoords(groupTicks, [[lenghtTicks, 0]], [axisOrigin[0] - lenghtTicks / 2.0, posY],
-                                                   lineStyle=lineStyleTicks)
+                            addAxisLine(groupTicks, [[axisOrigin[0] - lenghtTicks / 2.0, posY], [axisOrigin[0] + lenghtTicks / 2.0, posY]],
+                                        lineStyleTicks, tickLines)
 
                     # sets justification
                     # inkDraw.text.write(ExtensionBaseObj,'orig='+str(axisOrigin),[axisOrigin[0]+10,axisOrigin[1]-30],groupTicks,fontSize=7)
@@ -541,7 +1323,13 @@ class axis():
                     # value
                     if yTicks:
                         inkDraw.text.latex(ExtensionBaseObj, groupTicks, yText, [axisOrigin[0] + offsetX, (posY + offsetY)], textSizeSmall,
-                                           refPoint=justif)
+                                           refPoint=justif, fastNumbers=True)
+
+        if mergeLines:
+            for [segments, lineStyle, label] in [[gridFineLines, lineStyleGridFine, 'GridFine'], [gridLines, lineStyleGrid, 'Grid'],
+                                                 [tickLines, lineStyleTicks, 'Ticks']]:
+                if segments:
+                    inkDraw.line.segments(groupLines, segments, [0, 0], label, lineStyle=lineStyle)
 
         ExtensionBaseObj.moveElement(GroupPlot, [position[0] - axisOrigin[0], position[1] - axisOrigin[1]])
 
@@ -565,7 +1353,7 @@ class axis():
     @staticmethod
     def polar(ExtensionBaseObj, parent, rLim, tLim=[0.0, 360.0], position=[0.0, 0.0], rLabel='', rlog10scale=False, rTicks=True, tTicks=True,
               rTickStep=1.0, tTickStep=45.0, rScale=20, rAxisUnitFactor='', rGrid=False, tGrid=False, forceTextSize=0, forceLineWidth=0,
-              drawAxis=True, ExtraLengthAxisR=0.0):
+              drawAxis=True, ExtraLengthAxisR=0.0, mergeLines=None):
         """Creates the axes of a polar plot
 
         .. note:: This method uses LaTeX in labels and tick marks if LaTeX support is enabled. This is an optional feature, **enabled by default**.
@@ -587,7 +1375,8 @@ class axis():
 
         :param rTicks: Adds axis ticks to the R axis if True. Default: True
         :param tTicks: Adds axis ticks to the theta axis if True. Default: True
-        :param rTickStep: Value interval between two consecutive ticks on R axis. (Not used if R axis is in log10 scale). Default:1.0
+        :param rTickStep: Value interval between two consecutive ticks on R axis. (Not used if R axis is in log10 scale). Use None for an
+            automatic step, see :meth:`axis.niceTickStep`. Default:1.0
         :param tTickStep: Value interval between two consecutive ticks on theta axis. Default:45.0
         :param rScale:  Distance between each rTickStep in svg units. Default: 20
 
@@ -610,6 +1399,9 @@ class axis():
                - False: returns the limits and origin position without drawing the axis itself
 
         :param ExtraLengthAxisR: Extra length between the R axis and its label. Default 0.0
+        :param mergeLines: Draws all circular grid lines of the same style as a single path object, with one arc per subpath, and all radial grid
+            lines and all ticks as single path objects, instead of one object per line. This reduces a lot the number of objects and the size of
+            the file. Default: None (uses ``mergeAxisLines``, defined at the beginning of this module)
 
         :type ExtensionBaseObj: inkscapeMadeEasy object
         :type parent: inkscape element object
@@ -620,7 +1412,7 @@ class axis():
         :type rlog10scale: bool
         :type rTicks: bool
         :type tTicks: bool
-        :type rTickStep: float
+        :type rTickStep: float or None
         :type tTickStep: float
         :type rScale: float
         :type rAxisUnitFactor: string
@@ -630,6 +1422,7 @@ class axis():
         :type forceLineWidth: float
         :type drawAxis: bool
         :type ExtraLengthAxisR: float
+        :type mergeLines: bool
 
         :returns: [GroupPlot, outputRLimits, axisOrigin]
 
@@ -655,6 +1448,9 @@ class axis():
         .. image:: ../imagesDocs/plot_axisPolarParameters_01.png
           :width: 800px
         """
+        # automatic tick step
+        if rTickStep is None:
+            rTickStep = axis.niceTickStep(rLim)
 
         if drawAxis:
             GroupPlot = ExtensionBaseObj.createGroup(parent, 'Plot')
@@ -745,6 +1541,16 @@ class axis():
         # axis ticks
         groupTicks = ExtensionBaseObj.createGroup(GroupPlot, 'Ticks')
 
+        if mergeLines is None:
+            mergeLines = mergeAxisLines
+
+        if mergeLines:
+            # lines are drawn in the end, in this group, so they stay below the texts
+            groupLines = ExtensionBaseObj.createGroup(groupTicks, 'Lines')
+            [gridRadii, gridFineRadii, tickRadii, gridLines, tickLines] = [[], [], [], [], []]
+        else:
+            [gridLines, tickLines] = [None, None]
+
         if rTicks or rGrid:
 
             if rlog10scale:
@@ -759,14 +1565,18 @@ class axis():
                     [posR, rText] = getPositionAndText(r, scaleR, rlog10scale, rAxisUnitFactor)
 
                     if rGrid and posR > 0.0 and r > rLimits[0] and r < rLimits[1]:  # grid lines.
-                        if tLimits[1] - tLimits[0] < 360:
+                        if mergeLines:
+                            gridRadii.append(posR)
+                        elif tLimits[1] - tLimits[0] < 360:
                             inkDraw.arc.centerAngStartAngEnd(groupTicks, [0, 0], posR, -tLimits[1], -tLimits[0], [0, 0], lineStyle=lineStyleGrid,
                                                              largeArc=largeArc)  # negative angles bc inkscape is upside down
                         else:
                             inkDraw.circle.centerRadius(groupTicks, [0, 0], posR, offset=[0, 0], lineStyle=lineStyleGrid)
 
                     # intermediate grid lines in case of logarithmic scale
-                    if rGrid and rlog10scale and r < rLimits[1]:
+                    if rGrid and rlog10scale and r < rLimits[1] and mergeLines:
+                        gridFineRadii += list(posR + np.log10(np.arange(2, 10)) * scaleR)
+                    elif rGrid and rlog10scale and r < rLimits[1]:
                         for i in range(2, 10):
                             aditionalStep = math.log10(i) * scaleR
                             if tLimits[1] - tLimits[0] < 360:
@@ -777,12 +1587,14 @@ class axis():
                                 inkDraw.circle.centerRadius(groupTicks, [0, 0], posR + aditionalStep, offset=[0, 0], lineStyle=lineStyleGridFine)
 
                     # tick
-                    if rTicks and posR > 0.0:
+                    if rTicks and posR > 0.0 and mergeLines:
+                        tickRadii.append(posR)
+                    elif rTicks and posR > 0.0:
                         inkDraw.arc.centerAngStartAngEnd(groupTicks, [0, 0], posR, -tLimits[0] - math.degrees(lenghtTicks / float(posR * 2)),
                                                          -tLimits[0] + math.degrees(lenghtTicks / float(posR * 2)), [0, 0], lineStyle=lineStyleTicks,
                                                          largeArc=False)
                     if rTicks and posR == 0.0:
-                        inkDraw.line.relCoords(groupTicks, [[0, lenghtTicks]], [0, - lenghtTicks / 2.0], lineStyle=lineStyleTicks)
+                        addAxisLine(groupTicks, [[0, - lenghtTicks / 2.0], [0, lenghtTicks / 2.0]], lineStyleTicks, tickLines)
 
                     # sets justification
                     # inkDraw.text.write(ExtensionBaseObj,'orig='+str(axisOrigin),[axisOrigin[0]+10,axisOrigin[1]-30],groupTicks,fontSize=7)
@@ -807,51 +1619,66 @@ class axis():
                     # value
                     # inkDraw.circle.centerRadius(groupTicks,[posX,posY], 1)
                     if rTicks:
-                        inkDraw.text.latex(ExtensionBaseObj, groupTicks, rText, [posX, posY], textSizeSmall, refPoint=justif)
+                        inkDraw.text.latex(ExtensionBaseObj, groupTicks, rText, [posX, posY], textSizeSmall, refPoint=justif, fastNumbers=True)
 
         if tTicks or tGrid:
 
-            listTicks = generateListOfTicksLinear(tLimits, axisOrigin[1], tTickStep)
-            for t in listTicks:
-                if t <= tLimits[1] and t >= tLimits[0]:
-                    c = math.cos(math.radians(-t))  # negative angles bc inkscape is upside down
-                    s = math.sin(math.radians(-t))  # negative angles bc inkscape is upside down
-                    # get position, considering the scale and its text
-                    if inkDraw.useLatex:
-                        tText = '$' + str(t) + '$'
-                    else:
-                        tText = str(t)
-
-                    if (tGrid and t > tLimits[0] and t < tLimits[1]) or (tGrid and t == tLimits[0] and tLimits[1] - tLimits[0] >= 360):
-                        if rLimitsPos[0] == 0:  # if rmin is zero, then make the lines to reach the center
-                            if not rlog10scale:
-                                P1 = [(rLimitsPos[0] + scaleR * rTickStep / 2) * c, (rLimitsPos[0] + scaleR * rTickStep / 2) * s]
-                            else:
-                                P1 = [(rLimitsPos[0] + 0.3 * scaleR) * c, (rLimitsPos[0] + 0.3 * scaleR) * s]
-                        else:
-                            P1 = [rLimitsPos[0] * c, rLimitsPos[0] * s]
-                        P2 = [rLimitsPos[1] * c, rLimitsPos[1] * s]
-                        inkDraw.line.absCoords(groupTicks, [P1, P2], [0, 0], lineStyle=lineStyleGrid)
+            listTicks = [t for t in generateListOfTicksLinear(tLimits, axisOrigin[1], tTickStep) if t <= tLimits[1] and t >= tLimits[0]]
 
-                    # tick
-                    if (tTicks and t != tLimits[1]) or (tTicks and t == tLimits[1] and tLimits[1] - tLimits[0] < 360):
-                        P1 = [(rLimitsPos[1] - lenghtTicks / 2.0) * c, (rLimitsPos[1] - lenghtTicks / 2.0) * s]
-                        inkDraw.line.relCoords(groupTicks, [[lenghtTicks * c, lenghtTicks * s]], P1, lineStyle=lineStyleTicks)
+            # cos and sin of all ticks at once. negative angles bc inkscape is upside down
+            anglesTicks = np.radians(-np.array(listTicks, dtype=float))
+            for [t, c, s] in zip(listTicks, np.cos(anglesTicks).tolist(), np.sin(anglesTicks).tolist()):
+                # get position, considering the scale and its text
+                if inkDraw.useLatex:
+                    tText = '$' + str(t) + '$'
+                else:
+                    tText = str(t)
 
-                    if c > 1.0e-4:
-                        justif = 'cl'
-                    else:
-                        if c < -1.0e-4:
-                            justif = 'cr'
+                if (tGrid and t > tLimits[0] and t < tLimits[1]) or (tGrid and t == tLimits[0] and tLimits[1] - tLimits[0] >= 360):
+                    if rLimitsPos[0] == 0:  # if rmin is zero, then make the lines to reach the center
+                        if not rlog10scale:
+                            P1 = [(rLimitsPos[0] + scaleR * rTickStep / 2) * c, (rLimitsPos[0] + scaleR * rTickStep / 2) * s]
                         else:
-                            justif = 'cc'
+                            P1 = [(rLimitsPos[0] + 0.3 * scaleR) * c, (rLimitsPos[0] + 0.3 * scaleR) * s]
+                    else:
+                        P1 = [rLimitsPos[0] * c, rLimitsPos[0] * s]
+                    P2 = [rLimitsPos[1] * c, rLimitsPos[1] * s]
+                    addAxisLine(groupTicks, [P1, P2], lineStyleGrid, gridLines)
+
+                # tick
+                if (tTicks and t != tLimits[1]) or (tTicks and t == tLimits[1] and tLimits[1] - tLimits[0] < 360):
+                    P1 = [(rLimitsPos[1] - lenghtTicks / 2.0) * c, (rLimitsPos[1] - lenghtTicks / 2.0) * s]
+                    P2 = [(rLimitsPos[1] + lenghtTicks / 2.0) * c, (rLimitsPos[1] + lenghtTicks / 2.0) * s]
+                    addAxisLine(groupTicks, [P1, P2], lineStyleTicks, tickLines)
+
+                if c > 1.0e-4:
+                    justif = 'cl'
+                else:
+                    if c < -1.0e-4:
+                        justif = 'cr'
+                    else:
+                        justif = 'cc'
 
-                    offsetR = text_offset
-                    posX = (rLimitsPos[1] + offsetR) * c
-                    posY = (rLimitsPos[1] + offsetR) * s
-                    # value
-                    if (tTicks and t != tLimits[1]) or (tTicks and t == tLimits[1] and tLimits[1] - tLimits[0] < 360):
-                        inkDraw.text.latex(ExtensionBaseObj, groupTicks, tText, [posX, posY], textSizeSmall, refPoint=justif)
+                offsetR = text_offset
+                posX = (rLimitsPos[1] + offsetR) * c
+                posY = (rLimitsPos[1] + offsetR) * s
+                # value
+                if (tTicks and t != tLimits[1]) or (tTicks and t == tLimits[1] and tLimits[1] - tLimits[0] < 360):
+                    inkDraw.text.latex(ExtensionBaseObj, groupTicks, tText, [posX, posY], textSizeSmall, refPoint=justif, fastNumbers=True)
+
+        if mergeLines:
+            # circular lines. negative angles bc inkscape is upside down
+            for [radii, lineStyle, label] in [[gridFineRadii, lineStyleGridFine, 'GridFine'], [gridRadii, lineStyleGrid, 'Grid']]:
+                if radii:
+                    inkDraw.arc.concentric(groupLines, [0, 0], radii, -tLimits[1], -tLimits[0], [0, 0], label, lineStyle=lineStyle)
+            if gridLines:
+                inkDraw.line.segments(groupLines, gridLines, [0, 0], 'Grid', lineStyle=lineStyleGrid)
+            if tickRadii:
+                halfAngleTicks = np.degrees(lenghtTicks / (2.0 * np.array(tickRadii)))
+                inkDraw.arc.concentric(groupLines, [0, 0], tickRadii, -tLimits[0] - halfAngleTicks, -tLimits[0] + halfAngleTicks, [0, 0], 'Ticks',
+                                       lineStyle=lineStyleTicks)
+            if tickLines:
+                inkDraw.line.segments(groupLines, tickLines, [0, 0], 'Ticks', lineStyle=lineStyleTicks)
 
         ExtensionBaseObj.moveElement(GroupPlot, position)
 
@@ -906,7 +1733,8 @@ class plot():
     def cartesian(ExtensionBaseObj, parent, xData, yData, position=[0, 0], xLabel='', yLabel='', xlog10scale=False, ylog10scale=False, xTicks=True,
                   yTicks=True, xTickStep=1.0, yTickStep=1.0, xScale=20, yScale=20, xExtraText='', yExtraText='', xGrid=False, yGrid=False,
                   generalAspectFactorAxis=1.0, lineStylePlot=inkDraw.lineStyle.setSimpleBlack(), forceXlim=None, forceYlim=None, drawAxis=True,
-                  ExtraLengthAxisX=0.0, ExtraLengthAxisY=0.0):
+                  ExtraLengthAxisX=0.0, ExtraLengthAxisY=0.0, fitTolerance=None,
+                  simplify=None, decimate=None, clipData=False):
         """Create a cartesian Plot
 
         .. note:: This method uses LaTeX in labels and tick marks if LaTeX support is enabled. This is an optional feature, **enabled by default**. Please refer to :ref:`disableLatexSupport` on how to disable it.
@@ -936,6 +1764,8 @@ class plot():
         :param yTicks: Adds axis ticks to the Y axis if True. Default: True
         :param xTickStep: Value interval between two consecutive ticks on X axis. (Not used if X axis is in log10 scale). Default:1.0
         :param yTickStep: Value interval between two consecutive ticks on Y axis. (Not used if Y axis is in log10 scale). Default:1.0
+
+            Use None in ``xTickStep`` or ``yTickStep`` for an automatic step, computed from the limits of the axis. See :meth:`axis.niceTickStep`
         :param xScale:  Distance between each xTickStep in svg units. Default: 20
 
                - If axis is linear, then xScale is the size in svg units of each tick
@@ -981,6 +1811,18 @@ class plot():
 
         :param ExtraLengthAxisX: Extra length near the arrow pointer of X axis. Default 0.0
         :param ExtraLengthAxisY: Extra length near the arrow pointer of Y axis. Default 0.0
+        :param fitTolerance: If not None, the data is drawn as a smooth bezier path passing at a distance smaller than this value from the data
+            points, in svg units. Dense smooth data results in much smaller paths. See :meth:`inkscapeMadeEasy_Draw.line.absCoords`. Default: None
+        :param simplify: If not None, removes data points that are closer than this distance to the simplified plot line, using
+            Ramer-Douglas-Peucker algorithm on the scaled data. The distance is given in svg units, like fitTolerance, therefore a value smaller
+            than the size of one pixel of the final figure results in no visible difference, while the size of the plot is bounded by its visual
+            complexity instead of the number of samples. Default: None (plots all data points)
+        :param decimate: If not None, the X axis is divided in columns of this width, in svg units, and only the first, last, minimum and
+            maximum points of each column are plotted (M4 decimation). Use the size of one pixel of the final figure. This is very fast and
+            avoids aliasing, therefore it is recommended for huge time series, like oscilloscope data. xData must be sorted. Applied before simplify.
+            Default: None (plots all data points)
+        :param clipData: Clips the plot line at the limits of the axis. Lines crossing the limits are cut at the intersection points and the data
+            outside the limits is not saved in the document. Useful with forceXlim and forceYlim to zoom in long data sets. Default: False
 
         :type ExtensionBaseObj: inkscapeMadeEasy object
         :type parent: inkscape element object
@@ -993,8 +1835,8 @@ class plot():
         :type ylog10scale: bool
         :type xTicks: bool
         :type yTicks: bool
-        :type xTickStep: float
-        :type yTickStep: float
+        :type xTickStep: float or None
+        :type yTickStep: float or None
         :type xScale: float
         :type yScale: float
         :type xExtraText: string
@@ -1008,6 +1850,10 @@ class plot():
         :type drawAxis: bool
         :type ExtraLengthAxisX: float
         :type ExtraLengthAxisY: float
+        :type fitTolerance: float
+        :type simplify: float
+        :type decimate: float
+        :type clipData: bool
 
         :returns: [GroupPlot, outputLimits, axisOrigin]
 
@@ -1023,6 +1869,8 @@ class plot():
 
         .. note:: If any of the axis are linear, the method will ignore any value greater than 10.000 (in absolute value). This avoids plotting very large numbers. The method will create a text object alongside your plot warning this.
 
+        .. note:: Ignored points and NaN values are gaps in the plot: the line is split in subpaths, all in the same path object.
+
         **Example**
 
         >>> root_layer = self.document.getroot()     # retrieves the root layer of the document
@@ -1048,124 +1896,1099 @@ class plot():
         """
 
         textSize = generalAspectFactorAxis * 0.25 * min(xScale, yScale)
-        lineWidthAxis = generalAspectFactorAxis * min(xScale, yScale) / 35.0
 
-        yDataTemp = []
-        xDataTemp = []
-        flagShowedError = False
-        if xlog10scale:  # remove invalid pairs of coordinates for log plot (less than or equal to 0.0)
-            for i in range(len(xData)):
-                if xData[i] > 0.0:
-                    yDataTemp.append(yData[i])
-                    xDataTemp.append(xData[i])
-                else:
-                    if not flagShowedError:
-                        inkDraw.text.write(ExtensionBaseObj,
-                                           'Error: The point (%f,%f)\n is invalid in logarithmic scale. Ignoring it...' % (xData[i], yData[i]),
-                                           [position[0], position[1] + 2 * textSize], parent, fontSize=textSize / 2.0)
-                        inkDraw.text.write(ExtensionBaseObj, '       Please check your graph', [position[0], position[1] + 2.5 * textSize], parent,
-                                           fontSize=textSize / 2.0)
-                        flagShowedError = True
-        else:  # remove invalid pairs of coordinates for linear plot (larger than +-10k )
-            for i in range(len(xData)):
-                if abs(xData[i]) <= 1.0e4:
-                    yDataTemp.append(yData[i])
-                    xDataTemp.append(xData[i])
-                else:
-                    if not flagShowedError:
-                        inkDraw.text.write(ExtensionBaseObj, 'Error: The point (%f,%f)\n is too large. Ignoring it...' % (xData[i], yData[i]),
-                                           [position[0], position[1] + 2 * textSize], parent, fontSize=textSize / 2.0)
-                        inkDraw.text.write(ExtensionBaseObj, '       Please check your graph', [position[0], position[1] + 2.5 * textSize], parent,
-                                           fontSize=textSize / 2.0)
-                        flagShowedError = True
-
-        yData = yDataTemp
-        xData = xDataTemp
-
-        yDataTemp = []
-        xDataTemp = []
-        flagShowedError = False
-        if ylog10scale:  # remove invalid pairs of coordinates for log plot (less than or equal to 0.0)
-            for i in range(len(yData)):
-                if yData[i] > 0.0:
-                    yDataTemp.append(yData[i])
-                    xDataTemp.append(xData[i])
-                else:
-                    if not flagShowedError:
-                        inkDraw.text.write(ExtensionBaseObj,
-                                           'Error: The point (%f,%f)\n is invalid in logarithmic scale. Ignoring it...' % (xData[i], yData[i]),
-                                           [position[0], position[1] + 2 * textSize], parent, fontSize=textSize / 2.0)
-                        inkDraw.text.write(ExtensionBaseObj, '       Please check your graph', [position[0], position[1] + 2.5 * textSize], parent,
-                                           fontSize=textSize / 2.0)
-                        flagShowedError = True
-        else:  # remove invalid pairs of coordinates for linear plot (larger than +-10k )
-            for i in range(len(yData)):
-                if abs(yData[i]) <= 1.0e4:
-                    yDataTemp.append(yData[i])
-                    xDataTemp.append(xData[i])
-                else:
-                    if not flagShowedError:
-                        inkDraw.text.write(ExtensionBaseObj, 'Error: The point (%f,%f)\n is too large. Ignoring it...' % (xData[i], yData[i]),
-                                           [position[0], position[1] + 2 * textSize], parent, fontSize=textSize / 2.0)
-                        inkDraw.text.write(ExtensionBaseObj, '       Please check your graph', [position[0], position[1] + 2.5 * textSize], parent,
-                                           fontSize=textSize / 2.0)
-                        flagShowedError = True
+        xData = np.asarray(xData, dtype=float)
+        yData = np.asarray(yData, dtype=float)
 
-        yData = yDataTemp
-        xData = xDataTemp
+        # invalid pairs of coordinates: less than or equal to 0.0 for log plot, larger than +-10k for linear plot. NaN values are gaps in the data
+        invalidMasks = invalidCartesianMasks(xData, yData, xlog10scale, ylog10scale)
+        reportInvalidPoints(ExtensionBaseObj, parent, xData, yData, invalidMasks, position, textSize)
 
-        if forceXlim is not None:
-            Xlimits = forceXlim
+        # invalid points are replaced by NaN. They split the plot line in subpaths
+        valid = ~(invalidMasks[0][0] | invalidMasks[1][0] | np.isnan(xData) | np.isnan(yData))
+        xData = np.where(valid, xData, np.nan)
+        yData = np.where(valid, yData, np.nan)
+
+        if not np.any(valid):
+            sys.stderr.write('Error: there is no valid data to plot.')
+            return 0
+
+        Xlimits = [float(np.min(xData[valid])), float(np.max(xData[valid]))]
+        Ylimits = [float(np.min(yData[valid])), float(np.max(yData[valid]))]
+
+        axisData = drawCartesianAxis(ExtensionBaseObj, parent, Xlimits, Ylimits, position, xLabel, yLabel, xlog10scale, ylog10scale, xTicks, yTicks,
+                                     xTickStep, yTickStep, xScale, yScale, xExtraText, yExtraText, xGrid, yGrid, generalAspectFactorAxis, forceXlim,
+                                     forceYlim, drawAxis, ExtraLengthAxisX, ExtraLengthAxisY)
+        if axisData == 0:
+            return 0
+        [axisGroup, limits, origin, xTickStep, yTickStep] = axisData
+
+        # scales data and convert to logarithmic scale if needed. Also subtracts the origin point of the axis to move the plot to the correct position
+        [xData, yData] = scaleCartesianData(xData, yData, xlog10scale, ylog10scale, xScale, yScale, xTickStep, yTickStep, origin)
+
+        drawCartesianData(ExtensionBaseObj, axisGroup, xData, yData, position, limits, origin, xlog10scale, ylog10scale, xScale, yScale, xTickStep,
+                          yTickStep, lineStylePlot, clipData, decimate, simplify, fitTolerance)
+
+        return [axisGroup, limits, origin]
+
+    @staticmethod
+    def function(ExtensionBaseObj, parent, function, xLim, tolerance=0.05, position=[0, 0], xLabel='', yLabel='', xlog10scale=False,
+                 ylog10scale=False, xTicks=True, yTicks=True, xTickStep=1.0, yTickStep=1.0, xScale=20, yScale=20, xExtraText='', yExtraText='',
+                 xGrid=False, yGrid=False, generalAspectFactorAxis=1.0, lineStylePlot=inkDraw.lineStyle.setSimpleBlack(), forceXlim=None,
+                 forceYlim=None, drawAxis=True, ExtraLengthAxisX=0.0, ExtraLengthAxisY=0.0, fitTolerance=None, clipData=False):
+        """Create a cartesian plot of a function y=f(x), with adaptive sampling
+
+        The function is evaluated on a regular grid and then refined only where the plot line, drawn with straight segments, would deviate from
+        the function by more than ``tolerance`` svg units. Smooth regions of the plot have few points and sharp features have many points.
+        The points are plotted with :meth:`plot.cartesian`.
+
+        .. note:: This method uses LaTeX in labels and tick marks if LaTeX support is enabled. This is an optional feature, **enabled by default**. Please refer to :ref:`disableLatexSupport` on how to disable it.
+
+        :param ExtensionBaseObj: Most of the times you have to pass 'self' when calling from inside your plugin class. See example below
+        :param parent: Parent object
+        :param function: Function of x. It is called with a numpy array of x values and should return an array with the y values, like the
+            functions of numpy. Functions of a single number, like ``math.sin``, are also accepted, but they are called once per point, which
+            is slower. Values that are NaN, infinite or less than or equal to 0.0 in log10 scale, and points where a function of a single
+            number raises ValueError (e.g. ``math.sqrt(-1)``), are gaps in the plot.
+        :param xLim: Interval [xMin, xMax] where the function is plotted
+        :param tolerance: Maximum distance, in svg units, between the plot line and the function. Default: 0.05
+        :param position: Position of the plot. It is defined at the point where x and y axis cross [x0,y0]. See :meth:`plot.cartesian`
+        :param xLabel: Label of the X axis. Default: ''
+        :param yLabel: Label of the Y axis. Default: ''
+        :param xlog10scale: Sets X axis to log10 scale if True. Default: False
+        :param ylog10scale: Sets Y axis to log10 scale if True. Default: False
+        :param xTicks: Adds axis ticks to the X axis if True. Default: True
+        :param yTicks: Adds axis ticks to the Y axis if True. Default: True
+        :param xTickStep: Value interval between two consecutive ticks on X axis. (Not used if X axis is in log10 scale). Default:1.0
+        :param yTickStep: Value interval between two consecutive ticks on Y axis. (Not used if Y axis is in log10 scale). Default:1.0
+
+            Use None in ``xTickStep`` or ``yTickStep`` for an automatic step, computed from the limits of the axis. See :meth:`axis.niceTickStep`
+        :param xScale:  Distance between each xTickStep in svg units. Default: 20
+        :param yScale: Distance between each yTickStep in svg units. Default: 20
+        :param xExtraText: Extra text to be added to the ticks in X axis. Default: ''
+        :param yExtraText: Extra text to be added to the ticks in Y axis. Default: ''
+        :param xGrid: Adds grid lines to X axis if True. Default: False
+        :param yGrid: Adds grid lines to Y axis if True. Default: False
+        :param generalAspectFactorAxis: Regulates the general aspect ratio between grid lines, text and Ticks separations. Default: 1.0
+        :param lineStylePlot: Line style to be used to plot the function. See class ``inkscapeMadeEasy_Draw.lineStyle``. Default: lineStylePlot=inkDraw.lineStyle.setSimpleBlack()
+        :param forceXlim: Forces limits of X axis to these limits. Default: None (xLim)
+        :param forceYlim: Forces limits of Y axis to these limits. Default: None (limits of the function in xLim)
+        :param drawAxis: Control flag of the axis method
+
+               - True: draws axis normally
+               - False: returns the limits and origin position without drawing the axis itself
+
+        :param ExtraLengthAxisX: Extra length near the arrow pointer of X axis. Default 0.0
+        :param ExtraLengthAxisY: Extra length near the arrow pointer of Y axis. Default 0.0
+        :param fitTolerance: If not None, the points are drawn as a smooth bezier path. See :meth:`plot.cartesian`. Default: None
+        :param clipData: Clips the plot line at the limits of the axis. See :meth:`plot.cartesian`. Default: False
+
+        :type ExtensionBaseObj: inkscapeMadeEasy object
+        :type parent: inkscape element object
+        :type function: function
+        :type xLim: list
+        :type tolerance: float
+        :type position: list
+        :type xLabel: string
+        :type yLabel: string
+        :type xlog10scale: bool
+        :type ylog10scale: bool
+        :type xTicks: bool
+        :type yTicks: bool
+        :type xTickStep: float or None
+        :type yTickStep: float or None
+        :type xScale: float
+        :type yScale: float
+        :type xExtraText: string
+        :type yExtraText: string
+        :type xGrid: bool
+        :type yGrid: bool
+        :type generalAspectFactorAxis: float
+        :type lineStylePlot: lineStyle object
+        :type forceXlim: list
+        :type forceYlim: list
+        :type drawAxis: bool
+        :type ExtraLengthAxisX: float
+        :type ExtraLengthAxisY: float
+        :type fitTolerance: float
+        :type clipData: bool
+
+        :returns: [GroupPlot, outputLimits, axisOrigin]. See :meth:`plot.cartesian`
+        :rtype: list
+
+        .. note:: The function is first evaluated in 65 equally spaced points. Features much narrower than this spacing, like a narrow peak
+            between two of these points, may be missed.
+
+        **Example**
+
+        >>> root_layer = self.document.getroot()     # retrieves the root layer of the document
+        >>>
+        >>> inkPlot.plot.function(self, root_layer, np.sinc, [-10, 10], tolerance=0.02, position=[0, 0], xLabel='$x$', yLabel='$y(x)$',
+        >>>                       xTickStep=5, yTickStep=0.5, xScale=10, yScale=40)
+        """
+
+        if xlog10scale and min(xLim) <= 0.0:
+            sys.stderr.write('Error: the limits of the X axis must be positive in log10 scale.')
+            return 0
+
+        # automatic tick step of X axis
+        if xTickStep is None:
+            xTickStep = axis.niceTickStep(forceXlim if forceXlim is not None else xLim)
+
+        # size of one unit of x and y, in svg units
+        if xlog10scale:
+            xUnit = xScale
         else:
-            Xlimits = [min(xData), max(xData)]
-        if forceYlim is not None:
-            Ylimits = forceYlim
+            xUnit = xScale / xTickStep
+
+        if ylog10scale:
+            yUnit = yScale
         else:
-            Ylimits = [min(yData), max(yData)]  # min<->max inverted  bc inkscape is upside down
+            if yTickStep is None:
+                if forceYlim is not None:
+                    yTickStep = axis.niceTickStep(forceYlim)
+                else:
+                    # limits of the function estimated from the initial grid
+                    [xData, yData] = adaptiveSampling(function, xLim, xUnit, 1.0, xlog10scale, False, tolerance, maxDepth=0)
+                    if np.all(np.isnan(yData)):
+                        yTickStep = 1.0
+                    else:
+                        yTickStep = axis.niceTickStep([np.nanmin(yData), np.nanmax(yData)])
+            yUnit = yScale / yTickStep
+
+        [xData, yData] = adaptiveSampling(function, xLim, xUnit, yUnit, xlog10scale, ylog10scale, tolerance)
+
+        if np.all(np.isnan(yData)):
+            sys.stderr.write('Error: the function has no valid values in the interval.')
+            return 0
+
+        return plot.cartesian(ExtensionBaseObj, parent, xData, yData, position, xLabel, yLabel, xlog10scale, ylog10scale, xTicks, yTicks, xTickStep,
+                              yTickStep, xScale, yScale, xExtraText, yExtraText, xGrid, yGrid, generalAspectFactorAxis, lineStylePlot,
+                              forceXlim if forceXlim is not None else list(xLim), forceYlim, drawAxis, ExtraLengthAxisX, ExtraLengthAxisY,
+                              fitTolerance=fitTolerance, clipData=clipData)
+
+    @staticmethod
+    def cartesianMulti(ExtensionBaseObj, parent, series, position=[0, 0], xLabel='', yLabel='', xlog10scale=False, ylog10scale=False, xTicks=True,
+                       yTicks=True, xTickStep=1.0, yTickStep=1.0, xScale=20, yScale=20, xExtraText='', yExtraText='', xGrid=False, yGrid=False,
+                       generalAspectFactorAxis=1.0, lineStylePlot=inkDraw.lineStyle.setSimpleBlack(), forceXlim=None, forceYlim=None, drawAxis=True,
+                       ExtraLengthAxisX=0.0, ExtraLengthAxisY=0.0, fitTolerance=None, simplify=None, decimate=None, clipData=False):
+        """Create a cartesian Plot with several data series sharing the same axis
+
+        The limits of the axis comprise all series and the axis is drawn only once. Each series is drawn as one path object, with the same options
+        of :meth:`plot.cartesian`. This is much faster than calling :meth:`plot.cartesian` once per series.
+
+        .. note:: This method uses LaTeX in labels and tick marks if LaTeX support is enabled. This is an optional feature, **enabled by default**. Please refer to :ref:`disableLatexSupport` on how to disable it.
+
+        :param ExtensionBaseObj: Most of the times you have to pass 'self' when calling from inside your plugin class. See example below
+        :param parent: Parent object
+        :param series: List of data series. Each series is a list [xData, yData], [xData, yData, lineStyle] or [xData, yData, lineStyle, label]
+
+              - xData, yData: lists or numpy arrays with the data of the series
+              - lineStyle: Line style of the series. See class ``inkscapeMadeEasy_Draw.lineStyle``. Use None for the default: lineStylePlot
+              - label: Label of the path object of the series. Use None for the default: 'series N', with N=1,2,3,...
+
+        :param position: Position of the plot. It is defined at the point where x and y axis cross [x0,y0]. See :meth:`plot.cartesian`
+        :param xLabel: Label of the X axis. Default: ''
+        :param yLabel: Label of the Y axis. Default: ''
+        :param xlog10scale: Sets X axis to log10 scale if True. Default: False
+        :param ylog10scale: Sets Y axis to log10 scale if True. Default: False
+        :param xTicks: Adds axis ticks to the X axis if True. Default: True
+        :param yTicks: Adds axis ticks to the Y axis if True. Default: True
+        :param xTickStep: Value interval between two consecutive ticks on X axis. (Not used if X axis is in log10 scale). Default:1.0
+        :param yTickStep: Value interval between two consecutive ticks on Y axis. (Not used if Y axis is in log10 scale). Default:1.0
+
+            Use None in ``xTickStep`` or ``yTickStep`` for an automatic step, computed from the limits of the axis. See :meth:`axis.niceTickStep`
+        :param xScale:  Distance between each xTickStep in svg units. Default: 20
+        :param yScale: Distance between each yTickStep in svg units. Default: 20
+        :param xExtraText: Extra text to be added to the ticks in X axis. Default: ''
+        :param yExtraText: Extra text to be added to the ticks in Y axis. Default: ''
+        :param xGrid: Adds grid lines to X axis if True. Default: False
+        :param yGrid: Adds grid lines to Y axis if True. Default: False
+        :param generalAspectFactorAxis: Regulates the general aspect ratio between grid lines, text and Ticks separations. Default: 1.0
+        :param lineStylePlot: Line style of the series without their own line style. All of them share this style and its markers. See class
+            ``inkscapeMadeEasy_Draw.lineStyle``. Default: lineStylePlot=inkDraw.lineStyle.setSimpleBlack()
+        :param forceXlim: Forces limits of X axis to these limits. Default: None (limits of all series)
+        :param forceYlim: Forces limits of Y axis to these limits. Default: None (limits of all series)
+        :param drawAxis: Control flag of the axis method
+
+               - True: draws axis normally
+               - False: returns the limits and origin position without drawing the axis itself
+
+        :param ExtraLengthAxisX: Extra length near the arrow pointer of X axis. Default 0.0
+        :param ExtraLengthAxisY: Extra length near the arrow pointer of Y axis. Default 0.0
+        :param fitTolerance: See :meth:`plot.cartesian`. Applied to each series. Default: None
+        :param simplify: See :meth:`plot.cartesian`. Applied to each series. Default: None
+        :param decimate: See :meth:`plot.cartesian`. Applied to each series. Default: None
+        :param clipData: See :meth:`plot.cartesian`. Applied to each series. Default: False
+
+        :type ExtensionBaseObj: inkscapeMadeEasy object
+        :type parent: inkscape element object
+        :type series: list
+        :type position: list
+        :type xLabel: string
+        :type yLabel: string
+        :type xlog10scale: bool
+        :type ylog10scale: bool
+        :type xTicks: bool
+        :type yTicks: bool
+        :type xTickStep: float or None
+        :type yTickStep: float or None
+        :type xScale: float
+        :type yScale: float
+        :type xExtraText: string
+        :type yExtraText: string
+        :type xGrid: bool
+        :type yGrid: bool
+        :type generalAspectFactorAxis: float
+        :type lineStylePlot: lineStyle object
+        :type forceXlim: list
+        :type forceYlim: list
+        :type drawAxis: bool
+        :type ExtraLengthAxisX: float
+        :type ExtraLengthAxisY: float
+        :type fitTolerance: float
+        :type simplify: float
+        :type decimate: float
+        :type clipData: bool
+
+        :returns: [GroupPlot, outputLimits, axisOrigin]. See :meth:`plot.cartesian`
+        :rtype: list
+
+        .. note:: Invalid points of all series are reported together, in a single set of messages alongside the plot. See :meth:`plot.cartesian`
+
+        **Example**
+
+        >>> root_layer = self.document.getroot()     # retrieves the root layer of the document
+        >>> xData = np.linspace(0, 2 * np.pi, 500)
+        >>> lineStyleRed = inkDraw.lineStyle.set(lineWidth=0.5, lineColor=inkDraw.color.defined('red'))
+        >>>
+        >>> series = [[xData, np.sin(k * xData)] for k in range(1, 30)]      # 29 series with the default line style
+        >>> series.append([xData, np.cos(xData), lineStyleRed, 'cosine'])     # one series with its own style and label
+        >>> inkPlot.plot.cartesianMulti(self, root_layer, series, position=[0, 0], xLabel='$t$', yLabel='$y(t)$', xTickStep=1.0, yTickStep=0.5)
+        """
+
+        textSize = generalAspectFactorAxis * 0.25 * min(xScale, yScale)
+
+        Xlimits = [np.inf, -np.inf]
+        Ylimits = [np.inf, -np.inf]
+        summary = None
+        seriesData = []
+        for i, data in enumerate(series):
+            xData = np.asarray(data[0], dtype=float)
+            yData = np.asarray(data[1], dtype=float)
+
+            # invalid pairs of coordinates: less than or equal to 0.0 for log plot, larger than +-10k for linear plot. NaN values are gaps in the data
+            invalidMasks = invalidCartesianMasks(xData, yData, xlog10scale, ylog10scale)
+            summary = addInvalidPointsSummary(summary, invalidPointsSummary(xData, yData, invalidMasks))
+
+            # invalid points are replaced by NaN. They split the plot line in subpaths
+            valid = ~(invalidMasks[0][0] | invalidMasks[1][0] | np.isnan(xData) | np.isnan(yData))
+            if np.any(valid):
+                Xlimits = [min(Xlimits[0], float(np.min(xData[valid]))), max(Xlimits[1], float(np.max(xData[valid])))]
+                Ylimits = [min(Ylimits[0], float(np.min(yData[valid]))), max(Ylimits[1], float(np.max(yData[valid])))]
+
+            lineStyle = data[2] if len(data) > 2 and data[2] is not None else lineStylePlot
+            label = data[3] if len(data) > 3 and data[3] is not None else 'series %d' % (i + 1)
+            seriesData.append([np.where(valid, xData, np.nan), np.where(valid, yData, np.nan), lineStyle, label])
+
+        if summary is not None:
+            writeInvalidPointsMessages(ExtensionBaseObj, parent, summary, position, textSize)
+
+        if not ((forceXlim is not None or np.isfinite(Xlimits[0])) and (forceYlim is not None or np.isfinite(Ylimits[0]))):
+            sys.stderr.write('Error: there is no valid data to plot.')
+            return 0
+
+        axisData = drawCartesianAxis(ExtensionBaseObj, parent, Xlimits, Ylimits, position, xLabel, yLabel, xlog10scale, ylog10scale, xTicks, yTicks,
+                                     xTickStep, yTickStep, xScale, yScale, xExtraText, yExtraText, xGrid, yGrid, generalAspectFactorAxis, forceXlim,
+                                     forceYlim, drawAxis, ExtraLengthAxisX, ExtraLengthAxisY)
+        if axisData == 0:
+            return 0
+        [axisGroup, limits, origin, xTickStep, yTickStep] = axisData
+
+        for [xData, yData, lineStyle, label] in seriesData:
+            # scales data and convert to logarithmic scale if needed. Also subtracts the origin point of the axis to move the plot to the correct position
+            [xData, yData] = scaleCartesianData(xData, yData, xlog10scale, ylog10scale, xScale, yScale, xTickStep, yTickStep, origin)
+
+            drawCartesianData(ExtensionBaseObj, axisGroup, xData, yData, position, limits, origin, xlog10scale, ylog10scale, xScale, yScale,
+                              xTickStep, yTickStep, lineStyle, clipData, decimate, simplify, fitTolerance, label)
+
+        return [axisGroup, limits, origin]
+
+    @staticmethod
+    def cartesianStream(ExtensionBaseObj, parent, source, columns=[0, 1], chunkSize=1000000, delimiter=',', skipRows=0, position=[0, 0], xLabel='',
+                        yLabel='', xlog10scale=False, ylog10scale=False, xTicks=True, yTicks=True, xTickStep=1.0, yTickStep=1.0, xScale=20, yScale=20,
+                        xExtraText='', yExtraText='', xGrid=False, yGrid=False, generalAspectFactorAxis=1.0,
+                        lineStylePlot=inkDraw.lineStyle.setSimpleBlack(), forceXlim=None, forceYlim=None, drawAxis=True, ExtraLengthAxisX=0.0,
+                        ExtraLengthAxisY=0.0, fitTolerance=None, simplify=None, decimate=0.1, clipData=False):
+        """Create a cartesian Plot of a large data set, read from a file or an iterator in chunks.
+
+        Only one chunk is kept in memory at a time. Files and arrays are read twice: the first pass finds the limits of the data and the second one
+        validates, scales and decimates each chunk with M4 decimation (see argument decimate of :meth:`plot.cartesian`) and draws it as one path
+        object before the next chunk is read. Therefore the memory used depends on the size of the chunks, not on the size of the data set.
+
+        .. note:: This method uses LaTeX in labels and tick marks if LaTeX support is enabled. This is an optional feature, **enabled by default**. Please refer to :ref:`disableLatexSupport` on how to disable it.
+
+        :param ExtensionBaseObj: Most of the times you have to pass 'self' when calling from inside your plugin class. See example below
+        :param parent: Parent object
+        :param source: Data source. It can be
+
+            - the path of a ``.npy`` file, with a 2D array. The file is memory mapped
+            - the path of a text file, like ``.csv``, with one point per line. The file is read in chunks of lines
+            - a numpy array, including memory mapped arrays, with shape (N,M)
+            - an iterator of chunks. Each chunk is either a numpy array with shape (N,M) or a pair [xChunk, yChunk]
+
+        :param columns: Indexes of the columns with x and y data. Not used if the iterator returns pairs [xChunk, yChunk]. Default: [0, 1]
+        :param chunkSize: Number of points of each chunk, for files and arrays. Default: 1000000
+        :param delimiter: Delimiter of the columns of text files. Default: ','
+        :param skipRows: Number of lines to skip at the beginning of text files, like headers. Default: 0
+        :param decimate: Width of the columns of the M4 decimation, in svg units. xData must be sorted. Use None or 0 to draw all the points.
+            Default: 0.1
+
+        The other arguments and the return value are the same of :meth:`plot.cartesian`.
+
+        .. note:: Iterators cannot be read twice, therefore all their chunks are kept in memory until the limits of the data are known, unless both
+            ``forceXlim`` and ``forceYlim`` are given.
+
+        :type ExtensionBaseObj: inkscapeMadeEasy object
+        :type parent: inkscape element object
+        :type source: string, numpy array or iterator
+        :type columns: list
+        :type chunkSize: int
+        :type delimiter: string
+        :type skipRows: int
+        :type decimate: float
+
+        :returns: [GroupPlot, outputLimits, axisOrigin]. See :meth:`plot.cartesian`
+        :rtype: list
+
+        **Example**
+
+        >>> root_layer = self.document.getroot()     # retrieves the root layer of the document
+        >>> # csv file with a header line and columns time,voltage,current
+        >>> inkPlot.plot.cartesianStream(self, root_layer, '/path/to/capture.csv', columns=[0, 2], skipRows=1, xLabel='$t$', yLabel='$i(t)$',
+        >>>                              xTickStep=0.1, yTickStep=0.5, xScale=20, yScale=20, decimate=0.25)
+        >>>
+        >>> # numpy file with 2 columns, memory mapped
+        >>> inkPlot.plot.cartesianStream(self, root_layer, '/path/to/capture.npy', xTickStep=0.1, yTickStep=0.5, forceXlim=[0, 1], clipData=True)
+        """
+
+        if not decimate:
+            decimate = None
+
+        textSize = generalAspectFactorAxis * 0.25 * min(xScale, yScale)
+
+        # the limits of the data are needed to draw the axis before the data. Iterators cannot be read twice, therefore their chunks are kept in
+        # memory, unless both limits are forced
+        countInvalid = False
+        if isinstance(source, (str, np.ndarray)):
+            [Xlimits, Ylimits, summary] = cartesianStreamLimits(dataChunks(source, columns, chunkSize, delimiter, skipRows), xlog10scale, ylog10scale)
+            chunks = dataChunks(source, columns, chunkSize, delimiter, skipRows)
+        elif forceXlim is not None and forceYlim is not None:
+            [Xlimits, Ylimits, summary] = [forceXlim, forceYlim, None]
+            chunks = dataChunks(source, columns, chunkSize, delimiter, skipRows)
+            countInvalid = True
+        else:
+            chunks = list(dataChunks(source, columns, chunkSize, delimiter, skipRows))
+            [Xlimits, Ylimits, summary] = cartesianStreamLimits(chunks, xlog10scale, ylog10scale)
+
+        if not ((forceXlim is not None or np.isfinite(Xlimits[0])) and (forceYlim is not None or np.isfinite(Ylimits[0]))):
+            if summary is not None:
+                writeInvalidPointsMessages(ExtensionBaseObj, parent, summary, position, textSize)
+            sys.stderr.write('Error: there is no valid data to plot.')
+            return 0
+
+        axisData = drawCartesianAxis(ExtensionBaseObj, parent, Xlimits, Ylimits, position, xLabel, yLabel, xlog10scale, ylog10scale, xTicks, yTicks,
+                                     xTickStep, yTickStep, xScale, yScale, xExtraText, yExtraText, xGrid, yGrid, generalAspectFactorAxis, forceXlim,
+                                     forceYlim, drawAxis, ExtraLengthAxisX, ExtraLengthAxisY)
+        if axisData == 0:
+            return 0
+        [axisGroup, limits, origin, xTickStep, yTickStep] = axisData
+
+        # each chunk is drawn as one path object before the next one is read. It starts at the last point of the previous chunk
+        lastPoint = np.empty((0, 2))
+        for [xData, yData] in chunks:
+            invalidMasks = invalidCartesianMasks(xData, yData, xlog10scale, ylog10scale)
+            if countInvalid:
+                summary = addInvalidPointsSummary(summary, invalidPointsSummary(xData, yData, invalidMasks))
+
+            # invalid points are replaced by NaN. They split the plot line in subpaths
+            valid = ~(invalidMasks[0][0] | invalidMasks[1][0] | np.isnan(xData) | np.isnan(yData))
+            [xData, yData] = scaleCartesianData(np.where(valid, xData, np.nan), np.where(valid, yData, np.nan), xlog10scale, ylog10scale, xScale,
+                                                yScale, xTickStep, yTickStep, origin)
+
+            # all chunks are decimated with the same columns
+            if decimate is not None:
+                [xData, yData] = decimateM4(xData, yData, decimate, xOrigin=0.0)
+
+            coords = np.vstack((lastPoint, np.column_stack((xData, yData))))
+            lastPoint = coords[-1:]
+            if np.count_nonzero(np.all(np.isfinite(coords), axis=1)) < 2:
+                continue
+
+            drawCartesianData(ExtensionBaseObj, axisGroup, coords[:, 0], coords[:, 1], position, limits, origin, xlog10scale, ylog10scale, xScale,
+                              yScale, xTickStep, yTickStep, lineStylePlot, clipData, None, simplify, fitTolerance)
+
+        if summary is not None:
+            writeInvalidPointsMessages(ExtensionBaseObj, parent, summary, position, textSize)
+
+        return [axisGroup, limits, origin]
+
+    @staticmethod
+    def scatter(ExtensionBaseObj, parent, xData, yData, position=[0, 0], xLabel='', yLabel='', xlog10scale=False, ylog10scale=False, xTicks=True,
+                yTicks=True, xTickStep=1.0, yTickStep=1.0, xScale=20, yScale=20, xExtraText='', yExtraText='', xGrid=False, yGrid=False,
+                generalAspectFactorAxis=1.0, markerRadius=None, lineStyleMarker=None, forceXlim=None, forceYlim=None, drawAxis=True,
+                ExtraLengthAxisX=0.0, ExtraLengthAxisY=0.0, singlePath=False, clipData=False, precision=None):
+        """Create a cartesian scatter plot
+
+        The circular marker is defined only once, as a ``<symbol>`` element in ``<defs>``, and each point is a ``<use>`` element pointing to it.
+        Optionally, all markers can be drawn as a single path object, with one circle per subpath. Both ways are suitable for a large number of
+        points.
+
+        .. note:: This method uses LaTeX in labels and tick marks if LaTeX support is enabled. This is an optional feature, **enabled by default**. Please refer to :ref:`disableLatexSupport` on how to disable it.
+
+        :param ExtensionBaseObj: Most of the times you have to pass 'self' when calling from inside your plugin class. See example below
+        :param parent: Parent object
+        :param xData: List of x data
+        :param yData: List of y data
+        :param position: Position of the plot. It is defined at the point where x and y axis cross [x0,y0]. See :meth:`plot.cartesian`
+        :param xLabel: Label of the X axis. Default: ''
+        :param yLabel: Label of the Y axis. Default: ''
+        :param xlog10scale: Sets X axis to log10 scale if True. Default: False
+        :param ylog10scale: Sets Y axis to log10 scale if True. Default: False
+        :param xTicks: Adds axis ticks to the X axis if True. Default: True
+        :param yTicks: Adds axis ticks to the Y axis if True. Default: True
+        :param xTickStep: Value interval between two consecutive ticks on X axis. (Not used if X axis is in log10 scale). Default:1.0
+        :param yTickStep: Value interval between two consecutive ticks on Y axis. (Not used if Y axis is in log10 scale). Default:1.0
+
+            Use None in ``xTickStep`` or ``yTickStep`` for an automatic step, computed from the limits of the axis. See :meth:`axis.niceTickStep`
+        :param xScale:  Distance between each xTickStep in svg units. Default: 20
+        :param yScale: Distance between each yTickStep in svg units. Default: 20
+        :param xExtraText: Extra text to be added to the ticks in X axis. Default: ''
+        :param yExtraText: Extra text to be added to the ticks in Y axis. Default: ''
+        :param xGrid: Adds grid lines to X axis if True. Default: False
+        :param yGrid: Adds grid lines to Y axis if True. Default: False
+        :param generalAspectFactorAxis: Regulates the general aspect ratio between grid lines, text and Ticks separations. Default: 1.0
+        :param markerRadius: Radius of the markers, in svg units. Default: None (20% of the size of the texts of the axis)
+        :param lineStyleMarker: Line style of the markers. See class ``inkscapeMadeEasy_Draw.lineStyle``. Default: None (black circles without
+            stroke)
+        :param forceXlim: Forces limits of X axis to these limits. See :meth:`plot.cartesian`. Default: None
+        :param forceYlim: Forces limits of Y axis to these limits. See :meth:`plot.cartesian`. Default: None
+        :param drawAxis: Control flag of the axis method
+
+               - True: draws axis normally
+               - False: returns the limits and origin position without drawing the axis itself
+
+        :param ExtraLengthAxisX: Extra length near the arrow pointer of X axis. Default 0.0
+        :param ExtraLengthAxisY: Extra length near the arrow pointer of Y axis. Default 0.0
+        :param singlePath: Draws all markers as a single path object, one circle per subpath, instead of ``<use>`` elements. This is the fastest
+            option to render, but the markers cannot be edited individually. Default: False
+        :param clipData: Removes the points outside the limits of the axis. Default: False
+        :param precision: Number of decimal places of the coordinates. Default: None (uses ``pathPrecision``, defined at the beginning of
+            ``inkscapeMadeEasy_Draw`` module)
+
+        :type ExtensionBaseObj: inkscapeMadeEasy object
+        :type parent: inkscape element object
+        :type xData: list
+        :type yData: list
+        :type position: list
+        :type xLabel: string
+        :type yLabel: string
+        :type xlog10scale: bool
+        :type ylog10scale: bool
+        :type xTicks: bool
+        :type yTicks: bool
+        :type xTickStep: float or None
+        :type yTickStep: float or None
+        :type xScale: float
+        :type yScale: float
+        :type xExtraText: string
+        :type yExtraText: string
+        :type xGrid: bool
+        :type yGrid: bool
+        :type generalAspectFactorAxis: float
+        :type markerRadius: float
+        :type lineStyleMarker: lineStyle object
+        :type forceXlim: list
+        :type forceYlim: list
+        :type drawAxis: bool
+        :type ExtraLengthAxisX: float
+        :type ExtraLengthAxisY: float
+        :type singlePath: bool
+        :type clipData: bool
+        :type precision: int
+
+        :returns: [GroupPlot, outputLimits, axisOrigin]. See :meth:`plot.cartesian`
+        :rtype: list
+
+        .. note:: Invalid points (see :meth:`plot.cartesian`) and NaN values are not drawn.
+
+        **Example**
+
+        >>> root_layer = self.document.getroot()     # retrieves the root layer of the document
+        >>> xData = np.random.randn(100000)
+        >>> yData = xData + 0.5 * np.random.randn(100000)
+        >>> lineStyleMarker = inkDraw.lineStyle.set(lineWidth=0.1, lineColor=None, fillColor=inkDraw.color.defined('blue'))
+        >>>
+        >>> inkPlot.plot.scatter(self, root_layer, xData, yData, position=[0, 0], xLabel='$x$', yLabel='$y$', xTickStep=None, yTickStep=None,
+        >>>                      markerRadius=0.2, lineStyleMarker=lineStyleMarker)
+        """
+
+        textSize = generalAspectFactorAxis * 0.25 * min(xScale, yScale)
+
+        if markerRadius is None:
+            markerRadius = 0.2 * textSize
+        if lineStyleMarker is None:
+            lineStyleMarker = inkDraw.lineStyle.set(lineWidth=0.0, lineColor=None, fillColor=inkDraw.color.defined('black'))
+        if precision is None:
+            precision = inkDraw.pathPrecision
+
+        xData = np.asarray(xData, dtype=float)
+        yData = np.asarray(yData, dtype=float)
+
+        # invalid pairs of coordinates: less than or equal to 0.0 for log plot, larger than +-10k for linear plot. NaN values are not drawn
+        invalidMasks = invalidCartesianMasks(xData, yData, xlog10scale, ylog10scale)
+        reportInvalidPoints(ExtensionBaseObj, parent, xData, yData, invalidMasks, position, textSize)
+
+        valid = ~(invalidMasks[0][0] | invalidMasks[1][0] | np.isnan(xData) | np.isnan(yData))
+        xData = xData[valid]
+        yData = yData[valid]
+
+        if len(xData) == 0:
+            sys.stderr.write('Error: there is no valid data to plot.')
+            return 0
+
+        Xlimits = [float(np.min(xData)), float(np.max(xData))]
+        Ylimits = [float(np.min(yData)), float(np.max(yData))]
+
+        axisData = drawCartesianAxis(ExtensionBaseObj, parent, Xlimits, Ylimits, position, xLabel, yLabel, xlog10scale, ylog10scale, xTicks, yTicks,
+                                     xTickStep, yTickStep, xScale, yScale, xExtraText, yExtraText, xGrid, yGrid, generalAspectFactorAxis, forceXlim,
+                                     forceYlim, drawAxis, ExtraLengthAxisX, ExtraLengthAxisY)
+        if axisData == 0:
+            return 0
+        [axisGroup, limits, origin, xTickStep, yTickStep] = axisData
+
+        # scales data and convert to logarithmic scale if needed. The position of the plot is added to the points
+        [xData, yData] = scaleCartesianData(xData, yData, xlog10scale, ylog10scale, xScale, yScale, xTickStep, yTickStep, origin)
+        coordsNP = np.column_stack((xData + position[0], yData + position[1]))
+
+        if clipData:
+            # limits of the axis, already including the position of the plot
+            [xMin, xMax] = sorted([limits[0][1], limits[1][1]])
+            [yMin, yMax] = sorted([limits[2][1], limits[3][1]])
+            coordsNP = coordsNP[(coordsNP[:, 0] >= xMin) & (coordsNP[:, 0] <= xMax) & (coordsNP[:, 1] >= yMin) & (coordsNP[:, 1] <= yMax)]
+
+        if singlePath:
+            Attribs = {inkex.addNS('label', 'inkscape'): 'Markers', 'style': str(inkex.Style(lineStyleMarker)),
+                       'd': scatterCirclesPathData(coordsNP, markerRadius, precision)}
+            etree.SubElement(axisGroup, inkex.addNS('path', 'svg'), Attribs)
+        else:
+            symbolId = ExtensionBaseObj.uniqueIdNumber('scatterMarker')
+            # overflow must be visible because the marker is centered at the origin of the symbol
+            symbol = etree.SubElement(ExtensionBaseObj.getDefinitions(), inkex.addNS('symbol', 'svg'), {'id': symbolId, 'style': 'overflow:visible'})
+            inkDraw.circle.centerRadius(symbol, [0, 0], markerRadius, offset=[0, 0], label='marker', lineStyle=lineStyleMarker, precision=precision)
+
+            markersGroup = scatterUseElements(symbolId, coordsNP, precision)
+            markersGroup.set(inkex.addNS('label', 'inkscape'), 'Markers')
+            axisGroup.append(markersGroup)
+
+        return [axisGroup, limits, origin]
+
+    @staticmethod
+    def image(ExtensionBaseObj, parent, data, extent=None, position=[0, 0], xLabel='', yLabel='', xTicks=True, yTicks=True, xTickStep=1.0,
+              yTickStep=1.0, xScale=20, yScale=20, xExtraText='', yExtraText='', xGrid=False, yGrid=False, generalAspectFactorAxis=1.0,
+              colorMap='viridis', valueLimits=None, forceXlim=None, forceYlim=None, drawAxis=True, ExtraLengthAxisX=0.0, ExtraLengthAxisY=0.0):
+        """Create a cartesian plot of a 2D array of values as a raster image, like heat maps
+
+        The values are mapped to colors with a lookup table and the image is embedded in the document as a single ``<image>`` element, in PNG
+        format, placed inside the axis.
+
+        .. note:: This method uses LaTeX in labels and tick marks if LaTeX support is enabled. This is an optional feature, **enabled by default**. Please refer to :ref:`disableLatexSupport` on how to disable it.
+
+        :param ExtensionBaseObj: Most of the times you have to pass 'self' when calling from inside your plugin class. See example below
+        :param parent: Parent object
+        :param data: 2D array with the values. ``data[i,j]`` is the value of the cell in row i and column j. Rows are along the Y axis, with the
+            first row at the bottom of the image, and columns are along the X axis. NaN values are transparent.
+        :param extent: Limits of the image [xMin, xMax, yMin, yMax], in the units of the axis. Default: None ([0, nColumns, 0, nRows])
+        :param position: Position of the plot. It is defined at the point where x and y axis cross [x0,y0]. See :meth:`plot.cartesian`
+        :param xLabel: Label of the X axis. Default: ''
+        :param yLabel: Label of the Y axis. Default: ''
+        :param xTicks: Adds axis ticks to the X axis if True. Default: True
+        :param yTicks: Adds axis ticks to the Y axis if True. Default: True
+        :param xTickStep: Value interval between two consecutive ticks on X axis. Default:1.0
+        :param yTickStep: Value interval between two consecutive ticks on Y axis. Default:1.0
+
+            Use None in ``xTickStep`` or ``yTickStep`` for an automatic step, computed from the limits of the axis. See :meth:`axis.niceTickStep`
+        :param xScale:  Distance between each xTickStep in svg units. Default: 20
+        :param yScale: Distance between each yTickStep in svg units. Default: 20
+        :param xExtraText: Extra text to be added to the ticks in X axis. Default: ''
+        :param yExtraText: Extra text to be added to the ticks in Y axis. Default: ''
+        :param xGrid: Adds grid lines to X axis if True. Default: False
+        :param yGrid: Adds grid lines to Y axis if True. Default: False
+        :param generalAspectFactorAxis: Regulates the general aspect ratio between grid lines, text and Ticks separations. Default: 1.0
+        :param colorMap: Color map. It can be the name of a color map defined in ``colorMaps``, at the beginning of this module ('gray', 'hot',
+            'jet', 'viridis', 'coolwarm'), or a list of colors equally spaced between the minimum and maximum values. Each color can be a list
+            [R,G,B] (0-255) or a string '#RRGGBB'. Default: 'viridis'
+        :param valueLimits: Values [vMin, vMax] mapped to the first and last colors of the color map. Values outside these limits are saturated.
+            Default: None (minimum and maximum values of data)
+        :param forceXlim: Forces limits of X axis to these limits. Default: None (limits of the image)
+        :param forceYlim: Forces limits of Y axis to these limits. Default: None (limits of the image)
+        :param drawAxis: Control flag of the axis method
+
+               - True: draws axis normally
+               - False: returns the limits and origin position without drawing the axis itself
+
+        :param ExtraLengthAxisX: Extra length near the arrow pointer of X axis. Default 0.0
+        :param ExtraLengthAxisY: Extra length near the arrow pointer of Y axis. Default 0.0
+
+        :type ExtensionBaseObj: inkscapeMadeEasy object
+        :type parent: inkscape element object
+        :type data: numpy array or list of lists
+        :type extent: list
+        :type position: list
+        :type xLabel: string
+        :type yLabel: string
+        :type xTicks: bool
+        :type yTicks: bool
+        :type xTickStep: float or None
+        :type yTickStep: float or None
+        :type xScale: float
+        :type yScale: float
+        :type xExtraText: string
+        :type yExtraText: string
+        :type xGrid: bool
+        :type yGrid: bool
+        :type generalAspectFactorAxis: float
+        :type colorMap: string or list
+        :type valueLimits: list
+        :type forceXlim: list
+        :type forceYlim: list
+        :type drawAxis: bool
+        :type ExtraLengthAxisX: float
+        :type ExtraLengthAxisY: float
+
+        :returns: [GroupPlot, outputLimits, axisOrigin]. See :meth:`plot.cartesian`
+        :rtype: list
 
-        if Ylimits[0] == Ylimits[1]:
-            if Ylimits[0] > 0:
-                Ylimits[0] = 0
-            if Ylimits[0] == 0:
-                Ylimits[1] = 1
-            if Ylimits[0] < 0:
-                Ylimits[1] = 0
+        .. note:: The axes are linear. Each cell of data is one pixel of the image, drawn without smoothing.
 
-        if Xlimits[0] == Xlimits[1]:
-            if Xlimits[0] > 0:
-                Xlimits[0] = 0
-            if Xlimits[0] == 0:
-                Xlimits[1] = 1
-            if Xlimits[0] < 0:
-                Xlimits[1] = 0
+        **Example**
 
-        # draw axis
-        axisGroup = ExtensionBaseObj.createGroup(parent, 'PlotData')
+        >>> root_layer = self.document.getroot()     # retrieves the root layer of the document
+        >>> [x, y] = np.meshgrid(np.linspace(-2, 2, 500), np.linspace(-1, 1, 250))
+        >>> z = np.exp(-x ** 2 - 3 * y ** 2)
+        >>>
+        >>> inkPlot.plot.image(self, root_layer, z, extent=[-2, 2, -1, 1], position=[0, 0], xLabel='$x$', yLabel='$y$', xTickStep=0.5,
+        >>>                    yTickStep=0.5, colorMap='hot')
+        """
 
-        [axisObj, limits, origin] = axis.cartesian(ExtensionBaseObj, axisGroup, Xlimits, Ylimits, position, xLabel=xLabel, yLabel=yLabel,
-                                                   xlog10scale=xlog10scale, ylog10scale=ylog10scale, xTicks=xTicks, yTicks=yTicks,
-                                                   xTickStep=xTickStep, yTickStep=yTickStep, xScale=xScale, yScale=yScale, xAxisUnitFactor=xExtraText,
-                                                   yAxisUnitFactor=yExtraText, xGrid=xGrid, yGrid=yGrid, forceTextSize=textSize,
-                                                   forceLineWidth=lineWidthAxis, drawAxis=drawAxis, ExtraLengthAxisX=ExtraLengthAxisX,
-                                                   ExtraLengthAxisY=ExtraLengthAxisY)
+        data = np.asarray(data, dtype=float)
+        if data.ndim != 2 or data.size == 0:
+            sys.stderr.write('Error: data must be a non empty 2D array.')
+            return 0
 
-        # scales data and convert to logarithmic scale if needed. Also subtracts the origin point of the axis to move the plot to the correct position
-        if xlog10scale:
-            xData = [math.log10(x) * xScale - origin[0] for x in xData]
-        else:
-            xData = [x * (xScale / xTickStep) - origin[0] for x in xData]
+        [nRows, nColumns] = data.shape
+        if extent is None:
+            extent = [0.0, float(nColumns), 0.0, float(nRows)]
 
-        if ylog10scale:
-            yData = [-math.log10(y) * yScale - origin[1] for y in yData]
-        else:
-            yData = [-y * (yScale / yTickStep) - origin[1] for y in yData]  # negative bc inkscape is upside down
+        # the axis contains the whole extent
+        Xlimits = [min(extent[0], extent[1]), max(extent[0], extent[1])]
+        Ylimits = [min(extent[2], extent[3]), max(extent[2], extent[3])]
 
-        coords = zip(xData, yData)
+        axisData = drawCartesianAxis(ExtensionBaseObj, parent, Xlimits, Ylimits, position, xLabel, yLabel, False, False, xTicks, yTicks, xTickStep,
+                                     yTickStep, xScale, yScale, xExtraText, yExtraText, xGrid, yGrid, generalAspectFactorAxis, forceXlim, forceYlim,
+                                     drawAxis, ExtraLengthAxisX, ExtraLengthAxisY)
+        if axisData == 0:
+            return 0
+        [axisGroup, limits, origin, xTickStep, yTickStep] = axisData
+
+        # maps the values to the indexes of the lookup table of the color map
+        valid = np.isfinite(data)
+        if valueLimits is None:
+            valueLimits = [float(np.min(data[valid])), float(np.max(data[valid]))] if np.any(valid) else [0.0, 1.0]
+        lut = colorMapLUT(colorMap)
+        span = valueLimits[1] - valueLimits[0]
+        if span == 0:
+            span = 1.0
+        indexes = np.clip(np.round((np.where(valid, data, valueLimits[0]) - valueLimits[0]) / span * (len(lut) - 1)), 0, len(lut) - 1)
+
+        pixels = np.empty((nRows, nColumns, 4), dtype=np.uint8)
+        pixels[:, :, :3] = lut[indexes.astype(np.intp)]
+        pixels[:, :, 3] = np.where(valid, 255, 0)
+
+        # the first row of data is the bottom of the image, but the first row of the png is the top. Extents with inverted limits flip the image
+        pixels = pixels[::-1, :, :]
+        if extent[0] > extent[1]:
+            pixels = pixels[:, ::-1, :]
+        if extent[2] > extent[3]:
+            pixels = pixels[::-1, :, :]
+
+        # corners of the image, scaled like the data and moved to the position of the plot
+        [xCorners, yCorners] = scaleCartesianData(np.array(extent[:2], dtype=float), np.array(extent[2:], dtype=float), False, False, xScale, yScale,
+                                                  xTickStep, yTickStep, origin)
+        xCorners = xCorners + position[0]
+        yCorners = yCorners + position[1]
+
+        imageData = base64.b64encode(pngData(np.ascontiguousarray(pixels))).decode('ascii')
+        Attribs = {inkex.addNS('label', 'inkscape'): 'Image', 'x': str(float(np.min(xCorners))), 'y': str(float(np.min(yCorners))),
+                   'width': str(float(np.ptp(xCorners))), 'height': str(float(np.ptp(yCorners))), 'preserveAspectRatio': 'none',
+                   'style': 'image-rendering:optimizeSpeed', inkex.addNS('href', 'xlink'): 'data:image/png;base64,' + imageData}
+
+        # the image is placed below the axis
+        imageElement = etree.Element(inkex.addNS('image', 'svg'), Attribs)
+        axisGroup.insert(0, imageElement)
 
-        inkDraw.line.absCoords(axisGroup, coords, position, lineStyle=lineStylePlot)
+        return [axisGroup, limits, origin]
+
+    @staticmethod
+    def contour(ExtensionBaseObj, parent, Z, levels=10, extent=None, position=[0, 0], xLabel='', yLabel='', xTicks=True, yTicks=True, xTickStep=1.0,
+                yTickStep=1.0, xScale=20, yScale=20, xExtraText='', yExtraText='', xGrid=False, yGrid=False, generalAspectFactorAxis=1.0,
+                lineStylePlot=inkDraw.lineStyle.setSimpleBlack(), forceXlim=None, forceYlim=None, drawAxis=True, ExtraLengthAxisX=0.0,
+                ExtraLengthAxisY=0.0, fitTolerance=None):
+        """Create a contour plot (isolines) of a 2D array of values, in a cartesian axis
+
+        The isolines are found with marching squares and joined in polylines. Each level is drawn as one path object.
+
+        .. note:: This method uses LaTeX in labels and tick marks if LaTeX support is enabled. This is an optional feature, **enabled by default**. Please refer to :ref:`disableLatexSupport` on how to disable it.
+
+        :param ExtensionBaseObj: Most of the times you have to pass 'self' when calling from inside your plugin class. See example below
+        :param parent: Parent object
+        :param Z: 2D array with the values, sampled in a regular grid. ``Z[i,j]`` is the value at row i and column j. Rows are along the Y axis,
+            with the first row at the bottom, and columns are along the X axis. NaN values are holes in the grid.
+        :param levels: Values of the isolines. It can be a list of values or the number of levels, equally spaced between the minimum and
+            maximum values of Z (not included). Default: 10
+        :param extent: Coordinates of the grid [xMin, xMax, yMin, yMax], that is, the positions of the first and last columns and rows, in the
+            units of the axis. Default: None ([0, nColumns-1, 0, nRows-1])
+        :param position: Position of the plot. It is defined at the point where x and y axis cross [x0,y0]. See :meth:`plot.cartesian`
+        :param xLabel: Label of the X axis. Default: ''
+        :param yLabel: Label of the Y axis. Default: ''
+        :param xTicks: Adds axis ticks to the X axis if True. Default: True
+        :param yTicks: Adds axis ticks to the Y axis if True. Default: True
+        :param xTickStep: Value interval between two consecutive ticks on X axis. Default:1.0
+        :param yTickStep: Value interval between two consecutive ticks on Y axis. Default:1.0
+
+            Use None in ``xTickStep`` or ``yTickStep`` for an automatic step, computed from the limits of the axis. See :meth:`axis.niceTickStep`
+        :param xScale:  Distance between each xTickStep in svg units. Default: 20
+        :param yScale: Distance between each yTickStep in svg units. Default: 20
+        :param xExtraText: Extra text to be added to the ticks in X axis. Default: ''
+        :param yExtraText: Extra text to be added to the ticks in Y axis. Default: ''
+        :param xGrid: Adds grid lines to X axis if True. Default: False
+        :param yGrid: Adds grid lines to Y axis if True. Default: False
+        :param generalAspectFactorAxis: Regulates the general aspect ratio between grid lines, text and Ticks separations. Default: 1.0
+        :param lineStylePlot: Line style of the isolines. It can be a single line style, used by all levels, or a list with one line style per
+            level. See class ``inkscapeMadeEasy_Draw.lineStyle``. Default: lineStylePlot=inkDraw.lineStyle.setSimpleBlack()
+        :param forceXlim: Forces limits of X axis to these limits. Default: None (limits of the grid)
+        :param forceYlim: Forces limits of Y axis to these limits. Default: None (limits of the grid)
+        :param drawAxis: Control flag of the axis method
+
+               - True: draws axis normally
+               - False: returns the limits and origin position without drawing the axis itself
+
+        :param ExtraLengthAxisX: Extra length near the arrow pointer of X axis. Default 0.0
+        :param ExtraLengthAxisY: Extra length near the arrow pointer of Y axis. Default 0.0
+        :param fitTolerance: If not None, the isolines are drawn as smooth bezier paths. See :meth:`plot.cartesian`. Default: None
+
+        :type ExtensionBaseObj: inkscapeMadeEasy object
+        :type parent: inkscape element object
+        :type Z: numpy array or list of lists
+        :type levels: list or int
+        :type extent: list
+        :type position: list
+        :type xLabel: string
+        :type yLabel: string
+        :type xTicks: bool
+        :type yTicks: bool
+        :type xTickStep: float or None
+        :type yTickStep: float or None
+        :type xScale: float
+        :type yScale: float
+        :type xExtraText: string
+        :type yExtraText: string
+        :type xGrid: bool
+        :type yGrid: bool
+        :type generalAspectFactorAxis: float
+        :type lineStylePlot: lineStyle object or list
+        :type forceXlim: list
+        :type forceYlim: list
+        :type drawAxis: bool
+        :type ExtraLengthAxisX: float
+        :type ExtraLengthAxisY: float
+        :type fitTolerance: float
+
+        :returns: [GroupPlot, outputLimits, axisOrigin]. See :meth:`plot.cartesian`
+        :rtype: list
+
+        .. note:: The axes are linear. The path object of each level is labeled with the value of the level.
+
+        **Example**
+
+        >>> root_layer = self.document.getroot()     # retrieves the root layer of the document
+        >>> [x, y] = np.meshgrid(np.linspace(-2, 2, 200), np.linspace(-1, 1, 100))
+        >>> Z = np.exp(-x ** 2 - 3 * y ** 2)
+        >>>
+        >>> inkPlot.plot.contour(self, root_layer, Z, levels=[0.1, 0.3, 0.5, 0.7, 0.9], extent=[-2, 2, -1, 1], position=[0, 0], xLabel='$x$',
+        >>>                      yLabel='$y$', xTickStep=0.5, yTickStep=0.5, fitTolerance=0.05)
+        """
+
+        Z = np.asarray(Z, dtype=float)
+        if Z.ndim != 2 or min(Z.shape) < 2:
+            sys.stderr.write('Error: Z must be a 2D array with at least 2 rows and 2 columns.')
+            return 0
+
+        [nRows, nColumns] = Z.shape
+        if extent is None:
+            extent = [0.0, float(nColumns - 1), 0.0, float(nRows - 1)]
+
+        if isinstance(levels, int):
+            valid = np.isfinite(Z)
+            levels = np.linspace(np.min(Z[valid]), np.max(Z[valid]), levels + 2)[1:-1].tolist() if np.any(valid) else []
+
+        if isinstance(lineStylePlot, dict):
+            lineStylePlot = [lineStylePlot] * len(levels)
+
+        # the axis contains the whole extent
+        Xlimits = [min(extent[0], extent[1]), max(extent[0], extent[1])]
+        Ylimits = [min(extent[2], extent[3]), max(extent[2], extent[3])]
+
+        axisData = drawCartesianAxis(ExtensionBaseObj, parent, Xlimits, Ylimits, position, xLabel, yLabel, False, False, xTicks, yTicks, xTickStep,
+                                     yTickStep, xScale, yScale, xExtraText, yExtraText, xGrid, yGrid, generalAspectFactorAxis, forceXlim, forceYlim,
+                                     drawAxis, ExtraLengthAxisX, ExtraLengthAxisY)
+        if axisData == 0:
+            return 0
+        [axisGroup, limits, origin, xTickStep, yTickStep] = axisData
+
+        for [level, lineStyle] in zip(levels, lineStylePlot):
+            coords = stitchSegments(*marchingSquares(Z, level))
+            if len(coords) == 0:
+                continue
+
+            # columns and rows -> units of the axis
+            xData = extent[0] + coords[:, 0] * (extent[1] - extent[0]) / (nColumns - 1)
+            yData = extent[2] + coords[:, 1] * (extent[3] - extent[2]) / (nRows - 1)
+
+            # scales data and subtracts the origin point of the axis to move the plot to the correct position
+            [xData, yData] = scaleCartesianData(xData, yData, False, False, xScale, yScale, xTickStep, yTickStep, origin)
+
+            drawCartesianData(ExtensionBaseObj, axisGroup, xData, yData, position, limits, origin, False, False, xScale, yScale, xTickStep,
+                              yTickStep, lineStyle, False, None, None, fitTolerance, 'level %g' % level)
+
+        return [axisGroup, limits, origin]
+
+    @staticmethod
+    def bar(ExtensionBaseObj, parent, xData, heights, width=0.8, position=[0, 0], xLabel='', yLabel='', xTicks=True, yTicks=True, xTickStep=1.0,
+            yTickStep=1.0, xScale=20, yScale=20, xExtraText='', yExtraText='', xGrid=False, yGrid=False, generalAspectFactorAxis=1.0,
+            lineStylePlot=inkDraw.lineStyle.set(lineWidth=0.5, fillColor=inkDraw.color.gray(0.7)), forceXlim=None, forceYlim=None, drawAxis=True,
+            ExtraLengthAxisX=0.0, ExtraLengthAxisY=0.0):
+        """Create a cartesian bar plot
+
+        All bars are drawn as a single path object, one rectangle per subpath.
+
+        .. note:: This method uses LaTeX in labels and tick marks if LaTeX support is enabled. This is an optional feature, **enabled by default**. Please refer to :ref:`disableLatexSupport` on how to disable it.
+
+        :param ExtensionBaseObj: Most of the times you have to pass 'self' when calling from inside your plugin class. See example below
+        :param parent: Parent object
+        :param xData: List with the positions of the centers of the bars
+        :param heights: List with the heights of the bars. Bars with NaN heights are not drawn
+        :param width: Width of the bars, in the units of the X axis. It can be a single value or a list with the width of each bar. Default: 0.8
+        :param position: Position of the plot. It is defined at the point where x and y axis cross [x0,y0]. See :meth:`plot.cartesian`
+        :param xLabel: Label of the X axis. Default: ''
+        :param yLabel: Label of the Y axis. Default: ''
+        :param xTicks: Adds axis ticks to the X axis if True. Default: True
+        :param yTicks: Adds axis ticks to the Y axis if True. Default: True
+        :param xTickStep: Value interval between two consecutive ticks on X axis. Default:1.0
+        :param yTickStep: Value interval between two consecutive ticks on Y axis. Default:1.0
+
+            Use None in ``xTickStep`` or ``yTickStep`` for an automatic step, computed from the limits of the axis. See :meth:`axis.niceTickStep`
+        :param xScale:  Distance between each xTickStep in svg units. Default: 20
+        :param yScale: Distance between each yTickStep in svg units. Default: 20
+        :param xExtraText: Extra text to be added to the ticks in X axis. Default: ''
+        :param yExtraText: Extra text to be added to the ticks in Y axis. Default: ''
+        :param xGrid: Adds grid lines to X axis if True. Default: False
+        :param yGrid: Adds grid lines to Y axis if True. Default: False
+        :param generalAspectFactorAxis: Regulates the general aspect ratio between grid lines, text and Ticks separations. Default: 1.0
+        :param lineStylePlot: Line style of the bars. See class ``inkscapeMadeEasy_Draw.lineStyle``. Default: black line, filled with gray
+        :param forceXlim: Forces limits of X axis to these limits. Default: None (limits of the bars)
+        :param forceYlim: Forces limits of Y axis to these limits. Default: None (limits of the bars, including 0)
+        :param drawAxis: Control flag of the axis method
+
+               - True: draws axis normally
+               - False: returns the limits and origin position without drawing the axis itself
+
+        :param ExtraLengthAxisX: Extra length near the arrow pointer of X axis. Default 0.0
+        :param ExtraLengthAxisY: Extra length near the arrow pointer of Y axis. Default 0.0
+
+        :type ExtensionBaseObj: inkscapeMadeEasy object
+        :type parent: inkscape element object
+        :type xData: list
+        :type heights: list
+        :type width: float or list
+        :type position: list
+        :type xLabel: string
+        :type yLabel: string
+        :type xTicks: bool
+        :type yTicks: bool
+        :type xTickStep: float or None
+        :type yTickStep: float or None
+        :type xScale: float
+        :type yScale: float
+        :type xExtraText: string
+        :type yExtraText: string
+        :type xGrid: bool
+        :type yGrid: bool
+        :type generalAspectFactorAxis: float
+        :type lineStylePlot: lineStyle object
+        :type forceXlim: list
+        :type forceYlim: list
+        :type drawAxis: bool
+        :type ExtraLengthAxisX: float
+        :type ExtraLengthAxisY: float
+
+        :returns: [GroupPlot, outputLimits, axisOrigin]. See :meth:`plot.cartesian`
+        :rtype: list
+
+        .. note:: The axes are linear. Bars start at y=0.
+
+        **Example**
+
+        >>> root_layer = self.document.getroot()     # retrieves the root layer of the document
+        >>> lineStyleBars = inkDraw.lineStyle.set(lineWidth=0.3, fillColor=inkDraw.color.defined('blue'))
+        >>>
+        >>> inkPlot.plot.bar(self, root_layer, [1, 2, 3, 4], [3.5, -1.0, 2.0, 4.2], width=0.6, position=[0, 0], yLabel='profit', xTickStep=1,
+        >>>                  yTickStep=1, lineStylePlot=lineStyleBars)
+        """
+
+        xData = np.asarray(xData, dtype=float)
+        heights = np.asarray(heights, dtype=float)
+        width = np.broadcast_to(np.asarray(width, dtype=float), xData.shape)
+
+        valid = np.isfinite(xData) & np.isfinite(heights) & np.isfinite(width)
+        xLeft = xData[valid] - width[valid] / 2.0
+        xRight = xData[valid] + width[valid] / 2.0
+        heights = heights[valid]
+
+        if len(heights) == 0:
+            sys.stderr.write('Error: there is no valid data to plot.')
+            return 0
+
+        # the bars start at y=0
+        Xlimits = [float(min(np.min(xLeft), np.min(xRight))), float(max(np.max(xLeft), np.max(xRight)))]
+        Ylimits = [min(float(np.min(heights)), 0.0), max(float(np.max(heights)), 0.0)]
+
+        axisData = drawCartesianAxis(ExtensionBaseObj, parent, Xlimits, Ylimits, position, xLabel, yLabel, False, False, xTicks, yTicks, xTickStep,
+                                     yTickStep, xScale, yScale, xExtraText, yExtraText, xGrid, yGrid, generalAspectFactorAxis, forceXlim, forceYlim,
+                                     drawAxis, ExtraLengthAxisX, ExtraLengthAxisY)
+        if axisData == 0:
+            return 0
+        [axisGroup, limits, origin, xTickStep, yTickStep] = axisData
+
+        # scales data and subtracts the origin point of the axis to move the plot to the correct position
+        [xLeft, yBase] = scaleCartesianData(xLeft, np.zeros(len(heights)), False, False, xScale, yScale, xTickStep, yTickStep, origin)
+        [xRight, yTop] = scaleCartesianData(xRight, heights, False, False, xScale, yScale, xTickStep, yTickStep, origin)
+
+        # M x1,y0 V y1 H x2 V y0 Z for each bar
+        Attribs = {inkex.addNS('label', 'inkscape'): 'Bars', 'style': str(inkex.Style(lineStylePlot)),
+                   'd': repeatedPathData('MVHVZ', [xLeft + position[0], yBase + position[1], yTop + position[1], xRight + position[0],
+                                                   yBase + position[1]], inkDraw.pathPrecision)}
+        etree.SubElement(axisGroup, inkex.addNS('path', 'svg'), Attribs)
 
         return [axisGroup, limits, origin]
 
+    @staticmethod
+    def histogram(ExtensionBaseObj, parent, data, bins=10, binRange=None, density=False, position=[0, 0], xLabel='', yLabel='', xTicks=True,
+                  yTicks=True, xTickStep=1.0, yTickStep=1.0, xScale=20, yScale=20, xExtraText='', yExtraText='', xGrid=False, yGrid=False,
+                  generalAspectFactorAxis=1.0, lineStylePlot=inkDraw.lineStyle.set(lineWidth=0.5, fillColor=inkDraw.color.gray(0.7)), forceXlim=None,
+                  forceYlim=None, drawAxis=True, ExtraLengthAxisX=0.0, ExtraLengthAxisY=0.0):
+        """Create a histogram of a data set
+
+        The data is binned with ``numpy.histogram`` and the bins are drawn with :meth:`plot.bar`, as a single path object.
+
+        .. note:: This method uses LaTeX in labels and tick marks if LaTeX support is enabled. This is an optional feature, **enabled by default**. Please refer to :ref:`disableLatexSupport` on how to disable it.
+
+        :param ExtensionBaseObj: Most of the times you have to pass 'self' when calling from inside your plugin class. See example below
+        :param parent: Parent object
+        :param data: List or numpy array with the data. NaN values are ignored
+        :param bins: Number of bins, with the same width, or list with the edges of the bins. Default: 10
+        :param binRange: Limits [min, max] of the bins. Data outside this range is ignored. Default: None (minimum and maximum values of data)
+        :param density: If True, the heights of the bars are the probability density, that is, the area of the histogram is 1. Otherwise, the
+            heights are the number of samples in each bin. Default: False
+        :param position: Position of the plot. It is defined at the point where x and y axis cross [x0,y0]. See :meth:`plot.cartesian`
+        :param xLabel: Label of the X axis. Default: ''
+        :param yLabel: Label of the Y axis. Default: ''
+        :param xTicks: Adds axis ticks to the X axis if True. Default: True
+        :param yTicks: Adds axis ticks to the Y axis if True. Default: True
+        :param xTickStep: Value interval between two consecutive ticks on X axis. Default:1.0
+        :param yTickStep: Value interval between two consecutive ticks on Y axis. Default:1.0
+
+            Use None in ``xTickStep`` or ``yTickStep`` for an automatic step, computed from the limits of the axis. See :meth:`axis.niceTickStep`
+        :param xScale:  Distance between each xTickStep in svg units. Default: 20
+        :param yScale: Distance between each yTickStep in svg units. Default: 20
+        :param xExtraText: Extra text to be added to the ticks in X axis. Default: ''
+        :param yExtraText: Extra text to be added to the ticks in Y axis. Default: ''
+        :param xGrid: Adds grid lines to X axis if True. Default: False
+        :param yGrid: Adds grid lines to Y axis if True. Default: False
+        :param generalAspectFactorAxis: Regulates the general aspect ratio between grid lines, text and Ticks separations. Default: 1.0
+        :param lineStylePlot: Line style of the bars. See class ``inkscapeMadeEasy_Draw.lineStyle``. Default: black line, filled with gray
+        :param forceXlim: Forces limits of X axis to these limits. Default: None (limits of the bins)
+        :param forceYlim: Forces limits of Y axis to these limits. Default: None (0 to the largest bin)
+        :param drawAxis: Control flag of the axis method
+
+               - True: draws axis normally
+               - False: returns the limits and origin position without drawing the axis itself
+
+        :param ExtraLengthAxisX: Extra length near the arrow pointer of X axis. Default 0.0
+        :param ExtraLengthAxisY: Extra length near the arrow pointer of Y axis. Default 0.0
+
+        :type ExtensionBaseObj: inkscapeMadeEasy object
+        :type parent: inkscape element object
+        :type data: list
+        :type bins: int or list
+        :type binRange: list
+        :type density: bool
+        :type position: list
+        :type xLabel: string
+        :type yLabel: string
+        :type xTicks: bool
+        :type yTicks: bool
+        :type xTickStep: float or None
+        :type yTickStep: float or None
+        :type xScale: float
+        :type yScale: float
+        :type xExtraText: string
+        :type yExtraText: string
+        :type xGrid: bool
+        :type yGrid: bool
+        :type generalAspectFactorAxis: float
+        :type lineStylePlot: lineStyle object
+        :type forceXlim: list
+        :type forceYlim: list
+        :type drawAxis: bool
+        :type ExtraLengthAxisX: float
+        :type ExtraLengthAxisY: float
+
+        :returns: [GroupPlot, outputLimits, axisOrigin]. See :meth:`plot.cartesian`
+        :rtype: list
+
+        **Example**
+
+        >>> root_layer = self.document.getroot()     # retrieves the root layer of the document
+        >>> data = np.random.randn(1000000)
+        >>>
+        >>> inkPlot.plot.histogram(self, root_layer, data, bins=40, density=True, position=[0, 0], xLabel='$x$', yLabel='$p(x)$', xTickStep=1,
+        >>>                        yTickStep=0.1)
+        """
+
+        data = np.asarray(data, dtype=float).ravel()
+        data = data[np.isfinite(data)]
+
+        if len(data) == 0:
+            sys.stderr.write('Error: there is no valid data to plot.')
+            return 0
+
+        [counts, edges] = np.histogram(data, bins=bins, range=binRange, density=density)
+
+        return plot.bar(ExtensionBaseObj, parent, (edges[:-1] + edges[1:]) / 2.0, counts, np.diff(edges), position, xLabel, yLabel, xTicks, yTicks,
+                        xTickStep, yTickStep, xScale, yScale, xExtraText, yExtraText, xGrid, yGrid, generalAspectFactorAxis, lineStylePlot, forceXlim,
+                        forceYlim, drawAxis, ExtraLengthAxisX, ExtraLengthAxisY)
+
     @staticmethod
     def polar(ExtensionBaseObj, parent, rData, tData, position=[0, 0], rLabel='', rlog10scale=False, rTicks=True, tTicks=True, rTickStep=1.0,
               tTickStep=45.0, rScale=20, rExtraText='', rGrid=False, tGrid=False, generalAspectFactorAxis=1.0,
@@ -1187,7 +3010,8 @@ class plot():
         :param rlog10scale: Sets R axis to log10 scale if True. Default: False
         :param rTicks: Adds axis ticks to the R axis if True. Default: True
         :param tTicks: Adds axis ticks to the Theta axis if True. Default: True
-        :param rTickStep: Value interval between two consecutive ticks on R axis. (Not used if R axis is in log10 scale). Default:1.0
+        :param rTickStep: Value interval between two consecutive ticks on R axis. (Not used if R axis is in log10 scale). Use None for an
+            automatic step, computed from the limits of the axis. See :meth:`axis.niceTickStep`. Default:1.0
         :param tTickStep: Value interval between two consecutive ticks on Theta axis.
         :param rScale:  Distance between each rTickStep in svg units. Default: 20
 
@@ -1232,7 +3056,7 @@ class plot():
         :type rlog10scale: bool
         :type rTicks: bool
         :type tTicks: bool
-        :type rTickStep: float
+        :type rTickStep: float or None
         :type tTickStep: float
         :type rScale: float
         :type rExtraText: string
@@ -1259,6 +3083,8 @@ class plot():
 
         .. note:: If any of the axis are linear, the method will ignore any value greater than 10.000 (in absolute value). This avoids plotting very large numbers. The method will create a text object alongside your plot warning this.
 
+        .. note:: Ignored points and NaN values are gaps in the plot: the line is split in subpaths, all in the same path object.
+
         **Example**
 
         >>> root_layer = self.document.getroot()     # retrieves the root layer of the document
@@ -1298,46 +3124,35 @@ class plot():
         textSize = generalAspectFactorAxis * 0.25 * rScale
         lineWidthAxis = generalAspectFactorAxis * rScale / 35.0
 
-        tDataTemp = []
-        rDataTemp = []
-        flagShowedError = False
-        if rlog10scale:  # remove invalid pairs of coordinates for log plot (less than or equal to 0.0)
-            for i in range(len(rData)):
-                if rData[i] >= 1.0:
-                    tDataTemp.append(tData[i])
-                    rDataTemp.append(rData[i])
-                else:
-                    if not flagShowedError:
-                        inkDraw.text.write(ExtensionBaseObj,
-                                           'Error: The point (%f,%f)\n is invalid in logarithmic scale. Ignoring it...' % (rData[i], tData[i]),
-                                           [position[0], position[1] + 2 * textSize], parent, fontSize=textSize / 2.0)
-                        inkDraw.text.write(ExtensionBaseObj, '       Please check your graph', [position[0], position[1] + 2.5 * textSize], parent,
-                                           fontSize=textSize / 2.0)
-                        flagShowedError = True
-        else:  # remove invalid pairs of coordinates for linear plot (larger than +-10k )
-            for i in range(len(rData)):
-                if abs(rData[i]) <= 1.0e4:
-                    tDataTemp.append(tData[i])
-                    rDataTemp.append(rData[i])
-                else:
-                    if not flagShowedError:
-                        inkDraw.text.write(ExtensionBaseObj, 'Error: The point (%f,%f)\n is too large. Ignoring it...' % (rData[i], tData[i]),
-                                           [position[0], position[1] + 2 * textSize], parent, fontSize=textSize / 2.0)
-                        inkDraw.text.write(ExtensionBaseObj, '       Please check your graph', [position[0], position[1] + 2.5 * textSize], parent,
-                                           fontSize=textSize / 2.0)
-                        flagShowedError = True
+        nPoints = min(len(rData), len(tData))
+        rData = np.asarray(rData, dtype=float)[:nPoints]
+        tData = np.asarray(tData, dtype=float)[:nPoints]
 
-        tData = tDataTemp
-        rData = rDataTemp
+        # invalid pairs of coordinates: less than 1.0 for log plot, larger than +-10k for linear plot. NaN values are gaps in the data
+        if rlog10scale:
+            invalid = [rData < 1.0, 'invalid in logarithmic scale']
+        else:
+            invalid = [np.abs(rData) > 1.0e4, 'too large']
+
+        reportInvalidPoints(ExtensionBaseObj, parent, rData, tData, [invalid], position, textSize)
+
+        # invalid points are replaced by NaN. They split the plot line in subpaths
+        valid = ~(invalid[0] | np.isnan(rData) | np.isnan(tData))
+        rData = np.where(valid, rData, np.nan)
+        tData = np.where(valid, tData, np.nan)
+
+        if not np.any(valid):
+            sys.stderr.write('Error: there is no valid data to plot.')
+            return 0
 
         if forceRlim is not None:
             Rlimits = forceRlim
         else:
-            Rlimits = [min(rData), max(rData)]
+            Rlimits = [float(np.min(rData[valid])), float(np.max(rData[valid]))]
         if forceTlim is not None:
             Tlimits = forceTlim
         else:
-            Tlimits = [min(tData), max(tData)]  # min<->max inverted  bc inkscape is upside down
+            Tlimits = [float(np.min(tData[valid])), float(np.max(tData[valid]))]  # min<->max inverted  bc inkscape is upside down
 
         if Tlimits[0] == Tlimits[1]:
             if Tlimits[0] > 0:
@@ -1355,28 +3170,31 @@ class plot():
             if Rlimits[0] < 0:
                 Rlimits[1] = 0
 
+        # automatic tick step
+        if rTickStep is None:
+            rTickStep = axis.niceTickStep(Rlimits)
+
         # draw axis
         axisGroup = ExtensionBaseObj.createGroup(parent, 'PlotData')
 
-        [axisObj, limits, origin] = axis.polar(ExtensionBaseObj, axisGroup, Rlimits, Tlimits, position, rLabel=rLabel, rlog10scale=rlog10scale,
-                                               rTicks=rTicks, tTicks=tTicks, rTickStep=rTickStep, tTickStep=tTickStep, rScale=rScale,
-                                               rAxisUnitFactor=rExtraText, rGrid=rGrid, tGrid=tGrid, forceTextSize=textSize,
-                                               forceLineWidth=lineWidthAxis, drawAxis=drawAxis, ExtraLengthAxisR=ExtraLengthAxisR)
+        axisData = axis.polar(ExtensionBaseObj, axisGroup, Rlimits, Tlimits, position, rLabel=rLabel, rlog10scale=rlog10scale, rTicks=rTicks,
+                              tTicks=tTicks, rTickStep=rTickStep, tTickStep=tTickStep, rScale=rScale, rAxisUnitFactor=rExtraText, rGrid=rGrid,
+                              tGrid=tGrid, forceTextSize=textSize, forceLineWidth=lineWidthAxis, drawAxis=drawAxis, ExtraLengthAxisR=ExtraLengthAxisR)
+
+        # invalid limits, like the limits of a logarithmic axis extended to 0. The error has already been written
+        if axisData == 0:
+            parent.remove(axisGroup)
+            return 0
+        [axisObj, limits, origin] = axisData
 
         # scales data and convert to logarithmic scale if needed. Also subtracts the origin point of the axis to move the plot to the correct position
-        nPoints = min(len(rData), len(tData))
-        xData = []
-        yData = []
+        theta = np.radians(-tData)  # negative theta bc inkscape is upside down
         if rlog10scale:
-            for i in range(nPoints):
-                xData.append(math.log10(rData[i]) * math.cos(math.radians(-tData[i])) * rScale)  # negative theta bc inkscape is upside down
-                yData.append(math.log10(rData[i]) * math.sin(math.radians(-tData[i])) * rScale)  # negative theta bc inkscape is upside down
+            radius = np.log10(rData) * rScale
         else:
-            for i in range(nPoints):
-                xData.append(rData[i] * math.cos(math.radians(-tData[i])) * (rScale / rTickStep))  # negative theta bc inkscape is upside down
-                yData.append(rData[i] * math.sin(math.radians(-tData[i])) * (rScale / rTickStep))  # negative theta bc inkscape is upside down
+            radius = rData * (rScale / rTickStep)
 
-        coords = zip(xData, yData)
+        coords = np.column_stack((radius * np.cos(theta), radius * np.sin(theta)))
 
         inkDraw.line.absCoords(axisGroup, coords, position, lineStyle=lineStylePlot)
 
@@ -1386,7 +3204,7 @@ class plot():
     def stem(ExtensionBaseObj, parent, xData, yData, position=[0, 0], xLabel='', yLabel='', ylog10scale=False, xTicks=True, yTicks=True,
              xTickStep=1.0, yTickStep=1.0, xScale=20, yScale=20, xExtraText='', yExtraText='', xGrid=False, yGrid=False, generalAspectFactorAxis=1.0,
              lineStylePlot=inkDraw.lineStyle.setSimpleBlack(), forceXlim=None, forceYlim=None, drawAxis=True, ExtraLengthAxisX=0.0,
-             ExtraLengthAxisY=0.0):
+             ExtraLengthAxisY=0.0, singlePath=False):
         """Create a cartesian stem plot
 
         .. note:: This method uses LaTeX in labels and tick marks if LaTeX support is enabled. This is an optional feature, **enabled by default**. Please refer to :ref:`disableLatexSupport` on how to disable it.
@@ -1415,6 +3233,8 @@ class plot():
         :param yTicks: Adds axis ticks to the Y axis if True. Default: True
         :param xTickStep: Value interval between two consecutive ticks on X axis. (Not used if X axis is in log10 scale). Default:1.0
         :param yTickStep: Value interval between two consecutive ticks on Y axis. (Not used if Y axis is in log10 scale). Default:1.0
+
+            Use None in ``xTickStep`` or ``yTickStep`` for an automatic step, computed from the limits of the axis. See :meth:`axis.niceTickStep`
         :param xScale:  Distance between each xTickStep in svg units. Default: 20
 
                - If axis is linear, then xScale is the size in svg units of each tick
@@ -1460,6 +3280,7 @@ class plot():
 
         :param ExtraLengthAxisX: Extra length near the arrow pointer of X axis. Default 0.0
         :param ExtraLengthAxisY: Extra length near the arrow pointer of Y axis. Default 0.0
+        :param singlePath: Draws all stems as a single path object, one subpath per stem, instead of one object per stem. Default: False
 
         :type ExtensionBaseObj: inkscapeMadeEasy object
         :type parent: inkscape element object
@@ -1471,8 +3292,8 @@ class plot():
         :type ylog10scale: bool
         :type xTicks: bool
         :type yTicks: bool
-        :type xTickStep: float
-        :type yTickStep: float
+        :type xTickStep: float or None
+        :type yTickStep: float or None
         :type xScale: float
         :type yScale: float
         :type xExtraText: string
@@ -1486,6 +3307,7 @@ class plot():
         :type drawAxis: bool
         :type ExtraLengthAxisX: float
         :type ExtraLengthAxisY: float
+        :type singlePath: bool
 
         :returns: [GroupPlot, outputLimits, axisOrigin]
 
@@ -1529,66 +3351,36 @@ class plot():
         textSize = generalAspectFactorAxis * 0.25 * min(xScale, yScale)
         lineWidthAxis = generalAspectFactorAxis * min(xScale, yScale) / 35.0
 
-        yDataTemp = []
-        xDataTemp = []
-        flagShowedError = False
+        xData = np.asarray(xData, dtype=float)
+        yData = np.asarray(yData, dtype=float)
 
-        # remove invalid pairs of coordinates for linear plot (larger than +-10k )
-        for i in range(len(xData)):
-            if abs(xData[i]) <= 1.0e4:
-                yDataTemp.append(yData[i])
-                xDataTemp.append(xData[i])
-            else:
-                if not flagShowedError:
-                    inkDraw.text.write(ExtensionBaseObj, 'Error: The point (%f,%f)\n is too large. Ignoring it...' % (xData[i], yData[i]),
-                                       [position[0], position[1] + 2 * textSize], parent, fontSize=textSize / 2.0)
-                    inkDraw.text.write(ExtensionBaseObj, '       Please check your graph', [position[0], position[1] + 2.5 * textSize], parent,
-                                       fontSize=textSize / 2.0)
-                    flagShowedError = True
-
-        yData = yDataTemp
-        xData = xDataTemp
-
-        yDataTemp = []
-        xDataTemp = []
-        flagShowedError = False
-        if ylog10scale:  # remove invalid pairs of coordinates for log plot (less than or equal to 0.0)
-            for i in range(len(yData)):
-                if yData[i] > 0.0:
-                    yDataTemp.append(yData[i])
-                    xDataTemp.append(xData[i])
-                else:
-                    if not flagShowedError:
-                        inkDraw.text.write(ExtensionBaseObj,
-                                           'Error: The point (%f,%f)\n is invalid in logarithmic scale. Ignoring it...' % (xData[i], yData[i]),
-                                           [position[0], position[1] + 2 * textSize], parent, fontSize=textSize / 2.0)
-                        inkDraw.text.write(ExtensionBaseObj, '       Please check your graph', [position[0], position[1] + 2.5 * textSize], parent,
-                                           fontSize=textSize / 2.0)
-                        flagShowedError = True
-        else:  # remove invalid pairs of coordinates for linear plot (larger than +-10k )
-            for i in range(len(yData)):
-                if abs(yData[i]) <= 1.0e4:
-                    yDataTemp.append(yData[i])
-                    xDataTemp.append(xData[i])
-                else:
-                    if not flagShowedError:
-                        inkDraw.text.write(ExtensionBaseObj, 'Error: The point (%f,%f)\n is too large. Ignoring it...' % (xData[i], yData[i]),
-                                           [position[0], position[1] + 2 * textSize], parent, fontSize=textSize / 2.0)
-                        inkDraw.text.write(ExtensionBaseObj, '       Please check your graph', [position[0], position[1] + 2.5 * textSize], parent,
-                                           fontSize=textSize / 2.0)
-                        flagShowedError = True
+        # invalid pairs of coordinates: less than or equal to 0.0 for log plot, larger than +-10k for linear plot
+        invalidLarge = ~(np.abs(xData) <= 1.0e4)
+        if ylog10scale:
+            invalidLog = ~(yData > 0.0)
+        else:
+            invalidLog = np.zeros(len(yData), dtype=bool)
+            invalidLarge |= ~(np.abs(yData) <= 1.0e4)
 
-        yData = yDataTemp
-        xData = xDataTemp
+        reportInvalidPoints(ExtensionBaseObj, parent, xData, yData, [[invalidLog, 'invalid in logarithmic scale'], [invalidLarge & ~invalidLog, 'too large']],
+                            position, textSize)
+
+        valid = ~(invalidLog | invalidLarge)
+        xData = xData[valid]
+        yData = yData[valid]
+
+        if not np.any(valid):
+            sys.stderr.write('Error: there is no valid data to plot.')
+            return 0
 
         if forceXlim:
             Xlimits = forceXlim
         else:
-            Xlimits = [min(xData), max(xData)]
+            Xlimits = [float(np.min(xData)), float(np.max(xData))]
         if forceYlim:
             Ylimits = forceYlim
         else:
-            Ylimits = [min(yData), max(yData)]  # min<->max inverted  bc inkscape is upside down
+            Ylimits = [float(np.min(yData)), float(np.max(yData))]  # min<->max inverted  bc inkscape is upside down
 
         if Ylimits[0] == Ylimits[1]:
             if Ylimits[0] > 0:
@@ -1606,27 +3398,45 @@ class plot():
             if Xlimits[0] < 0:
                 Xlimits[1] = 0
 
+        # automatic tick steps
+        if xTickStep is None:
+            xTickStep = axis.niceTickStep(Xlimits)
+        if yTickStep is None:
+            yTickStep = axis.niceTickStep(Ylimits)
+
         # draw axis
         axisGroup = ExtensionBaseObj.createGroup(parent, 'PlotData')
 
-        [axisObj, limits, origin] = axis.cartesian(ExtensionBaseObj, axisGroup, Xlimits, Ylimits, position, xLabel=xLabel, yLabel=yLabel,
-                                                   xlog10scale=False, ylog10scale=ylog10scale, xTicks=xTicks, yTicks=yTicks, xTickStep=xTickStep,
-                                                   yTickStep=yTickStep, xScale=xScale, yScale=yScale, xAxisUnitFactor=xExtraText,
-                                                   yAxisUnitFactor=yExtraText, xGrid=xGrid, yGrid=yGrid, forceTextSize=textSize,
-                                                   forceLineWidth=lineWidthAxis, drawAxis=drawAxis, ExtraLengthAxisX=ExtraLengthAxisX,
-                                                   ExtraLengthAxisY=ExtraLengthAxisY)
+        axisData = axis.cartesian(ExtensionBaseObj, axisGroup, Xlimits, Ylimits, position, xLabel=xLabel, yLabel=yLabel, xlog10scale=False,
+                                  ylog10scale=ylog10scale, xTicks=xTicks, yTicks=yTicks, xTickStep=xTickStep, yTickStep=yTickStep, xScale=xScale,
+                                  yScale=yScale, xAxisUnitFactor=xExtraText, yAxisUnitFactor=yExtraText, xGrid=xGrid, yGrid=yGrid,
+                                  forceTextSize=textSize, forceLineWidth=lineWidthAxis, drawAxis=drawAxis, ExtraLengthAxisX=ExtraLengthAxisX,
+                                  ExtraLengthAxisY=ExtraLengthAxisY)
+
+        # invalid limits, like the limits of a logarithmic axis extended to 0. The error has already been written
+        if axisData == 0:
+            parent.remove(axisGroup)
+            return 0
+        [axisObj, limits, origin] = axisData
 
         # scales data and convert to logarithmic scale if needed. Also subtracts the origin point of the axis to move the plot to the correct position
-        xData = [x * (xScale / xTickStep) - origin[0] for x in xData]
+        xData = xData * (xScale / xTickStep) - origin[0]
 
         if ylog10scale:
-            yData = [-math.log10(y) * yScale - origin[1] for y in yData]
+            yData = -np.log10(yData) * yScale - origin[1]
         else:
-            yData = [-y * (yScale / yTickStep) - origin[1] for y in yData]  # negative bc inkscape is upside down
+            yData = -yData * (yScale / yTickStep) - origin[1]  # negative bc inkscape is upside down
 
         stemGroup = ExtensionBaseObj.createGroup(axisGroup, 'StemGroup')
 
-        for i in range(len(xData)):
-            inkDraw.line.relCoords(stemGroup, [[0, yData[i]]], [xData[i] + position[0], 0 + position[1]], lineStyle=lineStylePlot)
+        if singlePath:
+            # M x,0 V y for each stem
+            Attribs = {inkex.addNS('label', 'inkscape'): 'Stems', 'style': str(inkex.Style(lineStylePlot)),
+                       'd': repeatedPathData('MV', [xData + position[0], np.full(len(xData), float(position[1])), yData + position[1]],
+                                             inkDraw.pathPrecision)}
+            etree.SubElement(stemGroup, inkex.addNS('path', 'svg'), Attribs)
+        else:
+            for i in range(len(xData)):
+                inkDraw.line.relCoords(stemGroup, [[0, yData[i]]], [xData[i] + position[0], 0 + position[1]], lineStyle=lineStylePlot)
 
         return [axisGroup, limits, origin]
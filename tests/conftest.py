@@ -0,0 +1,49 @@
+# Configuration of the tests of inkscapeMadeEasy
+#
+# The modules are installed in inkscape's extension directory as the package 'inkscapeMadeEasy', and they import each other by this name.
+# Here, the package is mapped to the folder 'latest' of the repository.
+#
+# The tests do not depend on inkscape or LaTeX, but inkex must be available (e.g. install it with pip, or run pytest with inkscape's python).
+# Otherwise the tests are skipped.
+
+import builtins
+import io
+import os
+import sys
+import types
+
+import pytest
+
+# disables LaTeX support, like uncommenting 'useLatex=False' at the beginning of inkscapeMadeEasy_Draw.py. TexText is not needed by the tests
+builtins.useLatex = False
+
+if 'inkscapeMadeEasy' not in sys.modules:
+    package = types.ModuleType('inkscapeMadeEasy')
+    package.__path__ = [os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'latest')]
+    sys.modules['inkscapeMadeEasy'] = package
+
+
+@pytest.fixture
+def drawOptions():
+    """Restore the module options of inkscapeMadeEasy_Draw changed by a test"""
+    inkDraw = pytest.importorskip('inkscapeMadeEasy.inkscapeMadeEasy_Draw')
+    [oldCompactPaths, oldPathPrecision] = [inkDraw.compactPaths, inkDraw.pathPrecision]
+    yield inkDraw
+    [inkDraw.compactPaths, inkDraw.pathPrecision] = [oldCompactPaths, oldPathPrecision]
+
+
+@pytest.fixture
+def extension():
+    """inkscapeMadeEasy object with a blank document, like the one loaded by inkscape before calling the extension"""
+    inkex = pytest.importorskip('inkex')
+    inkBase = pytest.importorskip('inkscapeMadeEasy.inkscapeMadeEasy_Base')
+    extension = inkBase.inkscapeMadeEasy()
+    extension.document = inkex.load_svg(io.BytesIO(extension.blankSVG.strip().encode('utf-8')))
+    extension.svg = extension.document.getroot()
+    return extension
+
+
+@pytest.fixture
+def layer(extension):
+    """current layer of the blank document"""
+    return extension.getcurrentLayer()
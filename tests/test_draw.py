@@ -0,0 +1,474 @@
+# Tests of inkscapeMadeEasy_Draw
+
+import asyncio
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+
+import numpy as np
+import pytest
+from lxml import etree
+
+inkex = pytest.importorskip('inkex')
+inkDraw = pytest.importorskip('inkscapeMadeEasy.inkscapeMadeEasy_Draw')
+
+
+@pytest.mark.parametrize('flagAbsCoords', [True, False])
+def testCubicBezierFirstNode(extension, layer, flagAbsCoords):
+    nodes = []
+    inkDraw.cubicBezier.addNode(nodes, [10, 20], cPbefore=[-1, 0], cPafter=[1, 0], typeNode='corner', flagAbsCoords=True)
+    inkDraw.cubicBezier.addNode(nodes, [5, 3], cPbefore=[-1, 0], cPafter=[1, 0], typeNode='smooth', flagAbsCoords=flagAbsCoords)
+    inkDraw.cubicBezier.addNode(nodes, [5, -3], cPbefore=[-1, 0], cPafter=[1, 0], typeNode='symmetric', flagAbsCoords=flagAbsCoords)
+
+    path = inkDraw.cubicBezier.draw(layer, nodes, offset=[1, 2])
+
+    points = np.asarray(extension.getPoints(path), dtype=float)
+    assert np.allclose(points[0], [11, 22])
+    # one node type per node
+    assert path.get(inkex.addNS('nodetypes', 'sodipodi')) == 'csz'
+
+
+@pytest.mark.parametrize('arcType', ['open', 'chord', 'slice'])
+def testEllipseArcStartEnd(extension, layer, arcType):
+    path = inkDraw.ellipseArc.startEndRadius(layer, [10, 0], [20, 10], radiusX=15, radiusY=20, offset=[25, 5], arcType=arcType)
+
+    # the path starts and ends at the given points, not at the points normalized by the radii
+    points = np.asarray(extension.getPoints(path), dtype=float)
+    assert np.allclose(points[:2], [[35, 5], [45, 15]])
+    assert np.allclose(extension.getPoints(inkDraw.arc.startEndRadius(layer, [0, 0], [4, 0], 3)), [[0, 0], [4, 0]])
+
+
+def parsePathData(extension, pathData):
+    """Return the points of path data, parsed by inkscapeMadeEasy.getPoints()"""
+    path = etree.Element(inkex.addNS('path', 'svg'), {'d': pathData})
+    return np.asarray(extension.getPoints(path), dtype=float).reshape(-1, 2)
+
+
+@pytest.mark.parametrize('compact', [True, False])
+def testPathDataRoundTrip(extension, drawOptions, compact):
+    inkDraw.compactPaths = compact
+    commands = [['M', [10.0, 20.0]], ['L', [15.0, 20.0]], ['L', [15.0, 27.5]], ['L', [-0.25, -1.0e-5]], ['C', [1, 2, 3, 4, 5.125, 6]],
+                ['A', [5.0, 5.0, 0.0, 1, 1, 15.0, 20.0]], ['Z', []], ['M', [100.0, 100.0]], ['L', [101.0, 100.5]], ['Z', []]]
+
+    points = parsePathData(extension, inkDraw.pathData(commands, precision=4))
+
+    expected = [[10, 20], [15, 20], [15, 27.5], [-0.25, 0], [5.125, 6], [15, 20], [100, 100], [101, 100.5]]
+    assert np.allclose(points, expected)
+
+
+def randomPolyline(rng):
+    """Return a random polyline with points of several magnitudes and numbers of decimal places"""
+    return np.round(rng.normal(0.0, rng.choice([0.01, 1.0, 100.0]), (rng.integers(2, 30), 2)), rng.integers(0, 5))
+
+
+@pytest.mark.parametrize('compact', [True, False])
+@pytest.mark.parametrize('closePath', [True, False])
+def testPolylineDataRoundTrip(extension, drawOptions, compact, closePath):
+    inkDraw.compactPaths = compact
+    rng = np.random.default_rng(0)
+    for trial in range(200):
+        coords = randomPolyline(rng)
+
+        pathData = inkDraw.polylineData(coords, offset=[1.5, -2.0], precision=4, closePath=closePath)
+
+        assert np.allclose(parsePathData(extension, pathData), coords + [1.5, -2.0], atol=1.0e-4), pathData
+
+
+@pytest.mark.parametrize('precision', [0, 2, 6])
+def testCompactCoordsFormat(drawOptions, precision):
+    inkDraw.compactPaths = True
+    coords = np.array([[1.0e-5, -1.0e-7], [0.5, -0.5], [100.0, -100.25], [-0.0, 1234567.0], [1.0e16, 3.0], [-0.004, 10.5]])
+
+    string = inkDraw.compactCoords(coords, precision)
+
+    assert 'e' not in string
+    assert '-0' not in string.replace('-0.', '')
+    numbers = [float(n) for n in string.replace('-', ' -').replace(',', ' ').split()]
+    assert np.allclose(numbers, np.round(coords, precision).ravel(), atol=10.0 ** -precision)
+    # same format of formatNumber()
+    assert string.replace(' ', ',').replace('-', ',-').lstrip(',').split(',') == [inkDraw.formatNumber(n, precision) for n in coords.ravel()]
+
+
+def testDefaultPathFormat(extension, layer):
+    # path data of previous versions: fixed decimal places and absolute coordinates
+    assert inkDraw.compactPaths is False
+    path = inkDraw.line.absCoords(layer, [[0, 0], [1.5, -2], [3, 0.25]], offset=[10, 20])
+    assert path.get('d') == 'M 10.000000,20.000000 11.500000,18.000000 13.000000,20.250000'
+
+
+def testCompactNumbers():
+    assert inkDraw.compactNumbers('M1.500000,-0.000000a10.000000 0 1 1 100 -0.250000z') == 'M1.5,0a10 0 1 1 100 -.25z'
+
+
+def testCompactNumbersText():
+    # only numbers are changed
+    assert inkDraw.compactNumbers('<use xlink:href="http://www.w3.org/1999/xlink#a.1" x="2.500" y="-0.000"/>') == \
+        '<use xlink:href="http://www.w3.org/1999/xlink#a.1" x="2.5" y="0"/>'
+
+
+def segmentDistances(points, polyline):
+    """Return the distance of each point to the nearest segment of a polyline"""
+    start = polyline[:-1][None, :, :]
+    chord = (polyline[1:] - polyline[:-1])[None, :, :]
+    vector = points[:, None, :] - start
+    chordLength2 = np.maximum((chord ** 2).sum(axis=2), 1.0e-300)
+    t = np.clip((vector * chord).sum(axis=2) / chordLength2, 0.0, 1.0)
+    return np.hypot(*(vector - t[:, :, None] * chord).transpose(2, 0, 1)).min(axis=1)
+
+
+@pytest.mark.parametrize('tolerance', [0.01, 0.1, 1.0])
+def testSimplifyPolylineTolerance(tolerance):
+    x = np.linspace(0, 10, 500)
+    points = np.column_stack((x, np.sin(x) + 0.02 * np.cos(37 * x)))
+
+    simplified = inkDraw.simplifyPolyline(points, tolerance)
+
+    assert len(simplified) < len(points)
+    assert np.array_equal(simplified[[0, -1]], points[[0, -1]])
+    # kept points are a subsequence of the original points
+    kept = np.flatnonzero((points[:, None, :] == simplified[None, :, :]).all(axis=2).any(axis=1))
+    assert np.array_equal(points[kept], simplified)
+    assert segmentDistances(points, simplified).max() <= tolerance
+
+
+def testSimplifyPolylineCollinear():
+    points = [[0, 0], [1, 1], [2, 2], [3, 3], [3, 2], [3, 1]]
+
+    assert np.array_equal(inkDraw.simplifyPolyline(points, 1.0e-6), [[0, 0], [3, 3], [3, 1]])
+
+
+@pytest.mark.parametrize('compact', [True, False])
+def testPolylineDataRoundTripGaps(extension, drawOptions, compact):
+    inkDraw.compactPaths = compact
+    rng = np.random.default_rng(0)
+    for trial in range(200):
+        coords = randomPolyline(rng)
+        coords[rng.random(len(coords)) < 0.2] = np.nan
+
+        pathData = inkDraw.polylineData(coords, offset=[1.5, -2.0], precision=4)
+
+        # rows with NaN are dropped, splitting the polyline in subpaths
+        expected = coords[~np.isnan(coords).any(axis=1)] + [1.5, -2.0]
+        points = parsePathData(extension, pathData) if pathData else np.zeros((0, 2))
+        assert points.shape == expected.shape, pathData
+        assert np.allclose(points, expected, atol=1.0e-4), pathData
+
+
+def testSimplifyPolylineSubpaths():
+    points = [[0, 0], [1, 0.001], [2, 0], [np.nan, np.nan], [5, 5], [6, 5.001], [7, 5]]
+
+    simplified = inkDraw.simplifyPolyline(points, 0.01)
+
+    assert np.array_equal(simplified, [[0, 0], [2, 0], [np.nan, np.nan], [5, 5], [7, 5]], equal_nan=True)
+
+
+def testValidRanges():
+    coords = np.array([[np.nan, 0], [0, 0], [1, 1], [np.nan, np.nan], [np.nan, 2], [3, 3], [4, np.nan], [5, 5], [6, 6]])
+
+    assert inkDraw.validRanges(coords) == [[1, 3], [5, 6], [7, 9]]
+    assert inkDraw.validRanges(coords[:1]) == []
+    assert inkDraw.validRanges(np.zeros((0, 2))) == []
+    assert inkDraw.validRanges(np.zeros((3, 2))) == [[0, 3]]
+
+
+@pytest.mark.parametrize('compact', [True, False])
+def testPolylineDataRoundTripClosedGaps(extension, drawOptions, compact):
+    inkDraw.compactPaths = compact
+    rng = np.random.default_rng(0)
+    for trial in range(200):
+        coords = randomPolyline(rng)
+        coords[rng.random(len(coords)) < 0.2] = np.nan
+
+        pathData = inkDraw.polylineData(coords, offset=[1.5, -2.0], precision=4, closePath=True)
+
+        expected = coords[~np.isnan(coords).any(axis=1)] + [1.5, -2.0]
+        points = parsePathData(extension, pathData) if pathData else np.zeros((0, 2))
+        assert points.shape == expected.shape, pathData
+        assert np.allclose(points, expected, atol=1.0e-4), pathData
+
+
+def testPolylineDataSubpaths(drawOptions):
+    inkDraw.compactPaths = True
+    coords = [[0, 0], [1, 0], [np.nan, np.nan], [5, 5], [6, 5], [6, 6], [np.nan, 0], [np.nan, 1], [9, 9]]
+
+    assert inkDraw.polylineData(coords).count('M') + inkDraw.polylineData(coords).count('m') == 3
+    # after 'z', subpaths start with an absolute 'M'
+    assert 'zm' not in inkDraw.polylineData(coords, closePath=True)
+
+
+def fakeDvisvgmRender(LaTeXtext, preambleFile, quiet=False):
+    """Output of dvisvgm for the calibration texts of the numeric glyph table: normal glyphs with advance 5, script glyphs with advance 3,
+    raised by 4, starting 2 after the base '10', and an 'F' with height 6.5"""
+    if LaTeXtext == 'F':
+        glyphs = [['F', 'M0 0V-6.5H4V-6H1V-3.5H3V-3H1V0z', 0, 0]]
+    elif LaTeXtext.startswith('$10^{'):
+        glyphs = [[char, 'M0 0h%d' % ord(char), 5 * i, 0] for i, char in enumerate('10')]
+        glyphs += [['s' + char, 'M0 0v%d' % ord(char), 12 + 3 * i, -4] for i, char in enumerate(LaTeXtext[5:-2])]
+    else:
+        glyphs = [[char, 'M0 0h%d' % ord(char), 5 * i, 0] for i, char in enumerate(LaTeXtext[1:-1])]
+
+    paths = {'g%d' % ord(name[-1]) + name[:-1]: d for [name, d, x, y] in glyphs}
+    defs = ''.join(['<path id="%s" d="%s"/>' % (glyph, d) for glyph, d in paths.items()])
+    uses = ''.join(['<use xlink:href="#g%d%s" x="%g" y="%g"/>' % (ord(name[-1]), name[:-1], x, y) for [name, d, x, y] in glyphs])
+    return ('<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink"><defs>%s</defs><g id="page1">%s</g></svg>' %
+            (defs, uses)).encode('utf-8')
+
+
+@pytest.fixture
+def glyphTables(tmp_path, monkeypatch):
+    """Empty glyph tables, cached in a temporary home directory. Returns the preamble file"""
+    monkeypatch.setenv('HOME', str(tmp_path))
+    monkeypatch.setattr(inkDraw, 'numericGlyphTables', {})
+    monkeypatch.setattr(inkDraw.shutil, 'which', lambda command: '/usr/bin/' + command)
+    preambleFile = tmp_path / 'preamble.tex'
+    preambleFile.write_text('\\usepackage{amsmath}\n')
+    return str(preambleFile)
+
+
+@pytest.mark.parametrize('label, matches', [('$-1.25$', True), ('$.5$', True), ('$10^{-3}$', True), ('$10^{2.5}$', True), ('$1.$', False),
+                                            ('$1e3$', False), ('$10^3$', False), ('$x$', False), ('$--1$', False), ('1.5', False)])
+def testNumericLabelPattern(label, matches):
+    assert (inkDraw.numericLabelPattern.match(label) is not None) == matches
+
+
+def testNumericGlyphTable(extension, glyphTables, monkeypatch):
+    monkeypatch.setattr(inkDraw, 'dvisvgmRender', fakeDvisvgmRender)
+    table = inkDraw.numericGlyphTable(extension, glyphTables)
+
+    assert sorted(table['normal']) == sorted('-.0123456789')
+    assert [table['normal']['7']['advance'], table['script']['7']['advance']] == [5, 3]
+    assert table['superscriptOffset'] == [2, -4]
+    assert table['capitalHeight'] == pytest.approx(6.5)
+
+    # the table is read from the cache file, without running LaTeX
+    monkeypatch.setattr(inkDraw, 'dvisvgmRender', None)
+    monkeypatch.setattr(inkDraw, 'numericGlyphTables', {})
+    assert inkDraw.numericGlyphTable(extension, glyphTables) == table
+
+
+@pytest.mark.parametrize('converter', ['textext', 'dvisvgm'])
+def testRenderNumericLabel(extension, glyphTables, monkeypatch, converter):
+    monkeypatch.setattr(inkDraw, 'dvisvgmRender', fakeDvisvgmRender)
+    monkeypatch.setattr(inkDraw, 'latexConverter', converter)
+    table = inkDraw.numericGlyphTable(extension, glyphTables)
+
+    [group, Height0] = inkDraw.renderNumericLabel(extension, '$10^{-3}$', glyphTables)
+    [groupOther, Height0Other] = inkDraw.renderNumericLabel(extension, '$-3$', glyphTables)
+
+    uses = [[use.get('{http://www.w3.org/1999/xlink}href')[1:], float(use.get('x')), float(use.get('y'))] for use in group]
+    assert uses == [[table['normal']['1']['id'], 0, 0], [table['normal']['0']['id'], 5, 0], [table['script']['-']['id'], 12, -4],
+                    [table['script']['3']['id'], 15, -4]]
+    # same scale of the texts of the converter
+    assert Height0 == Height0Other == (table['capitalHeight'] if converter == 'textext' else inkDraw.latexWorker.capitalHeight)
+    # glyphs are defined only once
+    glyphIds = extension.getDefinitions().xpath('./*/@id')
+    assert sorted(glyphIds) == sorted(set(use[0] for use in uses) | {table['normal']['-']['id'], table['normal']['3']['id']})
+
+
+@pytest.mark.parametrize('missingCommand', ['latex', 'dvisvgm', None])
+def testNumericGlyphTableFallback(extension, glyphTables, monkeypatch, capsys, missingCommand):
+    monkeypatch.setattr(inkDraw.shutil, 'which', lambda command: None if command == missingCommand else '/usr/bin/' + command)
+    # LaTeX fails if the commands are found
+    monkeypatch.setattr(inkDraw, 'dvisvgmRender', lambda LaTeXtext, preambleFile, quiet=False: None)
+
+    assert inkDraw.numericGlyphTable(extension, glyphTables) is None
+    assert inkDraw.renderNumericLabel(extension, '$1.5$', glyphTables) is None
+    # the labels are rendered by the LaTeX converter, without messages
+    assert capsys.readouterr().err == ''
+    # the result is kept for the next labels
+    assert list(inkDraw.numericGlyphTables.values()) == [None]
+
+
+# svg produced by dvisvgm for a text with a single glyph
+svgOneGlyph = (b'<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink">'
+               b'<g id="page1"><path d="M0 0h5v-6.5h-5z"/></g></svg>')
+
+
+def testDvisvgmRenderScratchDirectories(tmp_path, monkeypatch, glyphTables):
+    monkeypatch.setattr(inkDraw, 'sessionDir', str(tmp_path / 'session'))
+    os.mkdir(inkDraw.sessionDir)
+    calls = []
+
+    def fakeRun(command, cwd, **kwargs):
+        calls.append([command[0], cwd])
+        if command[0] == 'latex':
+            with open(os.path.join(cwd, 'snippet.tex')) as f:
+                assert f.read().endswith('$x$\n\\end{document}\n')
+            open(os.path.join(cwd, 'snippet.dvi'), 'w').close()
+            return subprocess.CompletedProcess(command, 0)
+        return subprocess.CompletedProcess(command, 0, stdout=svgOneGlyph)
+
+    monkeypatch.setattr(inkDraw.subprocess, 'run', fakeRun)
+    oldTempDir = tempfile.tempdir
+    assert inkDraw.dvisvgmRender('$x$', glyphTables) == svgOneGlyph
+    assert inkDraw.dvisvgmRender('$x$', glyphTables) == svgOneGlyph
+
+    # latex and dvisvgm run in the working directory of each render, inside the scratch directory of the session, removed right after
+    assert [command for [command, cwd] in calls] == ['latex', 'dvisvgm'] * 2
+    assert calls[0][1] == calls[1][1] != calls[2][1] == calls[3][1]
+    assert all(os.path.dirname(cwd) == inkDraw.sessionDir for [command, cwd] in calls)
+    assert os.listdir(inkDraw.sessionDir) == []
+    assert tempfile.tempdir == oldTempDir
+
+
+def testRenderLatexDataLock(extension, glyphTables, monkeypatch):
+    monkeypatch.setattr(inkDraw, 'latexConverter', 'dvisvgm')
+    running = []
+    overlaps = []
+
+    def fakeDvisvgmRender(LaTeXtext, preambleFile):
+        running.append(LaTeXtext)
+        overlaps.append(len(running) > 1)
+        time.sleep(0.01)
+        running.remove(LaTeXtext)
+        return svgOneGlyph
+
+    monkeypatch.setattr(inkDraw, 'dvisvgmRender', fakeDvisvgmRender)
+    threads = [threading.Thread(target=inkDraw.renderLatexData, args=(extension, '$%d$' % i, glyphTables)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    inkDraw.renderLatexData(extension, '$x$', glyphTables)
+    for thread in threads:
+        thread.join()
+
+    # one conversion at a time
+    assert overlaps == [False] * 5
+
+
+def testLatexAsync(extension, layer, glyphTables, monkeypatch):
+    monkeypatch.setattr(inkDraw, 'useLatex', True)
+    rendered = []
+
+    def fakeRenderLatexData(ExtensionBaseObj, LaTeXtext, preambleFile):
+        rendered.append([LaTeXtext, threading.current_thread().name])
+        return svgOneGlyph
+
+    monkeypatch.setattr(inkDraw, 'renderLatexData', fakeRenderLatexData)
+
+    async def drawLabels():
+        futures = [inkDraw.text.latexAsync(extension, layer, '$x_%d$' % i, [20.0 * i, 0.0], preambleFile=glyphTables) for i in range(3)]
+        # placeholders are inserted right away
+        assert [group.get('{http://www.inkscape.org/namespaces/inkscape}label') for group in layer] == ['LaTeX placeholder'] * 3
+        return await asyncio.gather(*futures)
+
+    groups = asyncio.run(drawLabels())
+
+    # the texts are rendered by the executor, in the order of the calls, and replace the placeholders
+    assert [text.strip() for [text, thread] in rendered] == ['$x_0$', '$x_1$', '$x_2$']
+    assert all(thread.startswith('inkscapeMadeEasy_latex') for [text, thread] in rendered)
+    assert list(layer) == groups
+    # aligned at the positions, with the reference point at the center, scaled to the font size
+    for i, group in enumerate(groups):
+        [bboxMin, bboxMax] = extension.getBoundingBox(group)
+        assert np.allclose([(bboxMin[0] + bboxMax[0]) / 2, (bboxMin[1] + bboxMax[1]) / 2], [20.0 * i, 0.0], atol=1e-5)
+        assert bboxMax[1] - bboxMin[1] == pytest.approx(10.0 * 6.5 / inkDraw.latexWorker.capitalHeight)
+
+
+def testLatexAsyncError(extension, layer, glyphTables, monkeypatch):
+    monkeypatch.setattr(inkDraw, 'useLatex', True)
+
+    def fakeRenderLatexData(ExtensionBaseObj, LaTeXtext, preambleFile):
+        raise RuntimeError('LaTeX failed')
+
+    monkeypatch.setattr(inkDraw, 'renderLatexData', fakeRenderLatexData)
+
+    async def drawLabel():
+        return await inkDraw.text.latexAsync(extension, layer, '$x$', [0.0, 0.0], preambleFile=glyphTables)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(drawLabel())
+    # the placeholder is removed
+    assert list(layer) == []
+
+
+class FakeLatexProcess():
+    """LaTeX process of the persistent worker, waiting for the document on its standard input. Writes an empty dvi file when it is sent"""
+
+    def __init__(self, command, cwd, **kwargs):
+        self.jobName = command[2][len('-jobname='):]
+        self.cwd = cwd
+        self.returncode = None
+        self.killed = False
+
+    def poll(self):
+        return self.returncode
+
+    def communicate(self, data=None, timeout=None):
+        if data is not None and not self.killed:
+            open(os.path.join(self.cwd, self.jobName + '.dvi'), 'w').close()
+        self.returncode = -9 if self.killed else 0
+        return [b'', None]
+
+    def kill(self):
+        self.killed = True
+
+
+def testLatexWorkerContextManager(extension, glyphTables, tmp_path, monkeypatch):
+    monkeypatch.setattr(inkDraw, 'useLatex', True)
+    monkeypatch.setattr(inkDraw, 'sessionDir', str(tmp_path / 'session'))
+    os.mkdir(inkDraw.sessionDir)
+    processes = []
+
+    def fakePopen(command, cwd, **kwargs):
+        processes.append(FakeLatexProcess(command, cwd))
+        return processes[-1]
+
+    monkeypatch.setattr(inkDraw.subprocess, 'Popen', fakePopen)
+    monkeypatch.setattr(inkDraw, 'dviToSvg', lambda dviFile, dvisvgmCommand, timeout, quiet: svgOneGlyph)
+
+    with inkDraw.text.startLatexWorker(extension, glyphTables) as worker:
+        assert inkDraw.activeLatexWorker(extension, glyphTables) is worker
+        assert inkDraw.renderLatexData(extension, '$x$', glyphTables) == svgOneGlyph
+        # the next process is already waiting
+        assert [process.poll() for process in processes] == [0, None]
+
+    # the waiting process is killed, the working directory is removed and the worker is no longer used
+    assert worker.closed and processes[-1].killed
+    assert os.listdir(inkDraw.sessionDir) == []
+    assert inkDraw.activeLatexWorker(extension, glyphTables) is None
+
+
+@pytest.mark.skipif(shutil.which('latex') is None or shutil.which('dvisvgm') is None, reason='latex and dvisvgm are not installed')
+def testLatexWorker(extension, layer, tmp_path, monkeypatch):
+    monkeypatch.setenv('HOME', str(tmp_path))
+    monkeypatch.setattr(inkDraw, 'useLatex', True)
+
+    with inkDraw.text.startLatexWorker(extension) as worker:
+        groups = [inkDraw.text.latex(extension, layer, '$x_{%d}$' % i, [20.0 * i, 0.0]) for i in range(2)]
+        assert worker.process.poll() is None
+
+    # glyphs shared by the labels are defined only once
+    glyphIds = extension.getDefinitions().xpath('./*[starts-with(@id, "latexGlyph-")]/@id')
+    hrefs = [{use.get(inkex.addNS('href', 'xlink'))[1:] for use in group.iter(inkex.addNS('use', 'svg'))} for group in groups]
+    assert len(glyphIds) == len(set(glyphIds)) == len(hrefs[0] | hrefs[1])
+    assert hrefs[0] & hrefs[1] and (hrefs[0] | hrefs[1]) <= set(glyphIds)
+    assert worker.closed
+
+
+def dvisvgmOutput(glyphs, uses):
+    """svg produced by dvisvgm --no-fonts: glyphs {id: path data} in <defs> and <use> elements [[id, x, y], ...] in the page group"""
+    defs = ''.join(['<path id="%s" d="%s"/>' % (glyph, d) for glyph, d in glyphs.items()])
+    useElements = ''.join(['<use xlink:href="#%s" x="%g" y="%g"/>' % (glyph, x, y) for [glyph, x, y] in uses])
+    return ('<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink"><title>dvisvgm</title><defs>%s</defs>'
+            '<g id="page1">%s</g></svg>' % (defs, useElements)).encode('utf-8')
+
+
+def testDvisvgmToGroup(extension):
+    # the same glyph 'x' has different ids in the outputs of different labels
+    groupFirst = inkDraw.dvisvgmToGroup(extension, dvisvgmOutput({'g0-120': 'M0 0h5', 'g1-49': 'M0 0v7'}, [['g0-120', 0, 0], ['g1-49', 5, 2]]))
+    groupSecond = inkDraw.dvisvgmToGroup(extension, dvisvgmOutput({'g0-121': 'M0 0h4', 'g0-120x': 'M0 0h5'}, [['g0-120x', 0, 0], ['g0-121', 5, 0]]))
+
+    # glyphs are defined only once, with ids computed from their contents
+    glyphs = {path.get('id'): path.get('d') for path in extension.getDefinitions()}
+    assert sorted(glyphs.values()) == ['M0 0h4', 'M0 0h5', 'M0 0v7']
+    assert all(glyph.startswith('latexGlyph-') for glyph in glyphs)
+
+    for [group, pathData] in [[groupFirst, ['M0 0h5', 'M0 0v7']], [groupSecond, ['M0 0h5', 'M0 0h4']]]:
+        assert [glyphs[use.get(inkex.addNS('href', 'xlink'))[1:]] for use in group.iter(inkex.addNS('use', 'svg'))] == pathData
+        # the title and the ids of the label are removed, avoiding clashes between labels
+        assert group.getparent() is None
+        assert group.xpath('descendant-or-self::*/@id') == []
+        assert not list(group.iter(inkex.addNS('title', 'svg')))
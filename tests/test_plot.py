@@ -0,0 +1,618 @@
+# Tests of inkscapeMadeEasy_Plot
+
+import base64
+import math
+import re
+import struct
+import zlib
+
+import numpy as np
+import pytest
+
+inkPlot = pytest.importorskip('inkscapeMadeEasy.inkscapeMadeEasy_Plot')
+
+
+def testDecimateM4KeepsExtremes():
+    rng = np.random.default_rng(1)
+    x = np.linspace(0, 100, 10001)
+    y = rng.normal(size=len(x))
+
+    [xDecimated, yDecimated] = inkPlot.decimateM4(x, y, columnWidth=1.0)
+
+    assert len(xDecimated) <= 4 * 101
+    assert np.all(np.diff(xDecimated) > 0)
+    column = np.floor(x)
+    for k in np.unique(column):
+        inColumn = column == k
+        keptColumn = np.floor(xDecimated) == k
+        assert yDecimated[keptColumn].min() == y[inColumn].min()
+        assert yDecimated[keptColumn].max() == y[inColumn].max()
+        assert xDecimated[keptColumn][0] == x[inColumn][0]
+        assert xDecimated[keptColumn][-1] == x[inColumn][-1]
+
+
+def testDecimateM4ShortData():
+    [xDecimated, yDecimated] = inkPlot.decimateM4([0, 1, 2], [5, 4, 3], columnWidth=10.0)
+
+    assert np.array_equal(xDecimated, [0, 1, 2])
+    assert np.array_equal(yDecimated, [5, 4, 3])
+
+
+def testDecimateM4Origin():
+    x = np.linspace(0, 10, 101)
+    y = np.sin(x)
+
+    [xWhole, yWhole] = inkPlot.decimateM4(x, y, columnWidth=0.5, xOrigin=0.0)
+    [xFirst, yFirst] = inkPlot.decimateM4(x[:50], y[:50], columnWidth=0.5, xOrigin=0.0)
+    [xSecond, ySecond] = inkPlot.decimateM4(x[50:], y[50:], columnWidth=0.5, xOrigin=0.0)
+
+    # chunks split at the border of a column give the same result
+    assert np.array_equal(np.concatenate((xFirst, xSecond)), xWhole)
+    assert np.array_equal(np.concatenate((yFirst, ySecond)), yWhole)
+
+
+def testDecimateM4Gaps():
+    x = np.arange(20, dtype=float)
+    y = np.arange(20, dtype=float) % 7
+    y[[3, 4, 12]] = np.nan
+    x[15] = np.nan
+
+    [xDecimated, yDecimated] = inkPlot.decimateM4(x, y, columnWidth=10.0)
+
+    # gaps are kept and the samples next to them are not lost
+    gaps = np.isnan(xDecimated) | np.isnan(yDecimated)
+    assert np.count_nonzero(np.diff(gaps.astype(int)) == 1) == 3
+    for k in [2, 5, 11, 13, 14, 16]:
+        assert k in xDecimated
+    # extremes of the valid samples of each column
+    assert np.nanmax(yDecimated[xDecimated < 10]) == 6
+    assert np.nanmin(yDecimated[xDecimated >= 10]) == 0
+
+
+def testClipPolylineCrossing():
+    [x, y] = inkPlot.clipPolyline([-1, 1, 3, 1], [0, 0, 2, 2], xLimits=[0, 2], yLimits=[-1, 1])
+
+    # the segments are cut at the border and the part outside the window is replaced by NaN
+    points = np.column_stack((x, y))
+    valid = points[~np.isnan(points).any(axis=1)]
+    assert np.allclose(valid[0], [0, 0])
+    assert np.allclose(valid[1], [1, 0])
+    assert np.allclose(valid[2], [2, 1])
+    assert np.all((valid[:, 0] >= 0) & (valid[:, 0] <= 2) & (valid[:, 1] >= -1) & (valid[:, 1] <= 1))
+    assert np.isnan(points).any()
+
+
+def testClipPolylineInside():
+    [x, y] = inkPlot.clipPolyline([0, 1, 2], [0, 1, 0], xLimits=[0, 2], yLimits=[0, 1])
+
+    # rows of NaN only separate subpaths
+    valid = ~np.isnan(x)
+    assert np.array_equal(x[valid], [0, 1, 2])
+    assert np.array_equal(y[valid], [0, 1, 0])
+
+
+def testClipPolylineRandom():
+    rng = np.random.default_rng(2)
+    x = rng.uniform(-2, 3, 300)
+    y = rng.uniform(-2, 3, 300)
+    x[[10, 100]] = np.nan
+
+    [xClipped, yClipped] = inkPlot.clipPolyline(x, y, xLimits=[0, 1], yLimits=[0, 1])
+
+    valid = ~(np.isnan(xClipped) | np.isnan(yClipped))
+    tolerance = 1.0e-12
+    assert np.all((xClipped[valid] >= -tolerance) & (xClipped[valid] <= 1 + tolerance))
+    assert np.all((yClipped[valid] >= -tolerance) & (yClipped[valid] <= 1 + tolerance))
+    # points inside the window are kept
+    inside = (x >= 0) & (x <= 1) & (y >= 0) & (y <= 1)
+    for point in np.column_stack((x, y))[inside]:
+        assert np.any(np.hypot(xClipped[valid] - point[0], yClipped[valid] - point[1]) < tolerance)
+
+
+def testClipPolylineSinglePoint():
+    assert [len(array) for array in inkPlot.clipPolyline([0.5], [0.5], [0, 1], [0, 1])] == [1, 1]
+    assert [len(array) for array in inkPlot.clipPolyline([5.0], [0.5], [0, 1], [0, 1])] == [0, 0]
+
+
+def sortedPoints(extension, element):
+    """Return the points of an element, parsed by inkscapeMadeEasy.getPoints(), rounded and sorted"""
+    points = np.round(np.asarray(extension.getPoints(element), dtype=float), 6)
+    return points[np.lexsort(points.T[::-1])]
+
+
+def countPaths(element):
+    return len(element.findall('.//{http://www.w3.org/2000/svg}path'))
+
+
+@pytest.mark.parametrize('xlog10scale', [False, True])
+def testCartesianAxisMergeLines(extension, layer, xlog10scale):
+    [groupSeparate, limitsSeparate, originSeparate] = inkPlot.axis.cartesian(extension, layer, [0.5, 20], [-3, 7], xlog10scale=xlog10scale,
+                                                                             xGrid=True, yGrid=True, mergeLines=False)
+    [groupMerged, limitsMerged, originMerged] = inkPlot.axis.cartesian(extension, layer, [0.5, 20], [-3, 7], xlog10scale=xlog10scale, xGrid=True,
+                                                                       yGrid=True, mergeLines=True)
+
+    # grid lines and ticks are merged in one path per style: fine grid (log10 scale), grid and ticks, plus the 2 axes
+    assert countPaths(groupMerged) == (5 if xlog10scale else 4)
+    assert countPaths(groupSeparate) > countPaths(groupMerged)
+    assert np.array_equal(sortedPoints(extension, groupMerged), sortedPoints(extension, groupSeparate))
+    assert [limitsMerged, originMerged] == [limitsSeparate, originSeparate]
+
+
+@pytest.mark.parametrize('rlog10scale', [False, True])
+def testPolarAxisMergeLines(extension, layer, rlog10scale):
+    rLimits = [1, 1000] if rlog10scale else [0, 5]
+    [groupSeparate, limitsSeparate, originSeparate] = inkPlot.axis.polar(extension, layer, rLimits, [0, 270], rlog10scale=rlog10scale, rGrid=True,
+                                                                         tGrid=True, mergeLines=False)
+    [groupMerged, limitsMerged, originMerged] = inkPlot.axis.polar(extension, layer, rLimits, [0, 270], rlog10scale=rlog10scale, rGrid=True,
+                                                                   tGrid=True, mergeLines=True)
+
+    assert countPaths(groupSeparate) > countPaths(groupMerged)
+    assert np.array_equal(sortedPoints(extension, groupMerged), sortedPoints(extension, groupSeparate))
+    assert [limitsMerged, originMerged] == [limitsSeparate, originSeparate]
+
+
+
+def symbolIds(extension):
+    return [symbol.get('id') for symbol in extension.getDefinitions().findall('{http://www.w3.org/2000/svg}symbol')]
+
+
+def useHrefs(element):
+    return [use.get('{http://www.w3.org/1999/xlink}href') for use in element.iter('{http://www.w3.org/2000/svg}use')]
+
+
+@pytest.mark.parametrize('cache', ['copy', 'symbol'])
+def testCartesianAxisCache(extension, layer, cache):
+    reference = inkPlot.axis.cartesian(extension, layer, [0, 10], [0, 5], position=[30, 40], xGrid=True, cache=False)
+    first = inkPlot.axis.cartesian(extension, layer, [0, 10], [0, 5], position=[0, 0], xGrid=True, cache=cache)
+    second = inkPlot.axis.cartesian(extension, layer, [0, 10], [0, 5], position=[30, 40], xGrid=True, cache=cache)
+    other = inkPlot.axis.cartesian(extension, layer, [0, 10], [0, 6], position=[30, 40], xGrid=True, cache=cache)
+
+    assert second[1:] == reference[1:]
+    if cache == 'copy':
+        assert symbolIds(extension) == []
+        assert np.array_equal(sortedPoints(extension, second[0]), sortedPoints(extension, reference[0]))
+    else:
+        # one symbol per axis template, with unique IDs
+        assert symbolIds(extension) == ['axisTemplate-00001', 'axisTemplate-00002']
+        assert useHrefs(first[0]) == useHrefs(second[0]) == ['#axisTemplate-00001']
+        assert useHrefs(other[0]) == ['#axisTemplate-00002']
+
+
+def testPlotCacheAxesSymbol(extension, layer, monkeypatch):
+    monkeypatch.setattr(inkPlot, 'cacheAxes', 'symbol')
+    for position in [[0, 0], [0, 300]]:
+        [group, limits, origin] = inkPlot.plot.cartesian(extension, layer, [0, 1, 2], [1, 3, 2], position=position)
+        assert useHrefs(group) == ['#axisTemplate-00001']
+    assert symbolIds(extension) == ['axisTemplate-00001']
+
+
+@pytest.mark.parametrize('axisLimits, nTicks, expected', [([0, 13], 5, 5.0), ([-0.2, 0.7], 5, 0.2), ([0, 13], 20, 1.0), ([0, 1], 5, 0.2),
+                                                          ([0, 1.0e-6], 5, 2.0e-7), ([10, -10], 5, 5.0), ([3, 3], 5, 1.0), ([0, np.inf], 5, 1.0)])
+def testNiceTickStep(axisLimits, nTicks, expected):
+    assert inkPlot.axis.niceTickStep(axisLimits, nTicks) == pytest.approx(expected)
+
+
+def testNiceTickStepNumberOfTicks():
+    for span in np.geomspace(1.0e-3, 1.0e6, 200):
+        step = inkPlot.axis.niceTickStep([0, span])
+        assert span / step <= 5 * (1 + 1.0e-9)
+        assert span / step > 2
+        mantissa = step / 10.0 ** np.floor(np.log10(step) + 1.0e-12)
+        assert np.round(mantissa, 9) in [1, 2, 5]
+
+
+def testGenerateListOfTicksLinear():
+    ticks = inkPlot.generateListOfTicksLinear([-0.3, 1.0], 0.0, 0.1)
+
+    # origin, increasing ticks up to the upper limit, then decreasing ticks down to the lower limit, with no accumulated error
+    assert ticks == [0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0, -0.1, -0.2, -0.3]
+
+
+def testGenerateListOfTicksLinearLimits():
+    ticks = inkPlot.generateListOfTicksLinear([0.05, 0.95], 0.05, 0.3)
+
+    assert ticks[0] == 0.05
+    assert ticks[-1] == 0.95
+    assert ticks == pytest.approx([0.05, 0.35, 0.65, 0.95])
+
+
+def isolines(Z, level):
+    """Return the polylines of the isoline of a level, as a list of numpy arrays"""
+    coords = inkPlot.stitchSegments(*inkPlot.marchingSquares(np.asarray(Z, dtype=float), level))
+    boundaries = np.concatenate(([-1], np.flatnonzero(np.isnan(coords[:, 0])), [len(coords)]))
+    return [coords[start + 1:end] for start, end in zip(boundaries[:-1], boundaries[1:])]
+
+
+def testContourCircle():
+    # the grid does not cross the circle exactly at its nodes, where adjacent edges would give repeated points
+    [x, y] = np.meshgrid(np.linspace(-2, 2, 40), np.linspace(-2, 2, 40))
+    Z = np.hypot(x, y)
+
+    polylines = isolines(Z, 1.0)
+
+    # a single closed polyline, ending at its first point, with all points on the circle (x and y in units of columns and rows)
+    assert len(polylines) == 1
+    polyline = polylines[0]
+    assert np.array_equal(polyline[0], polyline[-1])
+    radius = np.hypot(polyline[:, 0] * 4 / 39 - 2, polyline[:, 1] * 4 / 39 - 2)
+    assert np.allclose(radius, 1.0, atol=0.01)
+    assert len(np.unique(polyline[:-1], axis=0)) == len(polyline) - 1
+
+
+def testContourOpenPolylines():
+    Z = np.tile(np.arange(5, dtype=float), (4, 1))
+    Z[0, 0] = np.nan
+
+    polylines = isolines(Z, 1.5)
+
+    # a vertical line, from the bottom to the top of the grid
+    assert len(polylines) == 1
+    assert np.allclose(polylines[0][:, 0], 1.5)
+    assert sorted(polylines[0][:, 1].tolist()) == [0, 1, 2, 3]
+
+
+def testContourSaddle():
+    Z = [[1, 0], [0, 1]]
+
+    for level in [0.25, 0.75]:
+        polylines = isolines(Z, level)
+        # saddle cells give two separate segments
+        assert len(polylines) == 2
+        assert all(len(polyline) == 2 for polyline in polylines)
+
+
+def testContourEmpty():
+    assert inkPlot.stitchSegments(*inkPlot.marchingSquares(np.zeros((3, 3)), 1.0)).shape == (0, 2)
+
+
+def testContourPlot(extension, layer):
+    [x, y] = np.meshgrid(np.linspace(-2, 2, 40), np.linspace(-2, 2, 40))
+    [group, limits, origin] = inkPlot.plot.contour(extension, layer, np.hypot(x, y), levels=[0.5, 1.0, 5.0], extent=[-2, 2, -2, 2],
+                                                   position=[0, 0])
+
+    # one path per level crossing the grid, with the points on the circles, centered at the position of the plot
+    paths = dataPaths(group)
+    assert [label(path) for path in paths] == ['level 0.5', 'level 1']
+    for radius, path in zip([0.5, 1.0], paths):
+        points = np.array(extension.getPoints(path))
+        assert np.allclose(np.hypot(points[:, 0], points[:, 1]), radius * 20, rtol=0.03)
+
+
+def testAdaptiveSamplingTolerance():
+    [x, y] = inkPlot.adaptiveSampling(np.sin, [0, 10], xUnit=10.0, yUnit=10.0, xlog10scale=False, ylog10scale=False, tolerance=0.01)
+
+    assert np.all(np.diff(x) > 0)
+    assert [x[0], x[-1]] == [0, 10]
+    assert np.array_equal(y, np.sin(x))
+    # the polyline is within the tolerance of the function, in svg units
+    xFine = np.linspace(0, 10, 100001)
+    assert np.max(np.abs(np.interp(xFine, x, y) - np.sin(xFine))) * 10.0 < 0.02
+
+
+def testAdaptiveSamplingLog10():
+    [x, y] = inkPlot.adaptiveSampling(lambda x: x - 1, [0.1, 10], xUnit=10.0, yUnit=10.0, xlog10scale=True, ylog10scale=True, tolerance=0.01)
+
+    assert np.all(np.isnan(y[x <= 1]))
+    assert np.all(y[x > 1] > 0)
+
+
+def testAdaptiveSamplingScalarFunction():
+    [x, y] = inkPlot.adaptiveSampling(math.sqrt, [-1, 1], xUnit=10.0, yUnit=10.0, xlog10scale=False, ylog10scale=False, tolerance=0.01)
+
+    # points where math.sqrt raises ValueError are NaN, and the border of the gap is located
+    assert np.all(np.isnan(y[x < 0]))
+    assert np.allclose(y[x >= 0], np.sqrt(x[x >= 0]))
+    assert np.min(x[x >= 0]) < 1.0e-3
+
+
+@pytest.mark.parametrize('forceXlim', [None, [0, 20]])
+def testCartesianStreamAutomaticTickStep(extension, layer, forceXlim):
+    x = np.linspace(0, 13, 5000)
+    data = np.column_stack((x, 40 * np.sin(x)))
+    xTickStep = inkPlot.axis.niceTickStep(forceXlim or [0, 13])
+    yTickStep = inkPlot.axis.niceTickStep([-40, 40])
+
+    [groupAutomatic, limitsAutomatic, originAutomatic] = inkPlot.plot.cartesianStream(extension, layer, data, chunkSize=700, xTickStep=None,
+                                                                                      yTickStep=None, forceXlim=forceXlim)
+    [groupFixed, limitsFixed, originFixed] = inkPlot.plot.cartesianStream(extension, layer, data, chunkSize=700, xTickStep=xTickStep,
+                                                                          yTickStep=yTickStep, forceXlim=forceXlim)
+
+    # same plot of numeric steps given by niceTickStep()
+    assert np.allclose(limitsAutomatic, limitsFixed)
+    assert np.allclose(originAutomatic, originFixed)
+    assert np.array_equal(sortedPoints(extension, groupAutomatic), sortedPoints(extension, groupFixed))
+
+
+def testCartesianStreamAutomaticTickStepIterator(extension, layer):
+    data = np.column_stack((np.arange(10.0), np.arange(10.0) ** 2))
+
+    # iterators are kept in memory to find the limits of the data
+    [groupIterator, limitsIterator, originIterator] = inkPlot.plot.cartesianStream(extension, layer, iter([data[:4], data[4:8], data[8:]]), xTickStep=None,
+                                                                                   yTickStep=None)
+    [groupArray, limitsArray, originArray] = inkPlot.plot.cartesianStream(extension, layer, data, chunkSize=4, xTickStep=None, yTickStep=None)
+
+    assert [limitsIterator, originIterator] == [limitsArray, originArray]
+    assert np.array_equal(sortedPoints(extension, groupIterator), sortedPoints(extension, groupArray))
+
+
+@pytest.mark.parametrize('decimate', [None, 0])
+def testCartesianStreamRaw(extension, layer, decimate):
+    x = np.linspace(0, 10, 1000)
+    data = np.column_stack((x, np.sin(x)))
+
+    [group, limits, origin] = inkPlot.plot.cartesianStream(extension, layer, data, chunkSize=300, decimate=decimate)
+    [groupCartesian, limitsCartesian, originCartesian] = inkPlot.plot.cartesian(extension, layer, x, np.sin(x))
+
+    # one path per chunk, starting at the last point of the previous chunk. All points are drawn
+    paths = dataPaths(group)
+    assert len(paths) == 4
+    points = [np.array(extension.getPoints(path)) for path in paths]
+    assert [len(chunkPoints) for chunkPoints in points] == [300, 301, 301, 101]
+    assert all(np.array_equal(previous[-1], chunkPoints[0]) for previous, chunkPoints in zip(points[:-1], points[1:]))
+    assert [limits, origin] == [limitsCartesian, originCartesian]
+    assert np.array_equal(np.concatenate([points[0]] + [chunkPoints[1:] for chunkPoints in points[1:]]),
+                          extension.getPoints(dataPaths(groupCartesian)[0]))
+
+
+def testCartesianStreamDecimate(extension, layer):
+    x = np.linspace(0, 10, 100000)
+    y = np.random.default_rng(4).normal(size=len(x))
+    y[12345] = 5.0
+
+    [group, limits, origin] = inkPlot.plot.cartesianStream(extension, layer, np.column_stack((x, y)), chunkSize=30000, decimate=1.0, yTickStep=None)
+
+    # each chunk is decimated and drawn as it is read, keeping the extremes of the data
+    paths = dataPaths(group)
+    assert len(paths) == 4
+    points = np.concatenate([extension.getPoints(path) for path in paths])
+    assert len(points) < 4 * 2 * 200 + 8
+    yTickStep = inkPlot.axis.niceTickStep([y.min(), 5.0])
+    assert np.isclose(points[:, 1].min(), -5.0 * 20 / yTickStep - origin[1], atol=1e-3)
+
+
+def testCartesianStreamIteratorForcedLimits(extension, layer):
+    chunks = iter([np.array([[0.0, 1.0], [0.5, 1.5], [1.0, 2.0e5]]), np.array([[2.0, 1.0], [3.0, 2.0]])])
+
+    # a single pass: invalid points are counted while the chunks are drawn
+    [group, limits, origin] = inkPlot.plot.cartesianStream(extension, layer, chunks, forceXlim=[0, 3], forceYlim=[0, 2])
+
+    assert len(dataPaths(group)) == 2
+    messages = [''.join(text.itertext()) for text in layer.iter('{http://www.w3.org/2000/svg}text')]
+    assert any('(1.000000,200000.000000)' in message and 'too large' in message for message in messages)
+
+
+def scatterMarkerCenters(extension, group):
+    """Return the centers of the markers of plot.scatter: the positions of the <use> elements or the centers of the circles of the single path"""
+    useElements = list(group.iter('{http://www.w3.org/2000/svg}use'))
+    if useElements:
+        return np.array([[float(use.get('x')), float(use.get('y'))] for use in useElements])
+    [markers] = [path for path in group.iter('{http://www.w3.org/2000/svg}path')
+                 if path.get('{http://www.inkscape.org/namespaces/inkscape}label') == 'Markers']
+    # each circle is a subpath with the start point and the end points of two arcs, at opposite sides of the circle
+    points = np.asarray(extension.getPoints(markers), dtype=float).reshape(-1, 3, 2)
+    return (points[:, 0, :] + points[:, 1, :]) / 2
+
+
+@pytest.mark.parametrize('compactPaths', [False, True])
+@pytest.mark.parametrize('singlePath', [False, True])
+def testScatter(extension, layer, drawOptions, singlePath, compactPaths):
+    drawOptions.compactPaths = compactPaths
+    xData = [0.5, 1, 2.25, np.nan, 4]
+    yData = [1, -2, 3, 5, 0.125]
+    [group, limits, origin] = inkPlot.plot.scatter(extension, layer, xData, yData, position=[10, 20], xScale=20, yScale=10, forceXlim=[0, 5],
+                                                   forceYlim=[-5, 5], singlePath=singlePath)
+
+    # NaN is not drawn
+    expected = np.array([[10 + 20 * x - origin[0], 20 - 10 * y - origin[1]] for [x, y] in zip(xData, yData) if not np.isnan(x + y)])
+    centers = scatterMarkerCenters(extension, group)
+    assert centers.shape == expected.shape
+    assert np.allclose(centers, expected, atol=1e-5)
+    assert symbolIds(extension) == ([] if singlePath else ['scatterMarker-00001'])
+
+
+def testScatterSymbolIds(extension, layer):
+    first = inkPlot.plot.scatter(extension, layer, [1, 2], [1, 2])
+    second = inkPlot.plot.scatter(extension, layer, [1, 2], [1, 2], position=[0, 200])
+    assert symbolIds(extension) == ['scatterMarker-00001', 'scatterMarker-00002']
+    assert useHrefs(first[0]) == ['#scatterMarker-00001'] * 2
+    assert useHrefs(second[0]) == ['#scatterMarker-00002'] * 2
+
+
+def dataPaths(group):
+    """Return the paths of the data of a plot, drawn in the plot group. The lines of the axis are in a sub group"""
+    return group.findall('{http://www.w3.org/2000/svg}path')
+
+
+def label(element):
+    return element.get('{http://www.inkscape.org/namespaces/inkscape}label')
+
+
+@pytest.mark.parametrize('method, xData, yData, options', [('cartesian', [1, 2], [np.nan, np.nan], {}),
+                                                           ('cartesian', [-1, -2], [1, 2], {'xlog10scale': True}),
+                                                           ('polar', [np.nan, 2], [0, np.nan], {}), ('stem', [1, 2], [2.0e4, 3.0e4], {})])
+def testNoValidData(extension, layer, capsys, method, xData, yData, options):
+    assert getattr(inkPlot.plot, method)(extension, layer, xData, yData, **options) == 0
+    assert 'there is no valid data to plot' in capsys.readouterr().err
+
+
+def testInvalidAxisLimits(extension, layer, capsys):
+    # constant data in logarithmic scale: the limits are extended to 0, invalid in logarithmic scale
+    assert inkPlot.plot.cartesian(extension, layer, [1, 2, 3], [1, 1, 1], ylog10scale=True) == 0
+    assert 'yLim is invalid in logarithmic scale' in capsys.readouterr().err
+    assert len(layer) == 0
+
+
+def testCartesianSimplifySvgUnits(extension, layer, monkeypatch):
+    monkeypatch.setattr(extension, 'getDocumentScaleFactor', lambda: 2.0)
+    x = np.linspace(0, 10, 500)
+
+    [group, limits, origin] = inkPlot.plot.cartesian(extension, layer, x, np.sin(x), simplify=0.5)
+    [groupAll, limitsAll, originAll] = inkPlot.plot.cartesian(extension, layer, x, np.sin(x))
+
+    # the tolerance is in svg units, like fitTolerance, whatever the scale of the document
+    points = extension.getPoints(dataPaths(groupAll)[0])
+    assert np.allclose(extension.getPoints(dataPaths(group)[0]), inkPlot.inkDraw.simplifyPolyline(points, 0.5))
+
+
+def testCartesianDecimateSvgUnits(extension, layer, monkeypatch):
+    monkeypatch.setattr(extension, 'getDocumentScaleFactor', lambda: 2.0)
+    x = np.linspace(0, 10, 5000)
+    y = np.random.default_rng(5).normal(size=len(x))
+
+    [group, limits, origin] = inkPlot.plot.cartesian(extension, layer, x, y, yTickStep=None, decimate=2.0)
+    [groupAll, limitsAll, originAll] = inkPlot.plot.cartesian(extension, layer, x, y, yTickStep=None)
+
+    # columns of 2 svg units, whatever the scale of the document
+    points = np.array(extension.getPoints(dataPaths(groupAll)[0]))
+    assert np.allclose(extension.getPoints(dataPaths(group)[0]), np.column_stack(inkPlot.decimateM4(points[:, 0], points[:, 1], 2.0)))
+
+
+def testCartesianMulti(extension, layer):
+    xSine = np.linspace(0, 6, 61)
+    xLine = np.array([-2.0, 1.0, 4.0])
+    series = [[xSine, 2 * np.sin(xSine)], [xLine, 3 + xLine, {'stroke': '#ff0000'}, 'line'], [[1, 2, 3], [0, 1, 0], None, None]]
+    lineStylePlot = {'stroke': '#0000ff', 'fill': 'none'}
+    [group, limits, origin] = inkPlot.plot.cartesianMulti(extension, layer, series, lineStylePlot=lineStylePlot)
+
+    # the axis contains all series
+    yMin = float(np.min(2 * np.sin(xSine)))
+    assert [limits[0][0], limits[1][0], limits[2][0], limits[3][0]] == [-2, 6, yMin, 7]
+    paths = dataPaths(group)
+    assert [label(path) for path in paths] == ['series 1', 'line', 'series 3']
+    assert ['stroke:#0000ff' in paths[0].get('style'), 'stroke:#ff0000' in paths[1].get('style'), 'stroke:#0000ff' in paths[2].get('style')] == \
+        [True] * 3
+
+    # same lines of plot.cartesian with the same axis
+    for [xData, yData, *style], path in zip(series, paths):
+        [groupSingle, limitsSingle, originSingle] = inkPlot.plot.cartesian(extension, layer, xData, yData, forceXlim=[-2, 6], forceYlim=[yMin, 7])
+        assert [limitsSingle, originSingle] == [limits, origin]
+        assert np.allclose(extension.getPoints(path), extension.getPoints(dataPaths(groupSingle)[0]))
+
+
+def testCartesianMultiInvalid(extension, layer, capsys):
+    series = [[[1, 2], [np.nan, np.nan]], [[-1, -2], [1, 2]]]
+    assert inkPlot.plot.cartesianMulti(extension, layer, series, xlog10scale=True) == 0
+    assert 'there is no valid data to plot' in capsys.readouterr().err
+
+
+def testColorMapLUT():
+    lut = inkPlot.colorMapLUT('gray')
+
+    assert lut.shape == (256, 3) and lut.dtype == np.uint8
+    assert np.array_equal(lut[:, 0], np.arange(256))
+    assert np.array_equal(lut[:, 0], lut[:, 2])
+
+    # colors as strings, interpolated between the given colors
+    lut = inkPlot.colorMapLUT(['#ff0000', [0, 0, 255], '#00FF00'], nColors=5)
+    assert lut.tolist() == [[255, 0, 0], [128, 0, 128], [0, 0, 255], [0, 128, 128], [0, 255, 0]]
+
+
+def decodePNG(data):
+    """Decode a PNG written by pngData(): 8 bit RGBA without filters. Returns an array with shape (nRows, nColumns, 4)"""
+    assert data[:8] == b'\x89PNG\r\n\x1a\n'
+    chunks = {}
+    position = 8
+    while position < len(data):
+        [length, chunkType] = struct.unpack('>I4s', data[position:position + 8])
+        chunkData = data[position + 8:position + 8 + length]
+        assert struct.unpack('>I', data[position + 8 + length:position + 12 + length])[0] == zlib.crc32(chunkType + chunkData)
+        chunks[chunkType] = chunkData
+        position += 12 + length
+
+    assert list(chunks) == [b'IHDR', b'IDAT', b'IEND']
+    [nColumns, nRows, bitDepth, colorType, compression, filterMethod, interlace] = struct.unpack('>IIBBBBB', chunks[b'IHDR'])
+    assert [bitDepth, colorType, compression, filterMethod, interlace] == [8, 6, 0, 0, 0]
+    rows = np.frombuffer(zlib.decompress(chunks[b'IDAT']), dtype=np.uint8).reshape(nRows, 1 + nColumns * 4)
+    assert np.all(rows[:, 0] == 0)
+    return rows[:, 1:].reshape(nRows, nColumns, 4)
+
+
+def testPngData():
+    pixels = np.random.default_rng(2).integers(0, 256, size=(7, 5, 4), dtype=np.uint8)
+
+    assert np.array_equal(decodePNG(inkPlot.pngData(pixels)), pixels)
+
+
+def imageElement(group):
+    [image] = group.iter('{http://www.w3.org/2000/svg}image')
+    href = image.get('{http://www.w3.org/1999/xlink}href')
+    assert href.startswith('data:image/png;base64,')
+    pixels = decodePNG(base64.b64decode(href[len('data:image/png;base64,'):]))
+    return [image, pixels]
+
+
+def testImage(extension, layer):
+    data = np.arange(12, dtype=float).reshape(3, 4)
+    data[0, 0] = np.nan
+    [group, limits, origin] = inkPlot.plot.image(extension, layer, data, position=[10, 50], colorMap='gray')
+
+    [image, pixels] = imageElement(group)
+    assert [limits[0][0], limits[1][0], limits[2][0], limits[3][0]] == [0, 4, 0, 3]
+
+    # each cell is one pixel, with the first row of data at the bottom of the image
+    assert pixels.shape == (3, 4, 4)
+    assert np.array_equal(pixels[::-1, :, 3] == 0, np.isnan(data))
+    valid = np.isfinite(data)
+    expected = np.round((data[valid] - 1) / 10 * 255)
+    assert np.array_equal(pixels[::-1, :, 0][valid], expected)
+
+    # the image covers the axis, 20 svg units per cell
+    assert [float(image.get(attrib)) for attrib in ['x', 'y', 'width', 'height']] == [10, 50 - 60, 80, 60]
+
+
+def testImageExtentValueLimits(extension, layer):
+    data = [[1, 2], [3, 0]]
+    [group, limits, origin] = inkPlot.plot.image(extension, layer, data, extent=[2, 0, 0, 2], colorMap='gray', valueLimits=[1, 2])
+
+    [image, pixels] = imageElement(group)
+
+    # inverted x limits flip the image horizontally. Values outside valueLimits are saturated
+    assert pixels[:, :, 0].tolist() == [[0, 255], [255, 0]]
+    assert [limits[0][0], limits[1][0]] == [0, 2]
+
+
+def barRectangles(group):
+    """Return the rectangles of the path of a bar plot as an array with rows [xLeft, yBase, yTop, xRight, yBase]"""
+    [path] = dataPaths(group)
+    assert label(path) == 'Bars'
+    pathData = path.get('d')
+    assert re.fullmatch(r'(M[^MZz]+V[^MZz]+H[^MZz]+V[^MZz]+[Zz]\s*)+', pathData.replace(' M', 'M'))
+    return np.array(re.findall(r'-?(?:\d+\.?\d*|\.\d+)', pathData), dtype=float).reshape(-1, 5)
+
+
+@pytest.mark.parametrize('compactPaths', [False, True])
+def testBar(extension, layer, monkeypatch, compactPaths):
+    monkeypatch.setattr(inkPlot.inkDraw, 'compactPaths', compactPaths)
+    heights = np.array([3.5, -1.0, np.nan, 2.0])
+    [group, limits, origin] = inkPlot.plot.bar(extension, layer, [1, 2, 3, 4], heights, width=[0.5, 0.5, 0.5, 1.0], position=[10, 50])
+
+    # bars with NaN are not drawn and the axis contains y=0
+    assert [limits[0][0], limits[1][0], limits[2][0], limits[3][0]] == [0.75, 4.5, -1, 3.5]
+    rectangles = barRectangles(group)
+    assert len(rectangles) == 3
+    assert np.allclose(rectangles[:, 3] - rectangles[:, 0], [10, 10, 20])
+    assert np.allclose(rectangles[:, 1] - rectangles[:, 2], [70, -20, 40])
+    assert np.allclose(rectangles[:, [1, 4]], rectangles[0, 1])
+    assert np.allclose(np.diff((rectangles[:, 0] + rectangles[:, 3]) / 2), [20, 40])
+
+
+def testBarInvalid(extension, layer, capsys):
+    assert inkPlot.plot.bar(extension, layer, [1, 2], [np.nan, np.nan]) == 0
+    assert 'there is no valid data to plot' in capsys.readouterr().err
+
+
+@pytest.mark.parametrize('density', [False, True])
+def testHistogram(extension, layer, density):
+    data = np.random.default_rng(3).normal(size=1000)
+    data[:5] = np.nan
+    [group, limits, origin] = inkPlot.plot.histogram(extension, layer, data, bins=8, binRange=[-2, 2], density=density, yTickStep=None)
+
+    [counts, edges] = np.histogram(data[5:], bins=8, range=[-2, 2], density=density)
+    assert [limits[0][0], limits[1][0], limits[2][0], limits[3][0]] == [-2, 2, 0, np.max(counts)]
+
+    # adjacent bins, with heights proportional to the counts
+    rectangles = barRectangles(group)
+    assert len(rectangles) == 8
+    assert np.allclose(rectangles[1:, 0], rectangles[:-1, 3])
+    heights = rectangles[:, 1] - rectangles[:, 2]
+    assert np.allclose(heights / heights.max(), counts / counts.max(), atol=1e-3)